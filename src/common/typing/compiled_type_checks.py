@@ -0,0 +1,120 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from typeguard import check_type
+
+# typeguard treats these builtin types as implicitly accepting their "smaller" numeric/binary counterparts
+_IMPLICITLY_ACCEPTED_TYPES = {
+    float: (int, float),
+    complex: (int, float, complex),
+    bytes: (bytearray, bytes, memoryview),
+}
+
+
+@lru_cache(maxsize=None)
+def compile_type_predicate(field_type: Any) -> Callable[[Any], bool]:
+    """
+    Compiles a type annotation (e.g. List[Checksum] or Optional[Union[str, SpdxNoAssertion, SpdxNone]]) once into a
+    plain Python predicate that returns whether a value conforms to the annotation. The result is cached per
+    annotation, so all fields sharing an annotation share one predicate.
+    Annotations that cannot be expressed as simple isinstance() checks fall back to typeguard's check_type.
+    Note that, unlike typeguard, the predicates do not accept unittest.mock.Mock instances in place of arbitrary types.
+    """
+    namespace: Dict[str, Any] = {}
+    expression = _compile_expression(field_type, "value", namespace, 0)
+    source = f"def predicate(value):\n    return {expression}\n"
+    exec(source, namespace)
+    return namespace["predicate"]
+
+
+def _compile_expression(field_type: Any, variable: str, namespace: Dict[str, Any], depth: int) -> str:
+    if field_type is Any or field_type is object:
+        return "True"
+    if field_type is None or field_type is type(None):
+        return f"{variable} is None"
+
+    origin = getattr(field_type, "__origin__", None)
+    args = getattr(field_type, "__args__", None) or ()
+    if origin is Union:
+        return _compile_union(args, variable, namespace, depth)
+    if origin in (list, List):
+        return _compile_homogeneous_collection(list, args, variable, namespace, depth)
+    if origin in (tuple, Tuple):
+        return _compile_tuple(args, variable, namespace, depth)
+    if origin in (dict, Dict):
+        return _compile_dict(args, variable, namespace, depth)
+    if origin is None and isinstance(field_type, type):
+        accepted_types = _IMPLICITLY_ACCEPTED_TYPES.get(field_type, field_type)
+        return f"isinstance({variable}, {_register(namespace, accepted_types)})"
+
+    return f"{_register(namespace, _fallback_predicate(field_type))}({variable})"
+
+
+def _compile_union(args: Tuple, variable: str, namespace: Dict[str, Any], depth: int) -> str:
+    plain_types = []
+    expressions = []
+    for arg in args:
+        if arg is type(None):
+            expressions.append(f"{variable} is None")
+        elif getattr(arg, "__origin__", None) is None and isinstance(arg, type):
+            accepted_types = _IMPLICITLY_ACCEPTED_TYPES.get(arg, (arg,))
+            plain_types.extend(accepted_type for accepted_type in accepted_types if accepted_type not in plain_types)
+        else:
+            expressions.append(_compile_expression(arg, variable, namespace, depth))
+    if plain_types:
+        expressions.insert(0, f"isinstance({variable}, {_register(namespace, tuple(plain_types))})")
+
+    return "(" + " or ".join(expressions) + ")" if expressions else "False"
+
+
+def _compile_homogeneous_collection(
+    collection_type: type, args: Tuple, variable: str, namespace: Dict[str, Any], depth: int
+) -> str:
+    type_check = f"isinstance({variable}, {_register(namespace, collection_type)})"
+    if not args or args[0] is Any:
+        return type_check
+    item = f"item{depth}"
+    item_check = _compile_expression(args[0], item, namespace, depth + 1)
+
+    return f"({type_check} and all({item_check} for {item} in {variable}))"
+
+
+def _compile_tuple(args: Tuple, variable: str, namespace: Dict[str, Any], depth: int) -> str:
+    type_check = f"isinstance({variable}, tuple)"
+    if not args or args == ((),):
+        return type_check if not args else f"({type_check} and not {variable})"
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _compile_homogeneous_collection(tuple, args[:1], variable, namespace, depth)
+    element_checks = [
+        _compile_expression(arg, f"{variable}[{index}]", namespace, depth) for index, arg in enumerate(args)
+    ]
+
+    return f"({type_check} and len({variable}) == {len(args)} and " + " and ".join(element_checks) + ")"
+
+
+def _compile_dict(args: Tuple, variable: str, namespace: Dict[str, Any], depth: int) -> str:
+    type_check = f"isinstance({variable}, dict)"
+    if not args:
+        return type_check
+    key, value = f"key{depth}", f"value{depth}"
+    key_check = _compile_expression(args[0], key, namespace, depth + 1)
+    value_check = _compile_expression(args[1], value, namespace, depth + 1)
+
+    return f"({type_check} and all({key_check} and {value_check} for {key}, {value} in {variable}.items()))"
+
+
+def _register(namespace: Dict[str, Any], obj: Any) -> str:
+    name = f"_t{len(namespace)}"
+    namespace[name] = obj
+    return name
+
+
+def _fallback_predicate(field_type: Any) -> Callable[[Any], bool]:
+    def predicate(value) -> bool:
+        try:
+            check_type("value", value, field_type)
+        except TypeError:
+            return False
+        return True
+
+    return predicate
@@ -1,56 +1,322 @@
+import inspect
+from collections.abc import MutableSequence
+from contextlib import contextmanager
 from dataclasses import dataclass
+from enum import Enum, auto
+from operator import attrgetter
+from typing import Any, Optional, Union
+from weakref import WeakKeyDictionary, WeakSet
 
-from typeguard import typechecked
+from typeguard import check_type
 
+from common.typing.compiled_type_checks import compile_type_predicate
 
-def dataclass_with_properties(cls):
+
+class TypeCheckingPolicy(Enum):
+    """
+    Determines which accesses to the properties generated by @dataclass_with_properties are type-checked at runtime.
+    FULL: getters and setters are type-checked (default).
+    SETTERS_ONLY: setters (and therefore constructors) are type-checked, getters are plain attribute reads. As every
+    value has been checked when it was set, this only skips the re-check of values that are already known to be valid.
+    CONSTRUCTION_ONLY: only the values passed to the constructor are type-checked, getters and setters are plain
+    attribute accesses.
+    OFF: no runtime type checks at all. Intended for pipelines whose input has already been validated; the types can
+    still be checked on demand with check_types_recursively().
+    """
+
+    FULL = auto()
+    SETTERS_ONLY = auto()
+    CONSTRUCTION_ONLY = auto()
+    OFF = auto()
+
+
+_type_checking_policy: TypeCheckingPolicy = TypeCheckingPolicy.FULL
+_type_checking_policy_overrides = WeakKeyDictionary()
+_classes_with_properties = WeakSet()
+
+
+def dataclass_with_properties(cls=None, *, hashable: bool = False):
     """Decorator to generate a dataclass with properties out of the class' value:type list.
-    Their getters and setters will be subjected to the @typechecked decorator to ensure type conformity."""
-    data_cls = dataclass(cls)
+    Their getters and setters check the values against the field's annotation to ensure type conformity, according to
+    the current TypeCheckingPolicy. The checks are compiled once per annotation into plain Python predicates; typeguard
+    is only consulted to describe a violation. The values themselves are stored in slots.
+    Equality compares the stored values directly. Only value-like classes, e.g. Relationship or Checksum, are made
+    hashable with @dataclass_with_properties(hashable=True) (see make_equality_and_hash); like dataclass(eq=True),
+    all others are unhashable."""
+    if cls is None:
+        return lambda cls_to_decorate: dataclass_with_properties(cls_to_decorate, hashable=hashable)
+    data_cls = dataclass(with_slots(cls))
+    set_properties(data_cls, get_type_checking_policy(data_cls))
+    data_cls._from_trusted = make_trusted_constructor(data_cls)
+    data_cls.__eq__, identity_key, data_cls.__hash__ = make_equality_and_hash(data_cls, hashable)
+    if identity_key:
+        data_cls._identity_key = identity_key
+    data_cls._restore, data_cls.__reduce__ = make_pickling(data_cls)
+    _classes_with_properties.add(data_cls)
+
+    return data_cls
+
+
+def with_slots(cls):
+    """
+    Recreates the class with __slots__ for the private backing fields of its properties, so that instances do not
+    carry a per-instance __dict__. This considerably reduces the memory footprint of documents with many elements.
+    """
+    if "__slots__" in cls.__dict__:
+        return cls
+    namespace = dict(cls.__dict__)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(f"_{field_name}" for field_name in cls.__dict__.get("__annotations__", {}))
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def set_properties(data_cls, policy: TypeCheckingPolicy):
+    """
+    Generates the properties of the class according to the policy. The setters used by check_types_and_set_values()
+    during construction are stored in the class' _constructor_setters.
+    """
+    constructor_setters = {}
     for field_name, field_type in data_cls.__annotations__.items():
-        set_field = make_setter(field_name, field_type)
-        get_field = make_getter(field_name, field_type)
+        if policy in (TypeCheckingPolicy.FULL, TypeCheckingPolicy.SETTERS_ONLY):
+            set_field = make_setter(field_name, field_type)
+        else:
+            set_field = make_unchecked_setter(data_cls, field_name)
+        if policy == TypeCheckingPolicy.FULL:
+            get_field = make_getter(field_name, field_type)
+        else:
+            get_field = attrgetter(f"_{field_name}")
 
         setattr(data_cls, field_name, property(get_field, set_field))
+        if policy == TypeCheckingPolicy.CONSTRUCTION_ONLY:
+            constructor_setters[field_name] = make_setter(field_name, field_type)
+        else:
+            constructor_setters[field_name] = set_field
+    data_cls._constructor_setters = constructor_setters
+
+
+def get_type_checking_policy(data_cls=None) -> TypeCheckingPolicy:
+    """Returns the TypeCheckingPolicy in effect for the given class, or the process-wide one if no class is given."""
+    if data_cls is not None and data_cls in _type_checking_policy_overrides:
+        return _type_checking_policy_overrides[data_cls]
+    return _type_checking_policy
+
+
+def set_type_checking_policy(policy: Optional[TypeCheckingPolicy], data_cls=None):
+    """
+    Sets the process-wide TypeCheckingPolicy and regenerates the properties of all classes decorated with
+    @dataclass_with_properties accordingly. Existing instances are affected as well, since properties live on the
+    class.
+    If a class is given, the policy only applies to this class and takes precedence over the process-wide policy.
+    Passing None as policy removes such an override again.
+    """
+    global _type_checking_policy
+    if data_cls is None:
+        _type_checking_policy = policy
+        affected_classes = [cls for cls in _classes_with_properties if cls not in _type_checking_policy_overrides]
+    else:
+        if policy is None:
+            _type_checking_policy_overrides.pop(data_cls, None)
+        else:
+            _type_checking_policy_overrides[data_cls] = policy
+        affected_classes = [data_cls]
+
+    for affected_class in affected_classes:
+        set_properties(affected_class, get_type_checking_policy(affected_class))
+
+
+@contextmanager
+def type_checking_policy(policy: TypeCheckingPolicy, data_cls=None):
+    """
+    Context manager that applies the policy (process-wide or, if a class is given, to this class only) and restores
+    the previous state on exit:
+        with type_checking_policy(TypeCheckingPolicy.OFF):
+            document = parse_file(file_name)
+    """
+    if data_cls is None:
+        previous_policy = _type_checking_policy
+    else:
+        previous_policy = _type_checking_policy_overrides.get(data_cls)
+    set_type_checking_policy(policy, data_cls)
+    try:
+        yield
+    finally:
+        set_type_checking_policy(previous_policy, data_cls)
 
-    return data_cls
+
+def make_trusted_constructor(data_cls):
+    """
+    Generates a _from_trusted classmethod with the same signature as the class' __init__. It is intended for callers
+    like the parsers that have already converted their input: instead of the typeguard-checked setters, every value
+    is validated by a single predicate compiled from its annotation, and the private fields are assigned directly.
+    If any value does not conform, construction falls back to the regular constructor, so the caller receives the
+    usual ConstructorTypeErrors.
+    Like the handwritten constructors, list fields that default to None are initialized with an empty list.
+    """
+    init_parameters = inspect.signature(data_cls.__init__).parameters
+    namespace = {"new_instance": object.__new__}
+    signature = []
+    for parameter in list(init_parameters.values())[1:]:
+        if parameter.default is inspect.Parameter.empty:
+            signature.append(parameter.name)
+        else:
+            namespace[f"default_{parameter.name}"] = parameter.default
+            signature.append(f"{parameter.name}=default_{parameter.name}")
+
+    normalizations = []
+    checks = []
+    assignments = []
+    for field_name, field_type in data_cls.__annotations__.items():
+        value = field_name if field_name in init_parameters else "None"
+        parameter = init_parameters.get(field_name)
+        if parameter is not None and parameter.default is None and getattr(field_type, "__origin__", None) is list:
+            normalizations.append(f"    if {field_name} is None:\n        {field_name} = []\n")
+        namespace[f"check_{field_name}"] = compile_type_predicate(field_type)
+        checks.append(f"check_{field_name}({value})")
+        assignments.append(f"        instance._{field_name} = {value}\n")
+
+    arguments = ", ".join(parameter for parameter in list(init_parameters)[1:])
+    source = (
+        f"def __init__(cls, {', '.join(signature)}):\n"
+        + "".join(normalizations)
+        + f"    if {' and '.join(checks) or 'True'}:\n"
+        + "        instance = new_instance(cls)\n"
+        + "".join(assignments)
+        + "        return instance\n"
+        + f"    return cls({arguments})\n"
+    )
+    exec(source, namespace)
+    trusted_constructor = namespace["__init__"]
+    # keep error messages for missing arguments identical to the ones of the regular constructor
+    trusted_constructor.__qualname__ = f"{data_cls.__qualname__}.__init__"
+
+    return classmethod(trusted_constructor)
+
+
+def make_equality_and_hash(data_cls, hashable: bool):
+    """
+    Generates __eq__ and, if hashable, _identity_key and __hash__ for the class (None otherwise). Instead of reading
+    every field through its property as the dataclass-generated __eq__ does, they work on the stored values directly.
+    The identity key is the tuple of all values, with lists converted to tuples, so that elements can be used in sets
+    and as dictionary keys.
+    As with dataclass(unsafe_hash=True), the hash reflects the current values: an element must not be modified while
+    it is contained in a set or used as a dictionary key.
+    """
+    namespace = {"as_hashable": _as_hashable}
+    key_values = []
+    for field_name, field_type in data_cls.__annotations__.items():
+        if _may_contain_list(field_type):
+            key_values.append(f"as_hashable(self._{field_name})")
+        else:
+            key_values.append(f"self._{field_name}")
+    own_values = ", ".join(f"self._{field_name}" for field_name in data_cls.__annotations__)
+    other_values = ", ".join(f"other._{field_name}" for field_name in data_cls.__annotations__)
+    source = (
+        "def __eq__(self, other):\n"
+        + "    if other.__class__ is not self.__class__:\n"
+        + "        return NotImplemented\n"
+        + f"    return ({own_values},) == ({other_values},)\n"
+        + "def _identity_key(self):\n"
+        + f"    return ({', '.join(key_values)},)\n"
+        + "def __hash__(self):\n"
+        + "    return hash(self._identity_key())\n"
+    )
+    exec(source, namespace)
+    for function_name in ["__eq__", "_identity_key", "__hash__"]:
+        namespace[function_name].__qualname__ = f"{data_cls.__qualname__}.{function_name}"
+
+    if not hashable:
+        return namespace["__eq__"], None, None
+    return namespace["__eq__"], namespace["_identity_key"], namespace["__hash__"]
+
+
+def make_pickling(data_cls):
+    """
+    Generates a __reduce__ that pickles an instance as its stored values and a _restore staticmethod that assigns them
+    to a new instance without running the constructor or any type check (the values have been checked when they were
+    set). Compared to the default pickling of objects with __slots__, this produces smaller pickles that are faster
+    to write and read, e.g. when parsed elements are sent back from the worker processes of a parallel parse.
+    """
+    field_names = [f"_{field_name}" for field_name in data_cls.__annotations__]
+    namespace = {"new_instance": object.__new__, "cls": data_cls}
+    source = (
+        f"def _restore({', '.join(field_names)}):\n"
+        + "    instance = new_instance(cls)\n"
+        + "".join(f"    instance.{field_name} = {field_name}\n" for field_name in field_names)
+        + "    return instance\n"
+        + "def __reduce__(self):\n"
+        + f"    return restore, ({''.join(f'self.{field_name}, ' for field_name in field_names)})\n"
+    )
+    exec(source, namespace)
+    restore = namespace["_restore"]
+    # pickle references the function by its qualified name, i.e. as an attribute of the class
+    restore.__module__ = data_cls.__module__
+    restore.__qualname__ = f"{data_cls.__qualname__}._restore"
+    namespace["restore"] = restore
+    namespace["__reduce__"].__qualname__ = f"{data_cls.__qualname__}.__reduce__"
+
+    return staticmethod(restore), namespace["__reduce__"]
+
+
+def _may_contain_list(field_type: Any) -> bool:
+    origin = getattr(field_type, "__origin__", None)
+    if origin is list:
+        return True
+    if origin is Union:
+        return any(_may_contain_list(arg) for arg in field_type.__args__)
+    return isinstance(field_type, type) and issubclass(field_type, MutableSequence)
+
+
+def _as_hashable(value: Any) -> Any:
+    if isinstance(value, (list, MutableSequence)):
+        return tuple(value)
+    return value
 
 
 def make_setter(field_name, field_type):
     """helper method to avoid late binding when generating functions in a for loop"""
+    is_valid = compile_type_predicate(field_type)
+    private_name = f"_{field_name}"
 
-    @typechecked
     def set_field(self, value: field_type):
-        setattr(self, f"_{field_name}", value)
+        if not is_valid(value):
+            # The compiled predicate only tells us that the value does not conform. typeguard provides the detailed
+            # error message (and, as before, accepts mock objects in place of any type).
+            try:
+                check_type(f'argument "{field_name}"', value, field_type)
+            except TypeError as err:
+                raise TypeError(f"SetterError {self.__class__.__name__}: {err.args[0]}: {value}")
+        setattr(self, private_name, value)
 
-    def set_field_with_better_error_message(self, value: field_type):
-        try:
-            set_field(self, value)
-        except TypeError as err:
-            error_message: str = f"SetterError {self.__class__.__name__}: {err.args[0]}"
-            # As setters are created dynamically, their argument name is always "value". We replace it by the
-            # actual name so the error message is more helpful.
-            raise TypeError(error_message.replace("value", field_name, 1) + f": {value}")
+    return set_field
 
-    return set_field_with_better_error_message
+
+def make_unchecked_setter(data_cls, field_name):
+    """helper method to avoid late binding when generating functions in a for loop"""
+    private_name = f"_{field_name}"
+    slot = data_cls.__dict__.get(private_name)
+    if slot is not None:
+        return slot.__set__
+
+    def set_field(self, value):
+        setattr(self, private_name, value)
+
+    return set_field
 
 
 def make_getter(field_name, field_type):
     """helper method to avoid late binding when generating functions in a for loop"""
+    is_valid = compile_type_predicate(field_type)
+    private_name = f"_{field_name}"
 
-    @typechecked
     def get_field(self) -> field_type:
-        return getattr(self, f"_{field_name}")
-
-    def get_field_with_better_error_message(self) -> field_type:
-        try:
-            return get_field(self)
-        except TypeError as err:
-            error_message: str = f"GetterError {self.__class__.__name__}: {err.args[0]}"
-            # As getters are created dynamically, their argument name is always "the return value".
-            # We replace it by the actual name so the error message is more helpful.
-            raise TypeError(
-                error_message.replace("the return value", field_name, 1) + f': {getattr(self, f"_{field_name}")}'
-            )
-
-    return get_field_with_better_error_message
+        value = getattr(self, private_name)
+        if not is_valid(value):
+            try:
+                check_type(field_name, value, field_type)
+            except TypeError as err:
+                raise TypeError(f"GetterError {self.__class__.__name__}: {err.args[0]}: {value}")
+        return value
+
+    return get_field
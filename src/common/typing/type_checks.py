@@ -1,5 +1,10 @@
-from typing import Any, Dict
+from collections.abc import MutableSequence
+from dataclasses import is_dataclass
+from typing import Any, Dict, List
 
+from typeguard import check_type
+
+from common.typing.compiled_type_checks import compile_type_predicate
 from common.typing.constructor_type_errors import ConstructorTypeErrors
 
 
@@ -7,19 +12,48 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
     """
     Helper method to accumulate all type errors encountered during a constructor call and return them in a
     ConstructorTypeErrors instance.
-    Background: Our setters are enhanced with runtime typechecks using typeguard. However, this means that by
+    Background: Our setters are enhanced with runtime typechecks (depending on the TypeCheckingPolicy, constructors
+    may use checked setters even if the properties are unchecked). However, this means that by
     default, a TypeError is raised on the first type violation that is encountered. We consider it more helpful to
     return all type violations in one go.
     As an aside, defining constructors "manually" using this utility method helps avoid a nasty PyCharm bug:
     https://youtrack.jetbrains.com/issue/PY-34569
     """
     errors = []
-    for key, value_type in instance_under_construction.__annotations__.items():
+    for key, set_value in instance_under_construction._constructor_setters.items():
         value = local_variables.get(key)
         try:
-            setattr(instance_under_construction, key, value)
+            set_value(instance_under_construction, value)
         except TypeError as err:
             error_message: str = err.args[0]
             errors.append(error_message)
     if errors:
         raise ConstructorTypeErrors(errors)
+
+
+def check_types_recursively(instance: Any, path: str) -> List[str]:
+    """
+    Checks the values of all fields of a @dataclass_with_properties instance against their annotations and descends
+    into all such instances it contains, also in lists and list-like containers. Returns one message per violation,
+    e.g. 'type of document.files[3].spdx_id must be str; got int instead'.
+    This is independent of the current TypeCheckingPolicy and intended to be run on demand when runtime checks are
+    (partially) turned off.
+    """
+    errors = []
+    for field_name, field_type in instance.__annotations__.items():
+        value = getattr(instance, f"_{field_name}", None)
+        field_path = f"{path}.{field_name}"
+        if not compile_type_predicate(field_type)(value):
+            try:
+                check_type(field_path, value, field_type)
+            except TypeError as err:
+                errors.append(err.args[0])
+                continue
+        if isinstance(value, MutableSequence):
+            for index, element in enumerate(value):
+                if is_dataclass(element):
+                    errors.extend(check_types_recursively(element, f"{field_path}[{index}]"))
+        elif is_dataclass(value):
+            errors.extend(check_types_recursively(value, field_path))
+
+    return errors
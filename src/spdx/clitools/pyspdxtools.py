@@ -51,14 +51,21 @@ from spdx.writer.write_anything import write_file
     "The generated graph is saved to the file specified with --outfile. "
     "Note: You need to install the optional dependencies 'networkx' and 'pygraphviz' for this feature.",
 )
-def main(infile: str, outfile: str, version: str, novalidation: bool, graph: bool):
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop parsing once this many errors have been found instead of reporting all errors of the document.",
+)
+@click.option("--fail-fast", is_flag=True, default=False, help="Stop parsing at the first error.")
+def main(infile: str, outfile: str, version: str, novalidation: bool, graph: bool, max_errors: int, fail_fast: bool):
     """
     CLI-tool for validating SPDX documents and converting between RDF, TAG-VALUE, JSON, YAML and XML formats.
     Formats are determined by the file endings.
     To use, run: 'pyspdxtools --infile <input file name> --outfile <output file name>'
     """
     try:
-        document: Document = parse_file(infile)
+        document: Document = parse_file(infile, max_errors=max_errors, fail_fast=fail_fast)
 
         if not novalidation:
             if not version:
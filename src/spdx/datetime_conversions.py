@@ -2,12 +2,39 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from datetime import datetime
+from functools import lru_cache
+
+# Documents tend to repeat the same few dates (e.g. the annotation dates of a review), so the most recently converted
+# values are cached. datetime objects are immutable, so sharing them is safe.
+DATETIME_CACHE_SIZE = 1024
 
 
 def datetime_from_str(date_str: str) -> datetime:
     if not isinstance(date_str, str):
         raise TypeError(f"Could not convert str to datetime, invalid type: {type(date_str).__name__}")
 
+    return _datetime_from_str(date_str)
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _datetime_from_str(date_str: str) -> datetime:
+    # Strings in the exact YYYY-MM-DDTHH:MM:SSZ format are converted by datetime.fromisoformat(), which is much faster
+    # than strptime(). Everything else goes through strptime(), which also produces the error message.
+    if (
+        len(date_str) == 20
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[10] == "T"
+        and date_str[13] == ":"
+        and date_str[16] == ":"
+        and date_str[19] == "Z"
+        and date_str.isascii()
+    ):
+        try:
+            return datetime.fromisoformat(date_str[:19])
+        except ValueError:
+            pass
+
     date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")  # raises ValueError if format does not match
     return date
 
@@ -16,4 +43,12 @@ def datetime_to_iso_string(date: datetime) -> str:
     """
     Return an ISO-8601 representation of a datetime object.
     """
+    if type(date) is not datetime or date.tzinfo is not None:
+        # aware datetimes in different time zones can compare equal, so they are not cached
+        return date.isoformat() + "Z"
+    return _datetime_to_iso_string(date)
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _datetime_to_iso_string(date: datetime) -> str:
     return date.isoformat() + "Z"
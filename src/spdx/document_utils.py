@@ -3,14 +3,16 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Dict, List, Union
 
+from common.typing.type_checks import check_types_recursively
 from spdx.model.document import Document
 from spdx.model.file import File
+from spdx.model.file_table import get_file_spdx_ids
 from spdx.model.package import Package
 from spdx.model.snippet import Snippet
 
 
 def get_contained_spdx_element_ids(document: Document) -> List[str]:
-    element_ids = [file.spdx_id for file in document.files]
+    element_ids = get_file_spdx_ids(document.files)
     element_ids.extend([package.spdx_id for package in document.packages])
     element_ids.extend([snippet.spdx_id for snippet in document.snippets])
     return element_ids
@@ -29,3 +31,11 @@ def get_contained_spdx_elements(document: Document) -> Dict[str, Union[Package,
     contained_spdx_elements.update({snippet.spdx_id: snippet for snippet in document.snippets})
 
     return contained_spdx_elements
+
+
+def check_document_types(document: Document) -> List[str]:
+    """
+    Checks the types of all values in the document, including all contained elements, and returns a message for each
+    violation. Use this when the runtime type checks of the model have been reduced via the TypeCheckingPolicy.
+    """
+    return check_types_recursively(document, "document")
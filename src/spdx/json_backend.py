@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Match, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+INDENT_PLACEHOLDER = b"\x00"
+COMPACT_SEPARATORS = (",", ":")
+# the bytes that json.dumps(ensure_ascii=True) escapes besides control characters: DEL and UTF-8 multibyte sequences
+NON_ASCII_BYTES = re.compile(b"[\\x7f-\\xff]+")
+
+
+class JsonBackend:
+    """
+    Reads and writes JSON with the standard library's json module. Subclasses use faster third-party libraries if
+    these are installed, see get_json_backend(). All backends accept str and bytes input and produce the same output
+    as json.dumps(): non-ASCII characters are escaped unless ensure_ascii is False, and it is compact unless indented.
+    Only floats in exponent notation may be formatted differently (e.g. 1e+16 or 1e16), which SPDX documents don't
+    contain.
+    """
+
+    name = "json"
+    package_name = "json"
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, ensure_ascii: bool = True) -> str:
+        return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii, separators=get_separators(indent))
+
+    def read_file(self, file_name: str) -> Any:
+        with open(file_name, encoding="utf-8") as file:
+            return json.load(file)
+
+    def write_file(self, obj: Any, file_name: str, indent: Optional[int] = None, ensure_ascii: bool = True):
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump(obj, file, indent=indent, ensure_ascii=ensure_ascii, separators=get_separators(indent))
+
+
+class BinaryJsonBackend(JsonBackend, ABC):
+    """Base for backends that decode from and encode to UTF-8 bytes."""
+
+    @abstractmethod
+    def loads_bytes(self, data: Union[str, bytes]) -> Any:
+        pass
+
+    @abstractmethod
+    def dumps_bytes(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        """Encodes the object as UTF-8, without escaping non-ASCII characters."""
+        pass
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self.loads_bytes(data)
+        except ValueError:
+            # the standard library accepts a few inputs the faster libraries reject (e.g. integers beyond 64 bits)
+            # and otherwise raises the usual json.JSONDecodeError
+            return super().loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, ensure_ascii: bool = True) -> str:
+        return self._dumps_or_fall_back(obj, indent, ensure_ascii).decode("utf-8")
+
+    def read_file(self, file_name: str) -> Any:
+        with open(file_name, "rb") as file:
+            return self.loads(file.read())
+
+    def write_file(self, obj: Any, file_name: str, indent: Optional[int] = None, ensure_ascii: bool = True):
+        with open(file_name, "wb") as file:
+            file.write(self._dumps_or_fall_back(obj, indent, ensure_ascii))
+
+    def _dumps_or_fall_back(self, obj: Any, indent: Optional[int], ensure_ascii: bool) -> bytes:
+        if indent is not None and not isinstance(indent, int):
+            return super().dumps(obj, indent, ensure_ascii).encode("utf-8")
+        try:
+            encoded = self.dumps_bytes(obj, indent)
+        except (TypeError, OverflowError):
+            # e.g. non-string dictionary keys or integers beyond 64 bits
+            return super().dumps(obj, indent, ensure_ascii).encode("utf-8")
+        return escape_non_ascii(encoded) if ensure_ascii else encoded
+
+
+class OrjsonBackend(BinaryJsonBackend):
+    name = "orjson"
+    package_name = "orjson"
+
+    @staticmethod
+    def is_available() -> bool:
+        return orjson is not None
+
+    def loads_bytes(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps_bytes(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        if indent is None:
+            return orjson.dumps(obj)
+        indented = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        if indent == 2:
+            return indented
+        return rescale_indentation(indented, indent)
+
+
+class UjsonBackend(BinaryJsonBackend):
+    name = "ujson"
+    package_name = "ujson"
+
+    @staticmethod
+    def is_available() -> bool:
+        return ujson is not None
+
+    def loads_bytes(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+    def dumps_bytes(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        if indent is None:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+        return ujson.dumps(obj, indent=indent, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+
+class SimdjsonBackend(JsonBackend):
+    """Only decodes with simdjson, encoding is left to the standard library."""
+
+    name = "simdjson"
+    package_name = "pysimdjson"
+
+    @staticmethod
+    def is_available() -> bool:
+        return simdjson is not None
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return simdjson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+    def read_file(self, file_name: str) -> Any:
+        with open(file_name, "rb") as file:
+            return self.loads(file.read())
+
+
+def escape_non_ascii(encoded: bytes) -> bytes:
+    """
+    Escapes the characters of UTF-8 encoded JSON the way json.dumps(ensure_ascii=True) does: DEL and all non-ASCII
+    characters become \\uXXXX escapes, those beyond the Basic Multilingual Plane as a UTF-16 surrogate pair. Only
+    strings can contain such characters, so they can be replaced anywhere.
+    """
+    return NON_ASCII_BYTES.sub(_escape_characters, encoded)
+
+
+def _escape_characters(match: Match) -> bytes:
+    utf16 = match.group().decode("utf-8").encode("utf-16-be")
+    return b"".join(b"\\u" + utf16[index : index + 2].hex().encode("ascii") for index in range(0, len(utf16), 2))
+
+
+def get_separators(indent: Optional[int]) -> Optional[Tuple[str, str]]:
+    # json.dumps() separates items by ", " without indentation, the other libraries by ","
+    return COMPACT_SEPARATORS if indent is None else None
+
+
+def rescale_indentation(indented: bytes, indent: int) -> bytes:
+    """
+    Converts JSON that is indented by two spaces per level (the only indentation orjson supports) to the given number
+    of spaces per level. Raw line breaks and NUL bytes cannot occur within JSON strings, so the indentation is replaced
+    level by level, deepest first, with placeholder bytes that are then expanded in a single pass.
+    """
+    depth = 0
+    while b"\n" + b"  " * (depth + 1) in indented:
+        depth += 1
+    for level in range(depth, 0, -1):
+        indented = indented.replace(b"\n" + b"  " * level, b"\n" + INDENT_PLACEHOLDER * level)
+    return indented.replace(INDENT_PLACEHOLDER, b" " * indent)
+
+
+# in order of preference
+JSON_BACKENDS: List[Type[JsonBackend]] = [OrjsonBackend, SimdjsonBackend, UjsonBackend, JsonBackend]
+JSON_BACKENDS_BY_NAME: Dict[str, Type[JsonBackend]] = {backend.name: backend for backend in JSON_BACKENDS}
+
+_json_backend: JsonBackend = next(backend() for backend in JSON_BACKENDS if backend.is_available())
+
+
+def get_json_backend() -> JsonBackend:
+    """Returns the backend used to read and write JSON files, by default the fastest installed one."""
+    return _json_backend
+
+
+def set_json_backend(name: str):
+    """Selects the backend used to read and write JSON files by its name, e.g. "json" for the standard library."""
+    global _json_backend
+    if name not in JSON_BACKENDS_BY_NAME:
+        raise ValueError(f"Unknown JSON backend {name}, choose one of {', '.join(JSON_BACKENDS_BY_NAME)}")
+    backend = JSON_BACKENDS_BY_NAME[name]
+    if not backend.is_available():
+        raise ImportError(f"The JSON backend {name} is not installed. Run 'pip install {backend.package_name}'.")
+    _json_backend = backend()
+
+
+def get_available_json_backends() -> List[str]:
+    return [backend.name for backend in JSON_BACKENDS if backend.is_available()]
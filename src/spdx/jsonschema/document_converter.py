@@ -122,9 +122,9 @@ class DocumentConverter(TypedConverter[Document]):
             for package in document.packages:
                 already_covered_relationships.extend(find_package_contains_file_relationships(document, package))
                 already_covered_relationships.extend(find_file_contained_by_package_relationships(document, package))
-            relationships_to_ignore = [
+            relationships_to_ignore = {
                 relationship for relationship in already_covered_relationships if relationship.comment is None
-            ]
+            }
             return [
                 self.relationship_converter.convert(relationship)
                 for relationship in document.relationships
@@ -14,7 +14,7 @@ class ActorType(Enum):
     TOOL = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(hashable=True)
 class Actor:
     actor_type: ActorType
     name: str
@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from enum import Enum, auto
+from typing import Dict, Optional
 
 from common.typing.dataclass_with_properties import dataclass_with_properties
 from common.typing.type_checks import check_types_and_set_values
@@ -27,10 +28,120 @@ class ChecksumAlgorithm(Enum):
     ADLER32 = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(hashable=True)
 class Checksum:
     algorithm: ChecksumAlgorithm
     value: str
 
     def __init__(self, algorithm: ChecksumAlgorithm, value: str):
         check_types_and_set_values(self, locals())
+
+
+# digest sizes in bytes of all algorithms with a fixed-length value
+DIGEST_SIZES: Dict[ChecksumAlgorithm, int] = {
+    ChecksumAlgorithm.SHA1: 20,
+    ChecksumAlgorithm.SHA224: 28,
+    ChecksumAlgorithm.SHA256: 32,
+    ChecksumAlgorithm.SHA384: 48,
+    ChecksumAlgorithm.SHA512: 64,
+    ChecksumAlgorithm.SHA3_256: 32,
+    ChecksumAlgorithm.SHA3_384: 48,
+    ChecksumAlgorithm.SHA3_512: 64,
+    ChecksumAlgorithm.BLAKE2B_256: 32,
+    ChecksumAlgorithm.BLAKE2B_384: 48,
+    ChecksumAlgorithm.BLAKE2B_512: 64,
+    ChecksumAlgorithm.MD2: 16,
+    ChecksumAlgorithm.MD4: 16,
+    ChecksumAlgorithm.MD5: 16,
+    ChecksumAlgorithm.ADLER32: 4,
+}
+
+
+class BinaryChecksum(Checksum):
+    """
+    Compact variant of Checksum that stores the raw digest bytes instead of the hexadecimal string, which halves the
+    memory needed for the value. The (lowercase) hexadecimal value is rendered on access, so a BinaryChecksum can be
+    used wherever a Checksum is expected and compares equal to the corresponding Checksum.
+    Only valid values of algorithms with a fixed digest size can be represented. Setting a value (or an algorithm)
+    that can't be represented turns the instance into a plain Checksum, whose setters check the new value.
+    """
+
+    __slots__ = ()
+    # the value is stored as raw digest bytes
+    algorithm: ChecksumAlgorithm
+    value: bytes
+
+    def __init__(self, algorithm: ChecksumAlgorithm, digest: bytes):
+        if len(digest) != DIGEST_SIZES.get(algorithm):
+            raise ValueError(f"{algorithm} does not have a fixed digest size of {len(digest)} bytes")
+        self._algorithm = algorithm
+        self._value = bytes(digest)
+
+    @classmethod
+    def from_hex(cls, algorithm: ChecksumAlgorithm, value: str) -> Optional["BinaryChecksum"]:
+        """Returns the compact representation of the given checksum value, or None if the value is not valid."""
+        digest = digest_from_hex(algorithm, value)
+        return cls(algorithm, digest) if digest is not None else None
+
+    @property
+    def algorithm(self) -> ChecksumAlgorithm:
+        return self._algorithm
+
+    @algorithm.setter
+    def algorithm(self, algorithm: ChecksumAlgorithm):
+        if isinstance(algorithm, ChecksumAlgorithm) and DIGEST_SIZES.get(algorithm) == len(self._value):
+            self._algorithm = algorithm
+        else:
+            self._convert_to_checksum()
+            Checksum.algorithm.fset(self, algorithm)
+
+    @property
+    def value(self) -> str:
+        return self._value.hex()
+
+    @value.setter
+    def value(self, value: str):
+        digest = digest_from_hex(self._algorithm, value)
+        if digest is not None:
+            self._value = digest
+        else:
+            self._convert_to_checksum()
+            Checksum.value.fset(self, value)
+
+    @property
+    def digest(self) -> bytes:
+        return self._value
+
+    def _convert_to_checksum(self):
+        # both classes have the same slots, so the instance can change its class in place
+        value = self._value.hex()
+        self.__class__ = Checksum
+        self._value = value
+
+    def __reduce__(self):
+        return BinaryChecksum, (self._algorithm, self._value)
+
+    def _identity_key(self):
+        # equal to the key of the corresponding Checksum, so that both hash alike
+        return self._algorithm, self._value.hex()
+
+    def __eq__(self, other):
+        if other.__class__ is BinaryChecksum:
+            return self._algorithm == other._algorithm and self._value == other._value
+        if not isinstance(other, Checksum):
+            return NotImplemented
+        return self.algorithm == other.algorithm and self.value == other.value
+
+    __hash__ = Checksum.__hash__
+
+
+def digest_from_hex(algorithm: ChecksumAlgorithm, value: str) -> Optional[bytes]:
+    """Returns the digest of a valid value of an algorithm with a fixed digest size, None otherwise."""
+    if not isinstance(value, str) or len(value) != 2 * DIGEST_SIZES.get(algorithm, -1):
+        return None
+    try:
+        digest = bytes.fromhex(value)
+    except ValueError:
+        return None
+    # this rejects uppercase digits and whitespace, which bytes.fromhex() accepts
+    return digest if digest.hex() == value else None
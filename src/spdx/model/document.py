@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from dataclasses import field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from common.typing.dataclass_with_properties import dataclass_with_properties
 from common.typing.type_checks import check_types_and_set_values
@@ -12,6 +12,7 @@ from spdx.model.annotation import Annotation
 from spdx.model.external_document_ref import ExternalDocumentRef
 from spdx.model.extracted_licensing_info import ExtractedLicensingInfo
 from spdx.model.file import File
+from spdx.model.file_table import FileTable
 from spdx.model.package import Package
 from spdx.model.relationship import Relationship
 from spdx.model.snippet import Snippet
@@ -55,21 +56,24 @@ class Document:
     creation_info: CreationInfo
 
     packages: List[Package] = field(default_factory=list)
-    files: List[File] = field(default_factory=list)
+    files: Union[List[File], FileTable] = field(default_factory=list)
     snippets: List[Snippet] = field(default_factory=list)
     annotations: List[Annotation] = field(default_factory=list)
     relationships: List[Relationship] = field(default_factory=list)
     extracted_licensing_info: List[ExtractedLicensingInfo] = field(default_factory=list)
+    # the sections (names of the list fields above) that were not parsed, see the include argument of the parsers
+    skipped_sections: List[str] = field(default_factory=list)
 
     def __init__(
         self,
         creation_info: CreationInfo,
         packages: List[Package] = None,
-        files: List[File] = None,
+        files: Union[List[File], FileTable] = None,
         snippets: List[Snippet] = None,
         annotations: List[Annotation] = None,
         relationships: List[Relationship] = None,
         extracted_licensing_info: List[ExtractedLicensingInfo] = None,
+        skipped_sections: List[str] = None,
     ):
         packages = [] if packages is None else packages
         files = [] if files is None else files
@@ -77,4 +81,5 @@ class Document:
         annotations = [] if annotations is None else annotations
         relationships = [] if relationships is None else relationships
         extracted_licensing_info = [] if extracted_licensing_info is None else extracted_licensing_info
+        skipped_sections = [] if skipped_sections is None else skipped_sections
         check_types_and_set_values(self, locals())
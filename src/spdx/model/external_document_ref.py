@@ -7,7 +7,7 @@ from common.typing.type_checks import check_types_and_set_values
 from spdx.model.checksum import Checksum
 
 
-@dataclass_with_properties
+@dataclass_with_properties(hashable=True)
 class ExternalDocumentRef:
     document_ref_id: str  # of the form "DocumentRef-[idstring]"
     document_uri: str
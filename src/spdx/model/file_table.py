@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from array import array
+from collections.abc import MutableSequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from spdx.model.checksum import DIGEST_SIZES, BinaryChecksum, Checksum, ChecksumAlgorithm
+from spdx.model.file import File, FileType
+
+SHA1_LENGTH = DIGEST_SIZES[ChecksumAlgorithm.SHA1]
+
+# file type codes: 0 stands for no file types, 1 to 254 for a single file type (its enum value); any other
+# combination is kept in the row's extras
+NO_FILE_TYPES = 0
+IRREGULAR_FILE_TYPES = 255
+FILE_TYPE_BY_CODE: Dict[int, FileType] = {file_type.value: file_type for file_type in FileType}
+
+# fields that are rarely set and therefore only stored (per row) if they deviate from their default
+OPTIONAL_FIELDS = ["license_info_in_file", "license_comment", "comment", "notice", "contributors", "attribution_texts"]
+
+
+class FileTable(MutableSequence):
+    """
+    Columnar storage for the files of a document that behaves like a list of File. Instead of one object per file and
+    field, the values are kept in parallel columns:
+    - names, SPDX IDs, concluded licenses and copyright texts in plain lists (equal values may share one object),
+    - file types as one byte per file,
+    - the leading SHA1 checksum of each file as packed 20-byte digests,
+    - all remaining (rarely used) values in a sparse per-row dictionary.
+    File objects are only materialized on item access or iteration. They are detached copies: to change a file in
+    the table, assign the modified object back (table[index] = file).
+    Bulk accessors like get_spdx_ids() and get_sha1s() read the columns directly without building any File.
+    """
+
+    def __init__(self, files: Iterable[File] = ()):
+        self._names: List[str] = []
+        self._spdx_ids: List[str] = []
+        self._licenses_concluded: List[Any] = []
+        self._copyright_texts: List[Any] = []
+        self._file_type_codes = array("B")
+        self._has_sha1 = array("B")
+        self._sha1s = bytearray()
+        self._extras: List[Optional[Dict[str, Any]]] = []
+        self.extend(files)
+
+    def __len__(self) -> int:
+        return len(self._spdx_ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[File, List[File]]:
+        if isinstance(index, slice):
+            return [self._build_file(row) for row in range(*index.indices(len(self)))]
+        return self._build_file(self._row(index))
+
+    def __setitem__(self, index: int, file: File):
+        row = self._row(index)
+        del self[row]
+        self.insert(row, file)
+
+    def __delitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            for row in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[row]
+            return
+        row = self._row(index)
+        for column in (self._names, self._spdx_ids, self._licenses_concluded, self._copyright_texts, self._extras):
+            del column[row]
+        del self._file_type_codes[row]
+        del self._has_sha1[row]
+        del self._sha1s[row * SHA1_LENGTH : (row + 1) * SHA1_LENGTH]
+
+    def insert(self, index: int, file: File):
+        if not isinstance(file, File):
+            raise TypeError(f"FileTable can only hold instances of File, not {type(file).__name__}")
+        row = max(0, min(len(self), index if index >= 0 else len(self) + index))
+        extras = {}
+        checksums = file.checksums
+        sha1_digest = _get_sha1_digest(checksums[0]) if checksums else None
+        if sha1_digest is not None:
+            checksums = checksums[1:]
+        if checksums:
+            extras["checksums"] = list(checksums)
+
+        file_types = file.file_types
+        if not file_types:
+            file_type_code = NO_FILE_TYPES
+        elif len(file_types) == 1:
+            file_type_code = file_types[0].value
+        else:
+            file_type_code = IRREGULAR_FILE_TYPES
+            extras["file_types"] = list(file_types)
+
+        for field_name in OPTIONAL_FIELDS:
+            value = getattr(file, field_name)
+            if isinstance(value, list):
+                if value:
+                    extras[field_name] = list(value)
+            elif value is not None:
+                # e.g. an empty comment, which differs from a missing one
+                extras[field_name] = value
+
+        self._names.insert(row, file.name)
+        self._spdx_ids.insert(row, file.spdx_id)
+        self._licenses_concluded.insert(row, file.license_concluded)
+        self._copyright_texts.insert(row, file.copyright_text)
+        self._extras.insert(row, extras or None)
+        self._file_type_codes.insert(row, file_type_code)
+        self._has_sha1.insert(row, sha1_digest is not None)
+        self._sha1s[row * SHA1_LENGTH : row * SHA1_LENGTH] = sha1_digest or bytes(SHA1_LENGTH)
+
+    def __iter__(self) -> Iterator[File]:
+        for row in range(len(self)):
+            yield self._build_file(row)
+
+    def __eq__(self, other):
+        if isinstance(other, FileTable):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"FileTable({list(self)!r})"
+
+    def get_spdx_ids(self) -> List[str]:
+        return list(self._spdx_ids)
+
+    def get_names(self) -> List[str]:
+        return list(self._names)
+
+    def get_sha1s(self) -> List[Optional[str]]:
+        """Returns the (first) SHA1 checksum value of every file, or None for files without SHA1 checksum."""
+        sha1s = []
+        for row, has_sha1 in enumerate(self._has_sha1):
+            if has_sha1:
+                sha1s.append(self._sha1s[row * SHA1_LENGTH : (row + 1) * SHA1_LENGTH].hex())
+                continue
+            extras = self._extras[row] or {}
+            sha1s.append(
+                next(
+                    (
+                        checksum.value
+                        for checksum in extras.get("checksums", [])
+                        if checksum.algorithm == ChecksumAlgorithm.SHA1
+                    ),
+                    None,
+                )
+            )
+        return sha1s
+
+    def _row(self, index: int) -> int:
+        row = index + len(self) if index < 0 else index
+        if not 0 <= row < len(self):
+            raise IndexError("FileTable index out of range")
+        return row
+
+    def _build_file(self, row: int) -> File:
+        extras = self._extras[row] or {}
+        checksums = []
+        if self._has_sha1[row]:
+            sha1 = self._sha1s[row * SHA1_LENGTH : (row + 1) * SHA1_LENGTH]
+            checksums.append(BinaryChecksum(ChecksumAlgorithm.SHA1, sha1))
+        checksums.extend(extras.get("checksums", []))
+
+        file_type_code = self._file_type_codes[row]
+        if file_type_code == IRREGULAR_FILE_TYPES:
+            file_types = list(extras["file_types"])
+        elif file_type_code == NO_FILE_TYPES:
+            file_types = []
+        else:
+            file_types = [FILE_TYPE_BY_CODE[file_type_code]]
+
+        return File._from_trusted(
+            self._names[row],
+            self._spdx_ids[row],
+            checksums,
+            file_types,
+            license_concluded=self._licenses_concluded[row],
+            copyright_text=self._copyright_texts[row],
+            **{
+                field_name: list(value) if isinstance(value, list) else value
+                for field_name, value in extras.items()
+                if field_name in OPTIONAL_FIELDS
+            },
+        )
+
+
+def get_file_spdx_ids(files: Union[List[File], FileTable]) -> List[str]:
+    if isinstance(files, FileTable):
+        return files.get_spdx_ids()
+    return [file.spdx_id for file in files]
+
+
+def _get_sha1_digest(checksum: Checksum) -> Optional[bytes]:
+    if checksum.algorithm != ChecksumAlgorithm.SHA1:
+        return None
+    if not isinstance(checksum, BinaryChecksum):
+        checksum = BinaryChecksum.from_hex(ChecksumAlgorithm.SHA1, checksum.value)
+    return checksum.digest if checksum else None
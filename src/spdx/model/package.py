@@ -31,7 +31,7 @@ class PackagePurpose(Enum):
     OTHER = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(hashable=True)
 class PackageVerificationCode:
     value: str
     excluded_files: List[str] = field(default_factory=list)
@@ -56,7 +56,7 @@ CATEGORY_TO_EXTERNAL_PACKAGE_REF_TYPES: Dict[ExternalPackageRefCategory, List[st
 }
 
 
-@dataclass_with_properties
+@dataclass_with_properties(hashable=True)
 class ExternalPackageRef:
     category: ExternalPackageRefCategory
     # In theory, once could refine the typing,
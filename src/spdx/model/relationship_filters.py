@@ -4,12 +4,13 @@
 from typing import List
 
 from spdx.model.document import Document
+from spdx.model.file_table import get_file_spdx_ids
 from spdx.model.package import Package
 from spdx.model.relationship import Relationship, RelationshipType
 
 
 def find_package_contains_file_relationships(document: Document, package: Package) -> List[Relationship]:
-    file_ids_in_document = [file.spdx_id for file in document.files]
+    file_ids_in_document = set(get_file_spdx_ids(document.files))
     package_contains_relationships = filter_by_type_and_origin(
         document.relationships, RelationshipType.CONTAINS, package.spdx_id
     )
@@ -21,7 +22,7 @@ def find_package_contains_file_relationships(document: Document, package: Packag
 
 
 def find_file_contained_by_package_relationships(document: Document, package: Package) -> List[Relationship]:
-    file_ids_in_document = [file.spdx_id for file in document.files]
+    file_ids_in_document = set(get_file_spdx_ids(document.files))
     contained_by_package_relationships = filter_by_type_and_target(
         document.relationships, RelationshipType.CONTAINED_BY, package.spdx_id
     )
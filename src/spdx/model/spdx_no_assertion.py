@@ -7,9 +7,17 @@ SPDX_NO_ASSERTION_STRING = "NOASSERTION"
 
 class SpdxNoAssertion:
     """
-    Represents the SPDX NOASSERTION value.
+    Represents the SPDX NOASSERTION value. There is only a single instance of this class, so that all fields with this
+    value share one object.
     """
 
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __str__(self):
         return SPDX_NO_ASSERTION_STRING
 
@@ -18,3 +26,6 @@ class SpdxNoAssertion:
 
     def __eq__(self, other):
         return isinstance(other, SpdxNoAssertion)
+
+    def __hash__(self):
+        return hash(SPDX_NO_ASSERTION_STRING)
@@ -38,3 +38,6 @@ class Version:
         if not isinstance(other, Version):
             return False
         return self.major == other.major and self.minor == other.minor
+
+    def __hash__(self):
+        return hash((self.major, self.minor))
@@ -2,55 +2,82 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import re
-from typing import Match, Optional, Pattern
+from functools import lru_cache
+from typing import Match, Optional, Pattern, Tuple
 
 from spdx.model.actor import Actor, ActorType
 from spdx.parser.error import SPDXParsingError
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error
+from spdx.parser.parsing_functions import construct_or_raise_parsing_error, get_interning_table
+
+# Upper bound for the number of actor strings whose parsed values are cached by ActorParser.parse_actor()
+MAX_INTERNED_ACTORS = 4096
+
+TOOL_PATTERN: Pattern = re.compile(r"^Tool:\s*(.+)", re.UNICODE)
+PERSON_PATTERN: Pattern = re.compile(r"^Person:\s*(([^(])+)(\((.*)\))?", re.UNICODE)
+ORGANIZATION_PATTERN: Pattern = re.compile(r"^Organization:\s*(([^(])+)(\((.*)\))?", re.UNICODE)
 
 
 class ActorParser:
     @staticmethod
     def parse_actor(actor: str) -> Actor:
-        tool_re: Pattern = re.compile(r"^Tool:\s*(.+)", re.UNICODE)
-        person_re: Pattern = re.compile(r"^Person:\s*(([^(])+)(\((.*)\))?", re.UNICODE)
-        org_re: Pattern = re.compile(r"^Organization:\s*(([^(])+)(\((.*)\))?", re.UNICODE)
-        tool_match: Match = tool_re.match(actor)
-        person_match: Match = person_re.match(actor)
-        org_match: Match = org_re.match(actor)
+        if not isinstance(actor, str):
+            raise SPDXParsingError([f"Type for actor must be str not {type(actor).__name__}"])
+        actor_type, name, email = _parse_actor_values(actor)
+        return ActorParser.get_interned_actor(actor_type, name, email)
+
+    @staticmethod
+    def get_interned_actor(actor_type: ActorType, name: str, email: Optional[str] = None) -> Actor:
+        """
+        Returns an Actor with the given values. Within a parse (see string_interning()), identical actors (e.g. the
+        supplier of many packages) share one instance; other documents never get the same instance. As Actors are
+        mutable, e.g. by the caller of a streaming parser, an instance is only handed out again while its values are
+        unchanged.
+        """
+        table = get_interning_table()
+        key = (actor_type, name, email)
+        actor = table.get(key) if table is not None else None
+        if actor is None or (actor.actor_type, actor.name, actor.email) != key:
+            actor = construct_or_raise_parsing_error(Actor, dict(actor_type=actor_type, name=name, email=email))
+            if table is not None:
+                table[key] = actor
+        return actor
+
+    @staticmethod
+    def get_email_or_none(match: Match) -> Optional[str]:
+        email_match = match.group(4)
+        if email_match and email_match.strip():
+            email = email_match.strip()
+        else:
+            email = None
+        return email
 
+
+@lru_cache(maxsize=MAX_INTERNED_ACTORS)
+def _parse_actor_values(actor: str) -> Tuple[ActorType, str, Optional[str]]:
+    # The same few actor strings (suppliers, originators, creators, ...) occur over and over again, so their values
+    # are cached. Invalid actors raise an SPDXParsingError, which is not cached.
+    if actor.startswith("Tool:"):
+        tool_match: Optional[Match] = TOOL_PATTERN.match(actor)
         if tool_match:
             name: str = tool_match.group(1).strip()
             if not name:
                 raise SPDXParsingError([f"No name for Tool provided: {actor}."])
-            creator = construct_or_raise_parsing_error(Actor, dict(actor_type=ActorType.TOOL, name=name))
+            return ActorType.TOOL, name, None
 
-        elif person_match:
+    elif actor.startswith("Person:"):
+        person_match: Optional[Match] = PERSON_PATTERN.match(actor)
+        if person_match:
             name: str = person_match.group(1).strip()
             if not name:
                 raise SPDXParsingError([f"No name for Person provided: {actor}."])
-            email: Optional[str] = ActorParser.get_email_or_none(person_match)
-            creator = construct_or_raise_parsing_error(
-                Actor, dict(actor_type=ActorType.PERSON, name=name, email=email)
-            )
-        elif org_match:
+            return ActorType.PERSON, name, ActorParser.get_email_or_none(person_match)
+
+    elif actor.startswith("Organization:"):
+        org_match: Optional[Match] = ORGANIZATION_PATTERN.match(actor)
+        if org_match:
             name: str = org_match.group(1).strip()
             if not name:
                 raise SPDXParsingError([f"No name for Organization provided: {actor}."])
-            email: Optional[str] = ActorParser.get_email_or_none(org_match)
-            creator = construct_or_raise_parsing_error(
-                Actor, dict(actor_type=ActorType.ORGANIZATION, name=name, email=email)
-            )
-        else:
-            raise SPDXParsingError([f"Actor {actor} doesn't match any of person, organization or tool."])
+            return ActorType.ORGANIZATION, name, ActorParser.get_email_or_none(org_match)
 
-        return creator
-
-    @staticmethod
-    def get_email_or_none(match: Match) -> Optional[str]:
-        email_match = match.group(4)
-        if email_match and email_match.strip():
-            email = email_match.strip()
-        else:
-            email = None
-        return email
+    raise SPDXParsingError([f"Actor {actor} doesn't match any of person, organization or tool."])
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from enum import Enum
+from typing import Dict, Type
+
+from spdx.casing_tools import snake_case_to_camel_case
+from spdx.model.annotation import AnnotationType
+from spdx.model.checksum import ChecksumAlgorithm
+from spdx.model.file import FileType
+from spdx.model.package import ExternalPackageRefCategory, PackagePurpose
+from spdx.model.relationship import RelationshipType
+
+# The tables below map the serialized values of the enums directly to their members, so that the parsers only need to
+# normalize values that are not spelled like the writers spell them.
+LOOKUP_ENUM_CLASSES = [
+    RelationshipType,
+    ChecksumAlgorithm,
+    FileType,
+    PackagePurpose,
+    AnnotationType,
+    ExternalPackageRefCategory,
+]
+
+
+def _build_enum_value_lookup(enum_class: Type[Enum]) -> Dict[str, Enum]:
+    # JSON, YAML, XML and tag-value use the member names, optionally with dashes instead of underscores
+    lookup = {}
+    for member in enum_class:
+        lookup[member.name] = member
+        lookup[member.name.replace("_", "-")] = member
+        if enum_class is ChecksumAlgorithm:
+            lookup[member.name.replace("_", "-").replace("BLAKE2B", "BLAKE2b")] = member
+    return lookup
+
+
+def _build_rdf_enum_value_lookup(enum_class: Type[Enum]) -> Dict[str, Enum]:
+    # RDF uses the camel case name after a prefix like relationshipType_, except for checksum algorithms which are
+    # lowercase and have no underscore after BLAKE2B
+    if enum_class is ChecksumAlgorithm:
+        return {
+            (member.name.replace("_", "") if "BLAKE2B" in member.name else member.name).lower(): member
+            for member in enum_class
+        }
+    return {snake_case_to_camel_case(member.name): member for member in enum_class}
+
+
+ENUM_VALUE_LOOKUP: Dict[Type[Enum], Dict[str, Enum]] = {
+    enum_class: _build_enum_value_lookup(enum_class) for enum_class in LOOKUP_ENUM_CLASSES
+}
+RDF_ENUM_VALUE_LOOKUP: Dict[Type[Enum], Dict[str, Enum]] = {
+    enum_class: _build_rdf_enum_value_lookup(enum_class) for enum_class in LOOKUP_ENUM_CLASSES
+}
@@ -1,15 +1,57 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-import json
-from typing import Dict
+from typing import Any, Collection, Dict, Iterator, Optional
 
+from spdx.json_backend import get_json_backend
 from spdx.model.document import Document
-from spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx.parser.json.json_stream_reader import JsonStreamReader
+from spdx.parser.jsonlikedict.json_like_dict_parser import STREAMED_FIELDS, JsonLikeDictParser
 
 
-def parse_from_file(file_name: str) -> Document:
-    with open(file_name) as file:
-        input_doc_as_dict: Dict = json.load(file)
+def parse_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    streaming: bool = False,
+    workers: int = 1,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+) -> Document:
+    """
+    streaming: read the file incrementally instead of loading it as a whole before parsing, so that the peak memory
+    is mostly the parsed document (see parse_elements_from_file()).
+    workers: parse the elements of large documents in a process pool of this size (see JsonLikeDictParser); not used
+    when streaming.
+    include: the sections of the document to parse, all by default (see JsonLikeDictParser).
+    max_errors: stop parsing once this many errors have been found (see JsonLikeDictParser).
+    """
+    if streaming:
+        with open(file_name) as file:
+            entries = JsonStreamReader(file).iterate_top_level_entries(STREAMED_FIELDS)
+            return JsonLikeDictParser(
+                intern_strings, file_table, include=include, max_errors=max_errors
+            ).parse_entries(entries)
+
+    input_doc_as_dict: Dict = get_json_backend().read_file(file_name)
+
+    return JsonLikeDictParser(intern_strings, file_table, workers, include=include, max_errors=max_errors).parse(
+        input_doc_as_dict
+    )
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+
+def parse_elements_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Reads the file incrementally and yields its packages, files, snippets and relationships one at a time while they
+    are read, followed by the CreationInfo, annotations, implied relationships and extracted licensing infos. The
+    whole document is never held in memory, so arbitrarily large documents can be processed element by element.
+    Errors are raised as one SPDXParsingError after the last element.
+    """
+    with open(file_name) as file:
+        entries = JsonStreamReader(file).iterate_top_level_entries(STREAMED_FIELDS)
+        yield from JsonLikeDictParser(intern_strings, include=include, max_errors=max_errors).iterate_elements(entries)
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+import re
+from typing import Any, Collection, Iterator, TextIO, Tuple
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# the characters a number can consist of; raw_decode() stops at a trailing "." or "e", e.g. "1." decodes to 1
+NUMBER_CHARACTERS = re.compile(r"[-+0-9.eE]*")
+
+
+class JsonStreamReader:
+    """
+    Reads a JSON object from a file incrementally instead of loading it completely like json.load() does. The file is
+    read in chunks and every value is decoded with json.JSONDecoder.raw_decode() as soon as it is complete, so the
+    memory needed is bounded by the largest single value instead of the whole document.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._end_of_file = False
+        # where the buffer starts in the file: the character offset, the line and the column of its first character
+        self._buffer_offset = 0
+        self._buffer_line = 1
+        self._buffer_column = 1
+
+    def iterate_top_level_entries(self, streamed_arrays: Collection[str] = ()) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields a (key, value) pair for every entry of the top-level object of the file. The elements of the arrays
+        whose key is contained in streamed_arrays are yielded one by one as (key, element) instead; a null value for
+        such a key yields nothing.
+        Raises json.JSONDecodeError if the file does not contain a valid JSON object; its pos, lineno and colno refer
+        to the file, its doc is only the part of the file that was buffered.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+        else:
+            while True:
+                key = self._decode_value()
+                if not isinstance(key, str):
+                    self._raise_error("Expecting property name enclosed in double quotes")
+                self._expect(":")
+                if key in streamed_arrays and self._peek() == "[":
+                    yield from self._iterate_array(key)
+                else:
+                    value = self._decode_value()
+                    if value is not None or key not in streamed_arrays:
+                        yield key, value
+                if self._expect(",}") == "}":
+                    break
+        if self._peek():
+            self._raise_error("Extra data")
+
+    def _iterate_array(self, key: str) -> Iterator[Tuple[str, Any]]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield key, self._decode_value()
+            if self._expect(",]") == "]":
+                return
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as err:
+                if self._end_of_file:
+                    raise self._error_in_file(err) from None
+            else:
+                # a number that reaches the end of the buffer might continue in the next chunk, even if
+                # raw_decode() stopped before the end, e.g. at the "." of "1." or the "e" of "1e"
+                number_end = NUMBER_CHARACTERS.match(self._buffer, self._position).end()
+                if number_end < len(self._buffer) or self._end_of_file:
+                    self._position = end
+                    return value
+            # values larger than the buffer are decoded again from their start, so grow the buffer geometrically
+            self._read_chunk(read_size)
+            read_size = max(read_size, len(self._buffer))
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character, or an empty string at the end of the file."""
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or self._end_of_file:
+                return self._buffer[self._position : self._position + 1]
+            self._read_chunk(self._chunk_size)
+
+    def _expect(self, expected_characters: str) -> str:
+        character = self._peek()
+        if not character or character not in expected_characters:
+            self._raise_error(f"Expecting one of {', '.join(repr(c) for c in expected_characters)}")
+        self._position += 1
+        return character
+
+    def _read_chunk(self, size: int):
+        chunk = self._file.read(size)
+        if not chunk:
+            self._end_of_file = True
+        dropped_lines = self._buffer.count("\n", 0, self._position)
+        if dropped_lines:
+            self._buffer_line += dropped_lines
+            self._buffer_column = self._position - self._buffer.rfind("\n", 0, self._position)
+        else:
+            self._buffer_column += self._position
+        self._buffer_offset += self._position
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+
+    def _raise_error(self, message: str):
+        raise self._error_in_file(json.JSONDecodeError(message, self._buffer, self._position))
+
+    def _error_in_file(self, err: json.JSONDecodeError) -> json.JSONDecodeError:
+        """Returns a copy of the error for a position in the buffer whose position refers to the file instead."""
+        position = self._buffer_offset + err.pos
+        line = self._buffer_line + err.lineno - 1
+        column = err.colno + self._buffer_column - 1 if err.lineno == 1 else err.colno
+        error = json.JSONDecodeError(err.msg, err.doc, err.pos)
+        error.pos, error.lineno, error.colno = position, line, column
+        error.args = (f"{err.msg}: line {line} column {column} (char {position})",)
+        return error
@@ -11,7 +11,11 @@ from spdx.parser.actor_parser import ActorParser
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.jsonlikedict.dict_parsing_functions import append_parsed_field_or_log_error, parse_field_or_log_error
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
 
 
 class AnnotationParser:
@@ -56,7 +60,7 @@ class AnnotationParser:
 
     def parse_annotation(self, annotation_dict: Dict, spdx_id: Optional[str] = None) -> Annotation:
         logger = Logger()
-        spdx_id: Optional[str] = annotation_dict.get("SPDXID") or spdx_id
+        spdx_id: Optional[str] = intern_string(annotation_dict.get("SPDXID") or spdx_id)
 
         annotation_type: Optional[AnnotationType] = parse_field_or_log_error(
             logger, annotation_dict.get("annotationType"), self.parse_annotation_type
@@ -3,8 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Dict, Optional
 
-from spdx.model.checksum import Checksum, ChecksumAlgorithm
-from spdx.parser.jsonlikedict.dict_parsing_functions import json_str_to_enum_name
+from spdx.model.checksum import BinaryChecksum, Checksum, ChecksumAlgorithm
+from spdx.parser.jsonlikedict.dict_parsing_functions import json_str_to_enum, json_str_to_enum_name
 from spdx.parser.logger import Logger
 from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
 
@@ -18,13 +18,15 @@ class ChecksumParser:
     @staticmethod
     def parse_checksum(checksum_dict: Dict) -> Checksum:
         logger = Logger()
-        algorithm: str = json_str_to_enum_name(checksum_dict.get("algorithm", ""))
+        algorithm: str = checksum_dict.get("algorithm", "")
         try:
-            checksum_algorithm = ChecksumAlgorithm[algorithm]
+            checksum_algorithm = json_str_to_enum(algorithm, ChecksumAlgorithm)
         except KeyError:
-            logger.append(f"Invalid ChecksumAlgorithm: {algorithm}")
+            logger.append(f"Invalid ChecksumAlgorithm: {json_str_to_enum_name(algorithm)}")
             checksum_algorithm = None
         checksum_value: Optional[str] = checksum_dict.get("checksumValue")
         raise_parsing_error_if_logger_has_messages(logger, "Checksum")
-        checksum = construct_or_raise_parsing_error(Checksum, dict(algorithm=checksum_algorithm, value=checksum_value))
+        checksum = BinaryChecksum.from_hex(checksum_algorithm, checksum_value) or construct_or_raise_parsing_error(
+            Checksum, dict(algorithm=checksum_algorithm, value=checksum_value)
+        )
         return checksum
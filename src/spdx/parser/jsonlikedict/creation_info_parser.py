@@ -19,7 +19,11 @@ from spdx.parser.jsonlikedict.dict_parsing_functions import (
     parse_field_or_no_assertion,
 )
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
 
 
 class CreationInfoParser:
@@ -35,7 +39,7 @@ class CreationInfoParser:
     def parse_creation_info(self, doc_dict: Dict) -> CreationInfo:
         logger = Logger()
         spdx_version: Optional[str] = doc_dict.get("spdxVersion")
-        spdx_id: Optional[str] = doc_dict.get("SPDXID")
+        spdx_id: Optional[str] = intern_string(doc_dict.get("SPDXID"))
         name: Optional[str] = doc_dict.get("name")
         document_namespace: Optional[str] = doc_dict.get("documentNamespace")
         creation_info_dict: Optional[Dict] = doc_dict.get("creationInfo")
@@ -121,7 +125,7 @@ class CreationInfoParser:
             logger, external_document_ref_dict.get("checksum"), self.checksum_parser.parse_checksum
         )
 
-        external_document_id: Optional[str] = external_document_ref_dict.get("externalDocumentId")
+        external_document_id: Optional[str] = intern_string(external_document_ref_dict.get("externalDocumentId"))
         document_uri: Optional[str] = external_document_ref_dict.get("spdxDocument")
         raise_parsing_error_if_logger_has_messages(logger, "ExternalDocumentRef")
         external_document_ref: ExternalDocumentRef = construct_or_raise_parsing_error(
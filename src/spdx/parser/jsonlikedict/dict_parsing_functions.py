@@ -1,13 +1,21 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import Executor
+from enum import Enum
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
-from spdx.model.spdx_no_assertion import SpdxNoAssertion
-from spdx.model.spdx_none import SpdxNone
+from spdx.model.spdx_no_assertion import SPDX_NO_ASSERTION_STRING, SpdxNoAssertion
+from spdx.model.spdx_none import SPDX_NONE_STRING, SpdxNone
+from spdx.parser.enum_lookup import ENUM_VALUE_LOOKUP
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import raise_parsing_error_if_logger_has_messages, string_interning
+
+DEFAULT_PARALLEL_CHUNK_SIZE = 10000
+
+EnumType = TypeVar("EnumType", bound=Enum)
 
 
 def json_str_to_enum_name(json_str: str) -> str:
@@ -16,6 +24,17 @@ def json_str_to_enum_name(json_str: str) -> str:
     return json_str.replace("-", "_").upper()
 
 
+def json_str_to_enum(json_str: str, enum_class: Type[EnumType]) -> EnumType:
+    """
+    Equivalent to enum_class[json_str_to_enum_name(json_str)], but values that are spelled like the writers spell
+    them are looked up directly. Raises a KeyError for values that do not belong to the enum_class.
+    """
+    try:
+        return ENUM_VALUE_LOOKUP[enum_class][json_str]
+    except (KeyError, TypeError):
+        return enum_class[json_str_to_enum_name(json_str)]
+
+
 def parse_field_or_log_error(
     logger: Logger,
     field: Any,
@@ -51,26 +70,31 @@ def append_parsed_field_or_log_error(
 
 
 def parse_field_or_no_assertion_or_none(field: Optional[str], method_for_field: Callable = lambda x: x) -> Any:
-    if field == SpdxNoAssertion().__str__():
+    if field == SPDX_NO_ASSERTION_STRING:
         return SpdxNoAssertion()
-    elif field == SpdxNone().__str__():
+    elif field == SPDX_NONE_STRING:
         return SpdxNone()
     else:
         return method_for_field(field)
 
 
 def parse_field_or_no_assertion(field: Optional[str], method_for_field: Callable = lambda x: x) -> Any:
-    if field == SpdxNoAssertion().__str__():
+    if field == SPDX_NO_ASSERTION_STRING:
         return SpdxNoAssertion()
     else:
         return method_for_field(field)
 
 
-def parse_list_of_elements(list_of_elements: List[Dict], method_to_parse_element: Callable, logger=None) -> List[Any]:
+def parse_list_of_elements(
+    list_of_elements: List[Dict], method_to_parse_element: Callable, logger=None, parsed_elements=None
+) -> List[Any]:
     if not logger:
         logger = Logger()
-    parsed_elements = []
+    if parsed_elements is None:
+        parsed_elements = []
     for element_dict in list_of_elements:
+        if logger.has_reached_max_errors():
+            break
         parsed_elements = append_parsed_field_or_log_error(
             logger, parsed_elements, element_dict, method_to_parse_element
         )
@@ -78,6 +102,57 @@ def parse_list_of_elements(list_of_elements: List[Dict], method_to_parse_element
     return parsed_elements
 
 
+def parse_list_of_elements_in_parallel(
+    list_of_elements: List[Dict],
+    method_to_parse_element: Callable,
+    logger=None,
+    parsed_elements=None,
+    executor: Executor = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+    intern_strings: bool = True,
+) -> List[Any]:
+    """
+    Like parse_list_of_elements(), but parses chunks of the list in the given executor, typically a
+    ProcessPoolExecutor, in which case method_to_parse_element must be picklable (e.g. a bound method of a parser).
+    The parsed elements and the error messages are merged in the order of the list, so the result and any raised
+    SPDXParsingError are the same as with parse_list_of_elements(). Lists of at most chunk_size elements are parsed
+    sequentially.
+    """
+    if executor is None or len(list_of_elements) <= chunk_size:
+        return parse_list_of_elements(list_of_elements, method_to_parse_element, logger, parsed_elements)
+    if not logger:
+        logger = Logger()
+    if parsed_elements is None:
+        parsed_elements = []
+    chunks = [list_of_elements[start : start + chunk_size] for start in range(0, len(list_of_elements), chunk_size)]
+    for parsed_chunk, messages in executor.map(
+        _parse_chunk_of_elements,
+        chunks,
+        repeat(method_to_parse_element),
+        repeat(intern_strings),
+        repeat(logger.max_errors),
+    ):
+        parsed_elements.extend(parsed_chunk)
+        logger.extend(messages)
+        if logger.has_reached_max_errors():
+            break
+    raise_parsing_error_if_logger_has_messages(logger)
+    return parsed_elements
+
+
+def _parse_chunk_of_elements(
+    list_of_elements: List[Dict], method_to_parse_element: Callable, intern_strings: bool, max_errors: Optional[int]
+) -> Tuple[List[Any], List[str]]:
+    logger = Logger(max_errors)
+    parsed_elements = []
+    with string_interning(intern_strings):
+        for element_dict in list_of_elements:
+            if logger.has_reached_max_errors():
+                break
+            append_parsed_field_or_log_error(logger, parsed_elements, element_dict, method_to_parse_element)
+    return parsed_elements, logger.get_messages()
+
+
 def delete_duplicates_from_list(list_with_potential_duplicates: List[Any]) -> List[Any]:
     list_without_duplicates = list(dict.fromkeys(list_with_potential_duplicates))
     return list_without_duplicates
@@ -7,7 +7,7 @@ from spdx.model.extracted_licensing_info import ExtractedLicensingInfo
 from spdx.model.spdx_no_assertion import SpdxNoAssertion
 from spdx.parser.jsonlikedict.dict_parsing_functions import parse_field_or_no_assertion
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error
+from spdx.parser.parsing_functions import construct_or_raise_parsing_error, intern_string
 
 
 class ExtractedLicensingInfoParser:
@@ -18,7 +18,7 @@ class ExtractedLicensingInfoParser:
 
     @staticmethod
     def parse_extracted_licensing_info(extracted_licensing_info_dict: Dict) -> ExtractedLicensingInfo:
-        license_id: Optional[str] = extracted_licensing_info_dict.get("licenseId")
+        license_id: Optional[str] = intern_string(extracted_licensing_info_dict.get("licenseId"))
         extracted_text: Optional[str] = extracted_licensing_info_dict.get("extractedText")
         license_name: Optional[Union[str, SpdxNoAssertion]] = parse_field_or_no_assertion(
             extracted_licensing_info_dict.get("name")
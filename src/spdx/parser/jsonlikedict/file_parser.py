@@ -13,7 +13,11 @@ from spdx.parser.jsonlikedict.checksum_parser import ChecksumParser
 from spdx.parser.jsonlikedict.dict_parsing_functions import parse_field_or_log_error
 from spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
 
 
 class FileParser:
@@ -29,7 +33,7 @@ class FileParser:
     def parse_file(self, file_dict: Dict) -> Optional[File]:
         logger = Logger()
         name: Optional[str] = file_dict.get("fileName")
-        spdx_id: Optional[str] = file_dict.get("SPDXID")
+        spdx_id: Optional[str] = intern_string(file_dict.get("SPDXID"))
         checksums_list: List[Dict] = file_dict.get("checksums")
         checksums: List[Checksum] = parse_field_or_log_error(
             logger, checksums_list, self.checksum_parser.parse_checksum, field_is_list=True
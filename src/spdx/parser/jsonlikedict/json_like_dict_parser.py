@@ -1,20 +1,52 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from spdx.model.document import Document
+from spdx.model.annotation import Annotation
+from spdx.model.document import CreationInfo, Document
+from spdx.model.extracted_licensing_info import ExtractedLicensingInfo
+from spdx.model.file import File
+from spdx.model.file_table import FileTable
+from spdx.model.package import Package
+from spdx.model.relationship import Relationship
+from spdx.model.snippet import Snippet
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.jsonlikedict.annotation_parser import AnnotationParser
 from spdx.parser.jsonlikedict.creation_info_parser import CreationInfoParser
-from spdx.parser.jsonlikedict.dict_parsing_functions import parse_list_of_elements
+from spdx.parser.jsonlikedict.dict_parsing_functions import (
+    DEFAULT_PARALLEL_CHUNK_SIZE,
+    append_parsed_field_or_log_error,
+    parse_list_of_elements,
+    parse_list_of_elements_in_parallel,
+)
 from spdx.parser.jsonlikedict.extracted_licensing_info_parser import ExtractedLicensingInfoParser
 from spdx.parser.jsonlikedict.file_parser import FileParser
 from spdx.parser.jsonlikedict.package_parser import PackageParser
-from spdx.parser.jsonlikedict.relationship_parser import RelationshipParser
+from spdx.parser.jsonlikedict.relationship_parser import RelationshipKey, RelationshipParser, get_relationship_key
 from spdx.parser.jsonlikedict.snippet_parser import SnippetParser
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    get_skipped_sections,
+    raise_parsing_error_if_logger_has_messages,
+    string_interning,
+)
+
+# the top-level arrays whose elements can be parsed one at a time, see JsonLikeDictParser.iterate_elements()
+STREAMED_FIELDS = ["packages", "files", "snippets", "relationships"]
+
+DOCUMENT_FIELD_BY_ELEMENT_TYPE = {
+    Package: "packages",
+    File: "files",
+    Snippet: "snippets",
+    Relationship: "relationships",
+    Annotation: "annotations",
+    ExtractedLicensingInfo: "extracted_licensing_info",
+}
 
 
 class JsonLikeDictParser:
@@ -26,9 +58,37 @@ class JsonLikeDictParser:
     extracted_licensing_info_parser: ExtractedLicensingInfoParser
     relationship_parser: RelationshipParser
     annotation_parser: AnnotationParser
+    intern_strings: bool
+    file_table: bool
+    workers: int
+    chunk_size: int
+    skipped_sections: List[str]
 
-    def __init__(self):
-        self.logger = Logger()
+    def __init__(
+        self,
+        intern_strings: bool = True,
+        file_table: bool = False,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+        include: Optional[Collection[str]] = None,
+        max_errors: Optional[int] = None,
+    ):
+        """
+        workers: if greater than 1, parse() parses the packages, files, snippets and relationships in chunks of
+        chunk_size elements in a process pool of this size. The result and the error messages are the same as with
+        sequential parsing; only strings equal across chunks are no longer shared (see string_interning()).
+        include: the sections of the document to parse, e.g. {"packages", "relationships"}; the elements of all other
+        sections are neither parsed nor validated and the Document lists them in its skipped_sections. All sections
+        are parsed by default.
+        max_errors: stop parsing once this many errors have been found and raise them; 1 stops at the first error.
+        Unlimited by default.
+        """
+        self.logger = Logger(max_errors)
+        self.intern_strings = intern_strings
+        self.file_table = file_table
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.skipped_sections = get_skipped_sections(include)
         self.creation_info_parser = CreationInfoParser()
         self.package_parser = PackageParser()
         self.file_parser = FileParser()
@@ -36,30 +96,66 @@ class JsonLikeDictParser:
         self.extracted_licensing_info_parser = ExtractedLicensingInfoParser()
         self.relationship_parser = RelationshipParser()
         self.annotation_parser = AnnotationParser()
+        for parser in [
+            self.creation_info_parser,
+            self.package_parser,
+            self.file_parser,
+            self.snippet_parser,
+            self.extracted_licensing_info_parser,
+            self.relationship_parser,
+            self.annotation_parser,
+        ]:
+            parser.logger.max_errors = max_errors
 
     def parse(self, json_like_dict: Dict) -> Document:
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+            parse_elements = partial(
+                parse_list_of_elements_in_parallel,
+                executor=executor,
+                chunk_size=self.chunk_size,
+                intern_strings=self.intern_strings,
+            )
+        else:
+            executor = nullcontext()
+            parse_elements = parse_list_of_elements
+
+        with executor:
+            return self._parse(json_like_dict, parse_elements)
+
+    def _parse(self, json_like_dict: Dict, parse_elements: Callable) -> Document:
         fields_to_parse = [
             ("creation_info", json_like_dict, self.creation_info_parser.parse_creation_info, False),
             (
                 "packages",
                 json_like_dict.get("packages"),
-                lambda x: parse_list_of_elements(x, self.package_parser.parse_package, self.package_parser.logger),
+                lambda x: parse_elements(x, self.package_parser.parse_package, self.package_parser.logger),
                 True,
             ),
             (
                 "files",
                 json_like_dict.get("files"),
-                lambda x: parse_list_of_elements(x, self.file_parser.parse_file, self.file_parser.logger),
+                lambda x: parse_elements(
+                    x,
+                    self.file_parser.parse_file,
+                    self.file_parser.logger,
+                    FileTable() if self.file_table else None,
+                ),
                 True,
             ),
             ("annotations", json_like_dict, self.annotation_parser.parse_all_annotations, True),
             (
                 "snippets",
                 json_like_dict.get("snippets"),
-                lambda x: parse_list_of_elements(x, self.snippet_parser.parse_snippet, self.snippet_parser.logger),
+                lambda x: parse_elements(x, self.snippet_parser.parse_snippet, self.snippet_parser.logger),
+                True,
+            ),
+            (
+                "relationships",
+                json_like_dict,
+                lambda x: self.relationship_parser.parse_all_relationships(x, parse_elements),
                 True,
             ),
-            ("relationships", json_like_dict, self.relationship_parser.parse_all_relationships, True),
             (
                 "extracted_licensing_info",
                 json_like_dict.get("hasExtractedLicensingInfos"),
@@ -74,16 +170,129 @@ class JsonLikeDictParser:
 
         parsed_fields = {}
 
-        for argument_name, field, parsing_method, optional in fields_to_parse:
-            if optional and not field:
+        with string_interning(self.intern_strings):
+            for argument_name, field, parsing_method, optional in fields_to_parse:
+                if (optional and not field) or argument_name in self.skipped_sections:
+                    continue
+                try:
+                    parsed_fields[argument_name] = parsing_method(field)
+                except SPDXParsingError as err:
+                    self.logger.extend(err.get_messages())
+                if self.logger.has_reached_max_errors():
+                    break
+
+        raise_parsing_error_if_logger_has_messages(self.logger)
+
+        parsed_fields["skipped_sections"] = self.skipped_sections
+        document = construct_or_raise_parsing_error(Document, parsed_fields)
+
+        return document
+
+    def iterate_elements(self, entries: Iterable[Tuple[str, Any]]) -> Iterator[Any]:
+        """
+        Parses a document given as the sequence of its top-level (key, value) entries, in which the elements of the
+        STREAMED_FIELDS arrays appear one by one as (key, element) entries, as produced by a JsonStreamReader.
+        Packages, files, snippets and relationships are yielded as soon as they have been parsed. The CreationInfo,
+        the annotations, the relationships implied by documentDescribes and hasFiles and the extracted licensing
+        infos follow once all entries have been consumed, as they may depend on any part of the document.
+        Elements of skipped sections (see include) are not yielded.
+        All errors are collected and raised as one SPDXParsingError after the last element.
+        """
+        element_parsers = {
+            "packages": (self.package_parser.parse_package, self.package_parser.logger),
+            "files": (self.file_parser.parse_file, self.file_parser.logger),
+            "snippets": (self.snippet_parser.parse_snippet, self.snippet_parser.logger),
+            "relationships": (self.relationship_parser.parse_relationship, self.relationship_parser.logger),
+        }
+        document_fields = {}
+        # only the fields of the streamed elements that are needed after all entries have been read are kept
+        element_references = {"packages": [], "files": [], "snippets": []}
+        # the streamed relationships are not kept, only their keys for deduplicating the implied relationships
+        relationship_keys: Set[RelationshipKey] = set()
+        # one string table for all elements, see string_interning()
+        string_table = {}
+
+        for key, value in entries:
+            if self._has_reached_max_errors(logger for _, logger in element_parsers.values()):
+                break
+            if key not in element_parsers:
+                document_fields[key] = value
                 continue
+            parse_element, logger = element_parsers[key]
+            if key in self.skipped_sections:
+                parsed_elements = []
+            else:
+                with string_interning(self.intern_strings, string_table):
+                    parsed_elements = append_parsed_field_or_log_error(logger, [], value, parse_element)
+            if key in element_references and isinstance(value, dict):
+                reference = {field: value[field] for field in ["SPDXID", "annotations", "hasFiles"] if field in value}
+                if len(reference) > 1:
+                    element_references[key].append(reference)
+            elif key == "relationships":
+                relationship_keys.update(get_relationship_key(relationship) for relationship in parsed_elements)
+            yield from parsed_elements
+
+        with string_interning(self.intern_strings, string_table):
+            remaining_elements = self._parse_remaining_fields(document_fields, element_references, relationship_keys)
+        yield from remaining_elements
+
+        raise_parsing_error_if_logger_has_messages(self.logger)
+
+    def _has_reached_max_errors(self, loggers: Iterable[Logger]) -> bool:
+        max_errors = self.logger.max_errors
+        return max_errors is not None and sum(len(logger.messages) for logger in loggers) >= max_errors
+
+    def _parse_remaining_fields(
+        self, document_fields: Dict, element_references: Dict, relationship_keys: Set[RelationshipKey]
+    ) -> List[Any]:
+        # errors are logged in the same order as by parse()
+        remaining_elements = []
+        try:
+            remaining_elements.append(self.creation_info_parser.parse_creation_info(document_fields))
+        except SPDXParsingError as err:
+            self.logger.extend(err.get_messages())
+        for element_parser in [self.package_parser, self.file_parser]:
+            self.logger.extend(element_parser.logger.get_messages())
+        if "annotations" not in self.skipped_sections:
+            try:
+                remaining_elements.extend(
+                    self.annotation_parser.parse_all_annotations({**document_fields, **element_references})
+                )
+            except SPDXParsingError as err:
+                self.logger.extend(err.get_messages())
+        self.logger.extend(self.snippet_parser.logger.get_messages())
+        if "relationships" not in self.skipped_sections:
+            remaining_elements.extend(
+                self.relationship_parser.parse_implied_relationships(
+                    {**document_fields, "packages": element_references["packages"]}, relationship_keys
+                )
+            )
+        self.logger.extend(self.relationship_parser.logger.get_messages())
+        if (
+            document_fields.get("hasExtractedLicensingInfos")
+            and "extracted_licensing_info" not in self.skipped_sections
+        ):
             try:
-                parsed_fields[argument_name] = parsing_method(field)
+                remaining_elements.extend(
+                    parse_list_of_elements(
+                        document_fields["hasExtractedLicensingInfos"],
+                        self.extracted_licensing_info_parser.parse_extracted_licensing_info,
+                        self.extracted_licensing_info_parser.logger,
+                    )
+                )
             except SPDXParsingError as err:
                 self.logger.extend(err.get_messages())
 
-        raise_parsing_error_if_logger_has_messages(self.logger)
+        return remaining_elements
 
-        document = construct_or_raise_parsing_error(Document, parsed_fields)
+    def parse_entries(self, entries: Iterable[Tuple[str, Any]]) -> Document:
+        """Builds the Document from the top-level entries of a document, see iterate_elements()."""
+        parsed_fields = {"files": FileTable()} if self.file_table else {}
+        parsed_fields["skipped_sections"] = self.skipped_sections
+        for element in self.iterate_elements(entries):
+            if isinstance(element, CreationInfo):
+                parsed_fields["creation_info"] = element
+            else:
+                parsed_fields.setdefault(DOCUMENT_FIELD_BY_ELEMENT_TYPE[type(element)], []).append(element)
 
-        return document
+        return construct_or_raise_parsing_error(Document, parsed_fields)
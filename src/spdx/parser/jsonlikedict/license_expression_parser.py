@@ -3,11 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Union
 
-from license_expression import ExpressionError, LicenseExpression, Licensing
+from license_expression import ExpressionError, LicenseExpression
 
 from spdx.model.spdx_no_assertion import SpdxNoAssertion
 from spdx.model.spdx_none import SpdxNone
 from spdx.parser.error import SPDXParsingError
+from spdx.parser.license_expression_cache import parse_license_expression
 
 
 class LicenseExpressionParser:
@@ -20,7 +21,7 @@ class LicenseExpressionParser:
                 return SpdxNone()
 
         try:
-            license_expression = Licensing().parse(license_expression_str)
+            license_expression = parse_license_expression(license_expression_str)
         except ExpressionError as err:
             raise SPDXParsingError([f"Error parsing LicenseExpression: {err.args[0]}: {license_expression_str}"])
 
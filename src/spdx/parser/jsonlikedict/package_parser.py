@@ -22,14 +22,18 @@ from spdx.parser.error import SPDXParsingError
 from spdx.parser.jsonlikedict.checksum_parser import ChecksumParser
 from spdx.parser.jsonlikedict.dict_parsing_functions import (
     append_parsed_field_or_log_error,
-    json_str_to_enum_name,
+    json_str_to_enum,
     parse_field_or_log_error,
     parse_field_or_no_assertion,
     parse_field_or_no_assertion_or_none,
 )
 from spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
 
 
 class PackageParser:
@@ -47,7 +51,7 @@ class PackageParser:
     def parse_package(self, package_dict: Dict) -> Package:
         logger = Logger()
         name: Optional[str] = package_dict.get("name")
-        spdx_id: Optional[str] = package_dict.get("SPDXID")
+        spdx_id: Optional[str] = intern_string(package_dict.get("SPDXID"))
         attribution_texts: List[str] = package_dict.get("attributionTexts", [])
 
         built_date: Optional[datetime] = parse_field_or_log_error(
@@ -173,7 +177,7 @@ class PackageParser:
             logger, external_ref_dict.get("referenceCategory"), self.parse_external_ref_category
         )
         ref_locator: Optional[str] = external_ref_dict.get("referenceLocator")
-        ref_type: Optional[str] = external_ref_dict.get("referenceType")
+        ref_type: Optional[str] = intern_string(external_ref_dict.get("referenceType"))
         comment: Optional[str] = external_ref_dict.get("comment")
         raise_parsing_error_if_logger_has_messages(logger, "ExternalPackageRef")
         external_ref = construct_or_raise_parsing_error(
@@ -186,7 +190,7 @@ class PackageParser:
     @staticmethod
     def parse_external_ref_category(external_ref_category_str: str) -> ExternalPackageRefCategory:
         try:
-            external_ref_category = ExternalPackageRefCategory[json_str_to_enum_name(external_ref_category_str)]
+            external_ref_category = json_str_to_enum(external_ref_category_str, ExternalPackageRefCategory)
         except KeyError:
             raise SPDXParsingError([f"Invalid ExternalPackageRefCategory: {external_ref_category_str}"])
 
@@ -206,6 +210,6 @@ class PackageParser:
     @staticmethod
     def parse_primary_package_purpose(primary_package_purpose: str) -> PackagePurpose:
         try:
-            return PackagePurpose[json_str_to_enum_name(primary_package_purpose)]
+            return json_str_to_enum(primary_package_purpose, PackagePurpose)
         except KeyError:
             raise SPDXParsingError([f"Invalid PrimaryPackagePurpose: {primary_package_purpose}"])
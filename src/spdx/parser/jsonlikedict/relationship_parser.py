@@ -1,19 +1,33 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 from common.typing.constructor_type_errors import ConstructorTypeErrors
 from spdx.model.relationship import Relationship, RelationshipType
+from spdx.model.spdx_no_assertion import SpdxNoAssertion
+from spdx.model.spdx_none import SpdxNone
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.jsonlikedict.dict_parsing_functions import (
     delete_duplicates_from_list,
-    json_str_to_enum_name,
+    json_str_to_enum,
     parse_field_or_log_error,
     parse_field_or_no_assertion_or_none,
+    parse_list_of_elements,
 )
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
+
+# identifies a relationship regardless of its comment: (spdx_element_id, relationship_type, related_spdx_element_id)
+RelationshipKey = Tuple[str, RelationshipType, Union[str, SpdxNone, SpdxNoAssertion]]
+
+
+def get_relationship_key(relationship: Relationship) -> RelationshipKey:
+    return relationship.spdx_element_id, relationship.relationship_type, relationship.related_spdx_element_id
 
 
 class RelationshipParser:
@@ -22,35 +36,27 @@ class RelationshipParser:
     def __init__(self):
         self.logger = Logger()
 
-    def parse_all_relationships(self, input_doc_dict: Dict) -> List[Relationship]:
+    def parse_all_relationships(
+        self, input_doc_dict: Dict, parse_elements: Callable = parse_list_of_elements
+    ) -> List[Relationship]:
+        """
+        parse_elements: the function that parses the list of relationships, e.g. parse_list_of_elements_in_parallel()
+        with an executor.
+        """
         relationships = []
         relationship_dicts: List[Dict] = input_doc_dict.get("relationships", [])
-        relationships.extend(
-            parse_field_or_log_error(self.logger, relationship_dicts, self.parse_relationship, [], True)
-        )
-
-        document_describes: List[str] = delete_duplicates_from_list(input_doc_dict.get("documentDescribes", []))
-        doc_spdx_id: Optional[str] = input_doc_dict.get("SPDXID")
-
         relationships.extend(
             parse_field_or_log_error(
                 self.logger,
-                document_describes,
-                lambda x: self.parse_document_describes(
-                    doc_spdx_id=doc_spdx_id, described_spdx_ids=x, existing_relationships=relationships
-                ),
+                relationship_dicts,
+                lambda x: parse_elements(x, self.parse_relationship, Logger(self.logger.max_errors)),
                 [],
             )
         )
 
-        package_dicts: List[Dict] = input_doc_dict.get("packages", [])
-
         relationships.extend(
-            parse_field_or_log_error(
-                self.logger,
-                package_dicts,
-                lambda x: self.parse_has_files(package_dicts=x, existing_relationships=relationships),
-                [],
+            self.parse_implied_relationships(
+                input_doc_dict, {get_relationship_key(relationship) for relationship in relationships}
             )
         )
 
@@ -65,11 +71,45 @@ class RelationshipParser:
 
         return relationships
 
+    def parse_implied_relationships(
+        self, input_doc_dict: Dict, existing_relationship_keys: Set[RelationshipKey]
+    ) -> List[Relationship]:
+        """
+        Parses the relationships given by the document's documentDescribes and the packages' hasFiles fields, except
+        for those whose keys (see get_relationship_key()) are contained in existing_relationship_keys. Only the fields
+        "SPDXID", "documentDescribes" and "packages" (of which only "SPDXID" and "hasFiles" are read) of input_doc_dict
+        are used.
+        """
+        document_describes: List[str] = delete_duplicates_from_list(input_doc_dict.get("documentDescribes", []))
+        doc_spdx_id: Optional[str] = intern_string(input_doc_dict.get("SPDXID"))
+
+        describes_relationships = parse_field_or_log_error(
+            self.logger,
+            document_describes,
+            lambda x: self._parse_document_describes(doc_spdx_id, x, existing_relationship_keys),
+            [],
+        )
+
+        package_dicts: List[Dict] = input_doc_dict.get("packages", [])
+
+        contains_relationships = parse_field_or_log_error(
+            self.logger,
+            package_dicts,
+            lambda x: self._parse_has_files(
+                x,
+                existing_relationship_keys
+                | {get_relationship_key(relationship) for relationship in describes_relationships},
+            ),
+            [],
+        )
+
+        return describes_relationships + contains_relationships
+
     def parse_relationship(self, relationship_dict: Dict) -> Relationship:
         logger = Logger()
-        spdx_element_id: Optional[str] = relationship_dict.get("spdxElementId")
+        spdx_element_id: Optional[str] = intern_string(relationship_dict.get("spdxElementId"))
         related_spdx_element: Optional[str] = parse_field_or_no_assertion_or_none(
-            relationship_dict.get("relatedSpdxElement")
+            relationship_dict.get("relatedSpdxElement"), intern_string
         )
         relationship_type: Optional[RelationshipType] = parse_field_or_log_error(
             logger, relationship_dict.get("relationshipType"), self.parse_relationship_type
@@ -91,27 +131,36 @@ class RelationshipParser:
     @staticmethod
     def parse_relationship_type(relationship_type_str: str) -> RelationshipType:
         try:
-            relationship_type = RelationshipType[json_str_to_enum_name(relationship_type_str)]
+            relationship_type = json_str_to_enum(relationship_type_str, RelationshipType)
         except KeyError:
             raise SPDXParsingError([f"Invalid RelationshipType: {relationship_type_str}"])
         return relationship_type
 
     def parse_document_describes(
         self, doc_spdx_id: str, described_spdx_ids: List[str], existing_relationships: List[Relationship]
+    ) -> List[Relationship]:
+        return self._parse_document_describes(
+            doc_spdx_id,
+            described_spdx_ids,
+            {get_relationship_key(relationship) for relationship in existing_relationships},
+        )
+
+    def _parse_document_describes(
+        self, doc_spdx_id: str, described_spdx_ids: List[str], existing_relationship_keys: Set[RelationshipKey]
     ) -> List[Relationship]:
         logger = Logger()
         describes_relationships = []
         for spdx_id in described_spdx_ids:
             try:
-                describes_relationship = Relationship(
+                describes_relationship = Relationship._from_trusted(
                     spdx_element_id=doc_spdx_id,
                     relationship_type=RelationshipType.DESCRIBES,
-                    related_spdx_element_id=spdx_id,
+                    related_spdx_element_id=intern_string(spdx_id),
                 )
             except ConstructorTypeErrors as err:
                 logger.append(err.get_messages())
                 continue
-            if not self.check_if_relationship_exists(describes_relationship, existing_relationships):
+            if not self.check_if_relationship_exists(describes_relationship, existing_relationship_keys):
                 describes_relationships.append(describes_relationship)
         raise_parsing_error_if_logger_has_messages(logger, "document describes relationships")
 
@@ -119,26 +168,33 @@ class RelationshipParser:
 
     def parse_has_files(
         self, package_dicts: List[Dict], existing_relationships: List[Relationship]
+    ) -> List[Relationship]:
+        return self._parse_has_files(
+            package_dicts, {get_relationship_key(relationship) for relationship in existing_relationships}
+        )
+
+    def _parse_has_files(
+        self, package_dicts: List[Dict], existing_relationship_keys: Set[RelationshipKey]
     ) -> List[Relationship]:
         logger = Logger()
         contains_relationships = []
         for package in package_dicts:
-            package_spdx_id: Optional[str] = package.get("SPDXID")
+            package_spdx_id: Optional[str] = intern_string(package.get("SPDXID"))
             contained_files: List[str] = delete_duplicates_from_list(package.get("hasFiles", []))
             if not contained_files:
                 continue
             for file_spdx_id in contained_files:
                 try:
-                    contains_relationship = Relationship(
+                    contains_relationship = Relationship._from_trusted(
                         spdx_element_id=package_spdx_id,
                         relationship_type=RelationshipType.CONTAINS,
-                        related_spdx_element_id=file_spdx_id,
+                        related_spdx_element_id=intern_string(file_spdx_id),
                     )
                 except ConstructorTypeErrors as err:
                     logger.append(err.get_messages())
                     continue
                 if not self.check_if_relationship_exists(
-                    relationship=contains_relationship, existing_relationships=existing_relationships
+                    relationship=contains_relationship, existing_relationship_keys=existing_relationship_keys
                 ):
                     contains_relationships.append(contains_relationship)
         raise_parsing_error_if_logger_has_messages(logger, "package contains relationships")
@@ -146,39 +202,22 @@ class RelationshipParser:
         return contains_relationships
 
     def check_if_relationship_exists(
-        self, relationship: Relationship, existing_relationships: List[Relationship]
+        self, relationship: Relationship, existing_relationship_keys: Set[RelationshipKey]
     ) -> bool:
-        existing_relationships_without_comments: List[Relationship] = self.get_all_relationships_without_comments(
-            existing_relationships
-        )
-        if relationship in existing_relationships_without_comments:
+        relationship_key = get_relationship_key(relationship)
+        if relationship_key in existing_relationship_keys:
             return True
-        relationship_inverted: Relationship = self.invert_relationship(relationship)
-        if relationship_inverted in existing_relationships_without_comments:
+        spdx_element_id, relationship_type, related_spdx_element_id = relationship_key
+        relationship_inverted_key = (
+            related_spdx_element_id,
+            self.invert_relationship_types[relationship_type],
+            spdx_element_id,
+        )
+        if relationship_inverted_key in existing_relationship_keys:
             return True
 
         return False
 
-    @staticmethod
-    def get_all_relationships_without_comments(existing_relationships: List[Relationship]) -> List[Relationship]:
-        relationships_without_comments = [
-            Relationship(
-                relationship_type=relationship.relationship_type,
-                related_spdx_element_id=relationship.related_spdx_element_id,
-                spdx_element_id=relationship.spdx_element_id,
-            )
-            for relationship in existing_relationships
-        ]
-        return relationships_without_comments
-
-    def invert_relationship(self, relationship: Relationship) -> Relationship:
-        return Relationship(
-            related_spdx_element_id=relationship.spdx_element_id,
-            spdx_element_id=relationship.related_spdx_element_id,
-            relationship_type=self.invert_relationship_types[relationship.relationship_type],
-            comment=relationship.comment,
-        )
-
     invert_relationship_types = {
         RelationshipType.DESCRIBES: RelationshipType.DESCRIBED_BY,
         RelationshipType.DESCRIBED_BY: RelationshipType.DESCRIBES,
@@ -13,7 +13,7 @@ from spdx.parser.error import SPDXParsingError
 from spdx.parser.jsonlikedict.dict_parsing_functions import parse_field_or_log_error
 from spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error
+from spdx.parser.parsing_functions import construct_or_raise_parsing_error, intern_string
 
 
 class RangeType(Enum):
@@ -31,8 +31,8 @@ class SnippetParser:
 
     def parse_snippet(self, snippet_dict: Dict) -> Snippet:
         logger = Logger()
-        spdx_id: Optional[str] = snippet_dict.get("SPDXID")
-        file_spdx_id: Optional[str] = snippet_dict.get("snippetFromFile")
+        spdx_id: Optional[str] = intern_string(snippet_dict.get("SPDXID"))
+        file_spdx_id: Optional[str] = intern_string(snippet_dict.get("snippetFromFile"))
         name: Optional[str] = snippet_dict.get("name")
 
         ranges: Dict = parse_field_or_log_error(logger, snippet_dict.get("ranges", []), self.parse_ranges, default={})
@@ -124,7 +124,7 @@ class SnippetParser:
 
     @staticmethod
     def convert_range_from_str(
-        _range: Tuple[Union[int, str], Union[int, str]]
+        _range: Tuple[Union[int, str], Union[int, str]],
     ) -> Tuple[Union[int, str], Union[int, str]]:
         # XML does not support integers, so we have to convert from string (if possible)
         if not _range:
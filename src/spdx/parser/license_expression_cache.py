@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from license_expression import LicenseExpression, Licensing
+from license_expression import get_spdx_licensing as build_spdx_licensing
+
+LICENSE_EXPRESSION_CACHE_SIZE = 4096
+
+_licensing = Licensing()
+
+
+@lru_cache(maxsize=None)
+def get_spdx_licensing() -> Licensing:
+    """
+    Returns a Licensing instance that knows the SPDX license and exception symbols. Unlike
+    license_expression.get_spdx_licensing(), which loads the license index again on every call, the instance is built
+    only once and shared.
+    """
+    return build_spdx_licensing()
+
+
+def parse_license_expression(expression: str) -> Optional[LicenseExpression]:
+    """
+    Parses the expression with a plain Licensing instance, i.e. without normalizing the symbols to the SPDX license
+    list. The least recently used expressions are cached, so repeated expressions return the same shared object:
+    callers must not modify it. Raises license_expression.ExpressionError for invalid expressions.
+    """
+    if type(expression) is not str:
+        return _licensing.parse(expression)
+    return _parse_license_expression(expression)
+
+
+def parse_spdx_license_expression(expression: str) -> Optional[LicenseExpression]:
+    """Like parse_license_expression(), but uses the symbols of the SPDX license list (see get_spdx_licensing())."""
+    if type(expression) is not str:
+        return get_spdx_licensing().parse(expression)
+    return _parse_spdx_license_expression(expression)
+
+
+@lru_cache(maxsize=LICENSE_EXPRESSION_CACHE_SIZE)
+def _parse_license_expression(expression: str) -> Optional[LicenseExpression]:
+    return _licensing.parse(expression)
+
+
+@lru_cache(maxsize=LICENSE_EXPRESSION_CACHE_SIZE)
+def _parse_spdx_license_expression(expression: str) -> Optional[LicenseExpression]:
+    return get_spdx_licensing().parse(expression)
+
+
+def get_license_expression_cache_info() -> Dict[str, Any]:
+    """
+    Returns the statistics of the license expression caches as functools' CacheInfo tuples (hits, misses, maxsize,
+    currsize), e.g. to tune the cache size.
+    """
+    return {
+        "license_expressions": _parse_license_expression.cache_info(),
+        "spdx_license_expressions": _parse_spdx_license_expression.cache_info(),
+    }
+
+
+def clear_license_expression_caches():
+    _parse_license_expression.cache_clear()
+    _parse_spdx_license_expression.cache_clear()
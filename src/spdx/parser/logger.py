@@ -1,23 +1,38 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import List
+from typing import List, Optional
 
 
 class Logger:
     messages: List[str]
+    max_errors: Optional[int]
 
-    def __init__(self):
+    def __init__(self, max_errors: Optional[int] = None):
+        """
+        max_errors: the number of messages after which further messages are discarded. Parsers check
+        has_reached_max_errors() to stop parsing early. Unlimited by default; must be at least 1 otherwise.
+        """
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, not {max_errors}")
         self.messages = []
+        self.max_errors = max_errors
 
     def append(self, message: str):
-        self.messages.append(message)
+        if not self.has_reached_max_errors():
+            self.messages.append(message)
 
     def extend(self, messages_to_append: List[str]):
-        self.messages.extend(messages_to_append)
+        if self.max_errors is None:
+            self.messages.extend(messages_to_append)
+        else:
+            self.messages.extend(messages_to_append[: max(self.max_errors - len(self.messages), 0)])
 
     def has_messages(self):
         return bool(self.messages)
 
+    def has_reached_max_errors(self) -> bool:
+        return self.max_errors is not None and len(self.messages) >= self.max_errors
+
     def get_messages(self):
         return list(self.messages)
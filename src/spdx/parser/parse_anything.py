@@ -8,6 +8,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Collection, Optional
+
 from spdx.formats import FileFormat, file_name_to_format
 from spdx.parser.json import json_parser
 from spdx.parser.rdf import rdf_parser
@@ -16,15 +18,48 @@ from spdx.parser.xml import xml_parser
 from spdx.parser.yaml import yaml_parser
 
 
-def parse_file(file_name: str):
+def parse_file(
+    file_name: str,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+    fail_fast: bool = False,
+):
+    """
+    Parses the SPDX document in the given file; the format is determined by the file extension.
+    intern_strings: share one string object between all equal SPDX IDs, license IDs and similar values of the
+    document (on by default).
+    file_table: store the files of the document in a columnar FileTable instead of a list of File objects, which
+    needs considerably less memory for documents with many files (off by default).
+    include: the sections of the document to parse, e.g. {"packages", "relationships"}: the names of the list fields
+    of Document (see spdx.parser.parsing_functions.DOCUMENT_SECTIONS). The elements of all other sections are neither
+    built nor validated, and the returned Document lists them in its skipped_sections. By default, all sections are
+    parsed. The creation info is always parsed.
+    max_errors: stop parsing once this many errors have been found and raise them in an SPDXParsingError instead of
+    collecting all errors of the document (the default).
+    fail_fast: stop parsing at the first error, i.e. max_errors=1.
+    """
+    if fail_fast:
+        max_errors = 1
     input_format = file_name_to_format(file_name)
     if input_format == FileFormat.RDF_XML:
-        return rdf_parser.parse_from_file(file_name)
+        return rdf_parser.parse_from_file(
+            file_name, intern_strings, file_table, include=include, max_errors=max_errors
+        )
     elif input_format == FileFormat.TAG_VALUE:
-        return tagvalue_parser.parse_from_file(file_name)
+        return tagvalue_parser.parse_from_file(
+            file_name, intern_strings, file_table, include=include, max_errors=max_errors
+        )
     elif input_format == FileFormat.JSON:
-        return json_parser.parse_from_file(file_name)
+        return json_parser.parse_from_file(
+            file_name, intern_strings, file_table, include=include, max_errors=max_errors
+        )
     elif input_format == FileFormat.XML:
-        return xml_parser.parse_from_file(file_name)
+        return xml_parser.parse_from_file(
+            file_name, intern_strings, file_table, include=include, max_errors=max_errors
+        )
     elif input_format == FileFormat.YAML:
-        return yaml_parser.parse_from_file(file_name)
+        return yaml_parser.parse_from_file(
+            file_name, intern_strings, file_table, include=include, max_errors=max_errors
+        )
@@ -1,16 +1,21 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Any, Dict
+import threading
+from contextlib import contextmanager
+from typing import Any, Collection, Dict, List, Optional
 
 from common.typing.constructor_type_errors import ConstructorTypeErrors
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.logger import Logger
 
+# the list fields of a Document that can be excluded from parsing; the creation info is always parsed
+DOCUMENT_SECTIONS = ["packages", "files", "snippets", "annotations", "relationships", "extracted_licensing_info"]
+
 
 def construct_or_raise_parsing_error(object_to_construct: Any, args_for_construction: Dict) -> Any:
     try:
-        constructed_object = object_to_construct(**args_for_construction)
+        constructed_object = object_to_construct._from_trusted(**args_for_construction)
     except ConstructorTypeErrors as err:
         raise SPDXParsingError([f"Error while constructing {object_to_construct.__name__}: {err.get_messages()}"])
     except TypeError as err:
@@ -24,3 +29,55 @@ def raise_parsing_error_if_logger_has_messages(logger: Logger, parsed_object_nam
             raise SPDXParsingError([f"Error while parsing {parsed_object_name}: {logger.get_messages()}"])
         else:
             raise SPDXParsingError(logger.get_messages())
+
+
+def get_skipped_sections(include: Optional[Collection[str]]) -> List[str]:
+    """
+    Returns the DOCUMENT_SECTIONS that are not contained in include, in their order in the Document. If include is
+    None, all sections are parsed and none is skipped.
+    """
+    if include is None:
+        return []
+    unknown_sections = set(include) - set(DOCUMENT_SECTIONS) - {"creation_info"}
+    if unknown_sections:
+        raise ValueError(
+            f"Unknown document sections {sorted(unknown_sections)}, choose from {', '.join(DOCUMENT_SECTIONS)}"
+        )
+    return [section for section in DOCUMENT_SECTIONS if section not in include]
+
+
+_interning_state = threading.local()
+
+
+@contextmanager
+def string_interning(enabled: bool = True, table: Optional[Dict[Any, Any]] = None):
+    """
+    Provides a string table for the duration of a parse. While it is active, intern_string() returns one shared object
+    for all equal strings, so that e.g. an SPDX ID referenced by an element, its relationships and annotations is only
+    stored once in the resulting document. The table also holds the actors shared within the document (see
+    ActorParser.get_interned_actor()). Nested contexts use the table (or the opt-out) of the outermost one.
+    table: the table to fill instead of a new one. Parsers that yield elements one at a time enter a context for each
+    of them with the same table, so that strings are shared across the whole document.
+    """
+    if getattr(_interning_state, "active", False):
+        yield
+        return
+    _interning_state.active = True
+    _interning_state.table = (table if table is not None else {}) if enabled else None
+    try:
+        yield
+    finally:
+        _interning_state.active = False
+        _interning_state.table = None
+
+
+def get_interning_table() -> Optional[Dict[Any, Any]]:
+    """Returns the table of the active string_interning() context, or None if there is none or interning is off."""
+    return getattr(_interning_state, "table", None)
+
+
+def intern_string(value: Any) -> Any:
+    table = get_interning_table()
+    if table is None or type(value) is not str:
+        return value
+    return table.setdefault(value, value)
@@ -3,7 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from rdflib import BNode, Graph
 
-from spdx.model.checksum import Checksum, ChecksumAlgorithm
+from spdx.model.checksum import BinaryChecksum, Checksum, ChecksumAlgorithm
+from spdx.parser.enum_lookup import RDF_ENUM_VALUE_LOOKUP
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.logger import Logger
 from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
@@ -19,12 +20,18 @@ def parse_checksum(parent_node: BNode, graph: Graph) -> Checksum:
     value = parse_literal(logger, graph, parent_node, SPDX_NAMESPACE.checksumValue)
 
     raise_parsing_error_if_logger_has_messages(logger, "Checksum")
-    checksum = construct_or_raise_parsing_error(Checksum, dict(algorithm=algorithm, value=value))
+    checksum = BinaryChecksum.from_hex(algorithm, value) or construct_or_raise_parsing_error(
+        Checksum, dict(algorithm=algorithm, value=value)
+    )
     return checksum
 
 
 def convert_rdf_to_algorithm(algorithm: str) -> ChecksumAlgorithm:
-    algorithm = remove_prefix(algorithm, SPDX_NAMESPACE.checksumAlgorithm_).upper()
+    algorithm = remove_prefix(algorithm, SPDX_NAMESPACE.checksumAlgorithm_)
+    checksum_algorithm = RDF_ENUM_VALUE_LOOKUP[ChecksumAlgorithm].get(algorithm)
+    if checksum_algorithm is not None:
+        return checksum_algorithm
+    algorithm = algorithm.upper()
     if "BLAKE2B" in algorithm:
         algorithm = algorithm.replace("BLAKE2B", "BLAKE2B_")
     try:
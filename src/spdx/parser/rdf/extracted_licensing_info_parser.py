@@ -5,7 +5,11 @@ from rdflib import RDFS, Graph, URIRef
 
 from spdx.model.extracted_licensing_info import ExtractedLicensingInfo
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
 from spdx.parser.rdf.graph_parsing_functions import (
     get_correctly_typed_triples,
     parse_literal,
@@ -40,7 +44,7 @@ def parse_extracted_licensing_info(
     extracted_licensing_info = construct_or_raise_parsing_error(
         ExtractedLicensingInfo,
         dict(
-            license_id=license_id,
+            license_id=intern_string(license_id),
             extracted_text=extracted_text,
             comment=comment,
             license_name=license_name,
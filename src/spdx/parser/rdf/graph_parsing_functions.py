@@ -12,8 +12,10 @@ from rdflib.term import BNode, Literal, Node
 from spdx.casing_tools import camel_case_to_snake_case
 from spdx.model.spdx_no_assertion import SPDX_NO_ASSERTION_STRING, SpdxNoAssertion
 from spdx.model.spdx_none import SPDX_NONE_STRING, SpdxNone
+from spdx.parser.enum_lookup import RDF_ENUM_VALUE_LOOKUP
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.logger import Logger
+from spdx.parser.parsing_functions import intern_string
 from spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
@@ -77,8 +79,12 @@ def get_unique_value(logger: Logger, graph: Graph, subject: Node, predicate: Nod
 
 
 def parse_enum_value(enum_str: str, enum_class: Type[Enum], prefix: str) -> Enum:
+    enum_without_rdf_prefix = remove_prefix(enum_str, prefix)
+    # values that are spelled like the writer spells them do not need to be converted
+    enum_value = RDF_ENUM_VALUE_LOOKUP.get(enum_class, {}).get(enum_without_rdf_prefix)
+    if enum_value is not None:
+        return enum_value
     try:
-        enum_without_rdf_prefix = remove_prefix(enum_str, prefix)
         value = camel_case_to_snake_case(enum_without_rdf_prefix).upper()
         return enum_class[value]
     except KeyError:
@@ -89,11 +95,11 @@ def parse_spdx_id(resource: URIRef, doc_namespace: str, graph: Graph) -> Optiona
     if not resource:
         return None
     if resource.startswith(f"{doc_namespace}#"):
-        return resource.fragment
+        return intern_string(resource.fragment)
     if "#" in resource:
         namespace_manager = NamespaceManager(graph)
-        return namespace_manager.normalizeUri(resource)
-    return resource.toPython() or None
+        return intern_string(namespace_manager.normalizeUri(resource))
+    return intern_string(resource.toPython()) or None
 
 
 # Python 3.9 introduced the method removeprefix() for strings, but as we are also supporting Python 3.7 and 3.8 we need
@@ -3,10 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Optional, Union
 
-from license_expression import LicenseExpression, get_spdx_licensing
+from license_expression import LicenseExpression
 from rdflib import RDF, Graph
 from rdflib.term import BNode, Identifier, Node, URIRef
 
+from spdx.parser.license_expression_cache import parse_spdx_license_expression
 from spdx.parser.logger import Logger
 from spdx.parser.rdf.graph_parsing_functions import get_value_from_graph, remove_prefix
 from spdx.rdfschema.namespace import LICENSE_NAMESPACE, SPDX_NAMESPACE
@@ -20,14 +21,13 @@ def parse_license_expression(
 ) -> LicenseExpression:
     if not logger:
         logger = Logger()
-    spdx_licensing = get_spdx_licensing()
     expression = ""
     if license_expression_node.startswith(LICENSE_NAMESPACE):
         expression = remove_prefix(license_expression_node, LICENSE_NAMESPACE)
-        return spdx_licensing.parse(expression)
+        return parse_spdx_license_expression(expression)
     if license_expression_node.startswith(doc_namespace):
         expression = license_expression_node.fragment
-        return spdx_licensing.parse(expression)
+        return parse_spdx_license_expression(expression)
 
     node_type = graph.value(license_expression_node, RDF.type)
     if node_type == SPDX_NAMESPACE.ConjunctiveLicenseSet:
@@ -51,7 +51,7 @@ def parse_license_expression(
         )
         expression = f"{license_expression} WITH {exception}"
 
-    return spdx_licensing.parse(expression)
+    return parse_spdx_license_expression(expression)
 
 
 def parse_license_exception(exception_node: Identifier, graph: Graph, logger) -> str:
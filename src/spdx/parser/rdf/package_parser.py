@@ -16,7 +16,11 @@ from spdx.model.package import (
 )
 from spdx.parser.actor_parser import ActorParser
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+)
 from spdx.parser.rdf.checksum_parser import parse_checksum
 from spdx.parser.rdf.graph_parsing_functions import (
     get_correctly_typed_triples,
@@ -185,7 +189,7 @@ def parse_external_package_ref(external_package_ref_node: BNode, graph: Graph, d
         graph,
         external_package_ref_node,
         SPDX_NAMESPACE.referenceType,
-        parsing_method=lambda x: parse_external_package_ref_type(x, doc_namespace),
+        parsing_method=lambda x: intern_string(parse_external_package_ref_type(x, doc_namespace)),
     )
     comment = parse_literal(logger, graph, external_package_ref_node, RDFS.comment)
 
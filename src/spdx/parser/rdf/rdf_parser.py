@@ -1,15 +1,21 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Any, Dict
+from typing import Any, Collection, Dict, Optional
 
 from rdflib import RDF, Graph
 
 from spdx.model.document import Document
+from spdx.model.file_table import FileTable
 from spdx.model.relationship import RelationshipType
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    construct_or_raise_parsing_error,
+    get_skipped_sections,
+    raise_parsing_error_if_logger_has_messages,
+    string_interning,
+)
 from spdx.parser.rdf.annotation_parser import parse_annotation
 from spdx.parser.rdf.creation_info_parser import parse_creation_info
 from spdx.parser.rdf.extracted_licensing_info_parser import parse_extracted_licensing_info
@@ -21,77 +27,117 @@ from spdx.parser.rdf.snippet_parser import parse_snippet
 from spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
-def parse_from_file(file_name: str) -> Document:
+def parse_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+) -> Document:
     graph = Graph()
     with open(file_name) as file:
         graph.parse(file, format="xml")
 
-    document: Document = translate_graph_to_document(graph)
+    document: Document = translate_graph_to_document(graph, intern_strings, file_table, include, max_errors)
     return document
 
 
-def translate_graph_to_document(graph: Graph) -> Document:
-    parsed_fields: Dict[str, Any] = dict()
-    logger = Logger()
-    try:
-        creation_info, doc_node = parse_creation_info(graph)
-    except SPDXParsingError as err:
-        logger.extend(err.get_messages())
-        creation_info = None
+def translate_graph_to_document(
+    graph: Graph,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+) -> Document:
+    """
+    include: the sections of the document to parse, e.g. {"packages", "relationships"}; the elements of all other
+    sections are not parsed and the Document lists them in its skipped_sections. All sections are parsed by default.
+    max_errors: stop parsing once this many errors have been found and raise them; 1 stops at the first error.
+    Unlimited by default.
+    """
+    skipped_sections = get_skipped_sections(include)
+    with string_interning(intern_strings):
+        parsed_fields: Dict[str, Any] = {"skipped_sections": skipped_sections}
+        logger = Logger(max_errors)
+        try:
+            creation_info, doc_node = parse_creation_info(graph)
+        except SPDXParsingError as err:
+            logger.extend(err.get_messages())
+            creation_info = None
 
-    parsed_fields["creation_info"] = creation_info
+        parsed_fields["creation_info"] = creation_info
 
-    for element, triple, parsing_method in [
-        ("packages", (None, RDF.type, SPDX_NAMESPACE.Package), parse_package),
-        ("files", (None, RDF.type, SPDX_NAMESPACE.File), parse_file),
-        ("snippets", (None, RDF.type, SPDX_NAMESPACE.Snippet), parse_snippet),
-    ]:
-        elements = []
-        for element_node, _, _ in get_correctly_typed_triples(logger, graph, *triple):
-            try:
-                elements.append(parsing_method(element_node, graph, creation_info.document_namespace))
-            except SPDXParsingError as err:
-                logger.extend(err.get_messages())
-        parsed_fields[element] = elements
+        for element, triple, parsing_method in [
+            ("packages", (None, RDF.type, SPDX_NAMESPACE.Package), parse_package),
+            ("files", (None, RDF.type, SPDX_NAMESPACE.File), parse_file),
+            ("snippets", (None, RDF.type, SPDX_NAMESPACE.Snippet), parse_snippet),
+        ]:
+            if element in skipped_sections:
+                continue
+            elements = FileTable() if element == "files" and file_table else []
+            for element_node, _, _ in get_correctly_typed_triples(logger, graph, *triple):
+                if logger.has_reached_max_errors():
+                    break
+                try:
+                    elements.append(parsing_method(element_node, graph, creation_info.document_namespace))
+                except SPDXParsingError as err:
+                    logger.extend(err.get_messages())
+            parsed_fields[element] = elements
 
-    for element, triple, parsing_method in [
-        ("annotations", (None, SPDX_NAMESPACE.annotation, None), parse_annotation),
-        ("relationships", (None, SPDX_NAMESPACE.relationship, None), parse_relationship),
-    ]:
-        elements = []
-        for parent_node, _, element_node in graph.triples(triple):
-            try:
-                elements.append(parsing_method(element_node, graph, parent_node, creation_info.document_namespace))
-            except SPDXParsingError as err:
-                logger.extend(err.get_messages())
-        parsed_fields[element] = elements
+        for element, triple, parsing_method in [
+            ("annotations", (None, SPDX_NAMESPACE.annotation, None), parse_annotation),
+            ("relationships", (None, SPDX_NAMESPACE.relationship, None), parse_relationship),
+        ]:
+            if element in skipped_sections:
+                continue
+            elements = []
+            for parent_node, _, element_node in graph.triples(triple):
+                if logger.has_reached_max_errors():
+                    break
+                try:
+                    elements.append(parsing_method(element_node, graph, parent_node, creation_info.document_namespace))
+                except SPDXParsingError as err:
+                    logger.extend(err.get_messages())
+            parsed_fields[element] = elements
 
-    for triple, relationship_type in [
-        ((None, SPDX_NAMESPACE.hasFile, None), RelationshipType.CONTAINS),
-        ((None, SPDX_NAMESPACE.describesPackage, None), RelationshipType.DESCRIBES),
-    ]:
-        for parent_node, _, element_node in get_correctly_typed_triples(logger, graph, *triple):
-            try:
-                relationship = parse_implicit_relationship(
-                    parent_node, relationship_type, element_node, graph, creation_info.document_namespace
-                )
-                if relationship not in parsed_fields["relationships"]:
-                    parsed_fields["relationships"].append(relationship)
+        if "relationships" not in skipped_sections:
+            # implicit relationships that duplicate an explicit one are dropped, looked up by hash instead of comparing
+            # them to every relationship parsed so far
+            known_relationships = set(parsed_fields["relationships"])
+            for triple, relationship_type in [
+                ((None, SPDX_NAMESPACE.hasFile, None), RelationshipType.CONTAINS),
+                ((None, SPDX_NAMESPACE.describesPackage, None), RelationshipType.DESCRIBES),
+            ]:
+                for parent_node, _, element_node in get_correctly_typed_triples(logger, graph, *triple):
+                    if logger.has_reached_max_errors():
+                        break
+                    try:
+                        relationship = parse_implicit_relationship(
+                            parent_node, relationship_type, element_node, graph, creation_info.document_namespace
+                        )
+                        if relationship not in known_relationships:
+                            known_relationships.add(relationship)
+                            parsed_fields["relationships"].append(relationship)
 
-            except SPDXParsingError as err:
-                logger.extend(err.get_messages())
+                    except SPDXParsingError as err:
+                        logger.extend(err.get_messages())
 
-    extracted_licensing_infos = []
-    for _, _, extracted_licensing_info_node in get_correctly_typed_triples(
-        logger, graph, None, SPDX_NAMESPACE.hasExtractedLicensingInfo
-    ):
-        try:
-            extracted_licensing_infos.append(
-                parse_extracted_licensing_info(extracted_licensing_info_node, graph, creation_info.document_namespace)
-            )
-        except SPDXParsingError as err:
-            logger.extend(err.get_messages())
-    parsed_fields["extracted_licensing_info"] = extracted_licensing_infos
+        extracted_licensing_infos = []
+        if "extracted_licensing_info" not in skipped_sections:
+            for _, _, extracted_licensing_info_node in get_correctly_typed_triples(
+                logger, graph, None, SPDX_NAMESPACE.hasExtractedLicensingInfo
+            ):
+                if logger.has_reached_max_errors():
+                    break
+                try:
+                    extracted_licensing_infos.append(
+                        parse_extracted_licensing_info(
+                            extracted_licensing_info_node, graph, creation_info.document_namespace
+                        )
+                    )
+                except SPDXParsingError as err:
+                    logger.extend(err.get_messages())
+        parsed_fields["extracted_licensing_info"] = extracted_licensing_infos
 
     raise_parsing_error_if_logger_has_messages(logger)
     document = construct_or_raise_parsing_error(Document, parsed_fields)
@@ -8,12 +8,13 @@ from ply.yacc import YaccProduction
 
 from spdx.casing_tools import camel_case_to_snake_case
 from spdx.model.annotation import Annotation
-from spdx.model.checksum import Checksum, ChecksumAlgorithm
+from spdx.model.checksum import BinaryChecksum, Checksum, ChecksumAlgorithm
 from spdx.model.document import CreationInfo
 from spdx.model.extracted_licensing_info import ExtractedLicensingInfo
 from spdx.model.file import File
 from spdx.model.package import Package
 from spdx.model.snippet import Snippet
+from spdx.parser.enum_lookup import ENUM_VALUE_LOOKUP
 from spdx.parser.error import SPDXParsingError
 
 
@@ -41,9 +42,11 @@ def parse_checksum(checksum_str: str) -> Checksum:
     # The lexer and the corresponding regex for the token CHECKSUM and EXT_DOC_REF_CHECKSUM ensure that the passed
     # checksum_str is formatted in the way that the following lines of code can't cause an error.
     algorithm, value = checksum_str.split(":")
-    algorithm = ChecksumAlgorithm[algorithm.upper().replace("-", "_")]
+    algorithm = (
+        ENUM_VALUE_LOOKUP[ChecksumAlgorithm].get(algorithm) or ChecksumAlgorithm[algorithm.upper().replace("-", "_")]
+    )
     value = value.strip()
-    checksum = Checksum(algorithm, value)
+    checksum = BinaryChecksum.from_hex(algorithm, value) or Checksum._from_trusted(algorithm, value)
     return checksum
 
 
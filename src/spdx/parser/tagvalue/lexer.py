@@ -11,8 +11,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+from typing import Generator, Iterator, Optional, Tuple
+
 from ply import lex
-from ply.lex import TOKEN
+from ply.lex import TOKEN, LexToken
+
+CHECKSUM_ALGORITHMS = (
+    "ADLER32",
+    "BLAKE2b-256",
+    "BLAKE2b-384",
+    "BLAKE2b-512",
+    "BLAKE3",
+    "MD2",
+    "MD4",
+    "MD5",
+    "MD6",
+    "SHA1",
+    "SHA224",
+    "SHA256",
+    "SHA384",
+    "SHA512",
+    "SHA3-256",
+    "SHA3-384",
+    "SHA3-512",
+)
+ACTOR_VALUE_TYPES = (("Tool:", "TOOL_VALUE"), ("Organization:", "ORGANIZATION_VALUE"), ("Person:", "PERSON_VALUE"))
+ISO8601_DATE_PATTERN = re.compile(r"\d\d\d\d-\d\d-\d\dT\d\d:\d\d:\d\dZ")
 
 
 class SPDXLexer:
@@ -120,6 +145,10 @@ class SPDXLexer:
     def t_text(self, t):
         t.lexer.text_start = t.lexer.lexpos - len("<text>")
         t.lexer.begin("text")
+        # skip the content of the text block in one step instead of matching t_text_any for every single character;
+        # without a closing tag, the rest of the input is consumed as before
+        text_end = t.lexer.lexdata.find("</text>", t.lexer.lexpos)
+        t.lexer.lexpos = text_end if text_end != -1 else t.lexer.lexlen
 
     @TOKEN(r"</text>\s*")
     def t_text_end(self, t):
@@ -137,10 +166,7 @@ class SPDXLexer:
     def t_text_error(self, t):
         print("Lexer error in text state")
 
-    @TOKEN(
-        r":\s*(ADLER32|BLAKE2b-256|BLAKE2b-384|BLAKE2b-512|BLAKE3|MD2|MD4|MD5|MD6|SHA1|SHA224|SHA256|SHA384|SHA512|"
-        r"SHA3-256|SHA3-384|SHA3-512):\s*([a-f0-9]*)"
-    )
+    @TOKEN(r":\s*(" + "|".join(CHECKSUM_ALGORITHMS) + r"):\s*([a-f0-9]*)")
     def t_CHECKSUM(self, t):
         t.value = t.value[1:].strip()
         return t
@@ -198,10 +224,161 @@ class SPDXLexer:
     def token(self):
         return self.lexer.token()
 
+    def current_line_number(self) -> int:
+        return self.lexer.lineno
+
+    def is_inside_text_block(self) -> bool:
+        return self.lexer.current_state() == "text"
+
     def input(self, data):
+        # a new input starts at the first line and outside of any <text> block, also when the lexer is reused
+        self.lexer.lineno = 1
+        self.lexer.begin("INITIAL")
         self.lexer.input(data)
 
     def t_error(self, t):
         t.lexer.skip(1)
         t.value = "Lexer error"
         return t
+
+
+class SPDXLineLexer:
+    """
+    Produces the same tokens as SPDXLexer, but splits the input into lines instead of matching every token with ply's
+    master regex: tags are looked up in SPDXLexer.reserved and values are classified by their prefix. Lines that
+    don't have the plain "Tag: value" form (e.g. a tag without a value or invalid characters) are passed to the given
+    ply-based lexer, which has to be built already, until it reaches the end of a line.
+    """
+
+    def __init__(self, fallback_lexer: SPDXLexer):
+        self.fallback_lexer = fallback_lexer
+        self.tokens: Iterator[LexToken] = iter(())
+        self.line_number = 1
+        self.inside_text_block = False
+
+    def current_line_number(self) -> int:
+        return self.line_number
+
+    def is_inside_text_block(self) -> bool:
+        return self.inside_text_block
+
+    def input(self, data: str):
+        self.fallback_lexer.input(data)
+        self.tokens = self.generate_tokens(data)
+        self.line_number = 1
+        self.inside_text_block = False
+
+    def token(self) -> Optional[LexToken]:
+        return next(self.tokens, None)
+
+    def generate_tokens(self, data: str) -> Generator[LexToken, None, None]:
+        reserved = SPDXLexer.reserved
+        data_length = len(data)
+        position = 0
+        line_number = 1
+        while position < data_length:
+            if data[position] == "\n":
+                line_number += 1
+                position += 1
+                continue
+
+            line_end = data.find("\n", position)
+            if line_end == -1:
+                line_end = data_length
+            content = data[position:line_end].lstrip(" \t")
+            if not content or content[0] == "#":
+                # empty lines and comments don't produce tokens
+                position = line_end
+                continue
+
+            head, colon, rest = content.partition(":")
+            tag = head.rstrip(" \t")
+            value = rest.lstrip(" \t")
+            if colon and tag.isascii() and tag.isalpha() and value and not value[0].isspace():
+                tag_token = make_token(reserved.get(tag, "UNKNOWN_TAG"), tag, line_number, line_end - len(content))
+                if value.startswith("<text>"):
+                    yield tag_token
+                    text_start = line_end - len(value)
+                    text_end = data.find("</text>", text_start)
+                    if text_end == -1:
+                        # like SPDXLexer, an unclosed text block consumes the rest of the input
+                        self.inside_text_block = True
+                        self.line_number = line_number
+                        return
+                    position = text_end + len("</text>")
+                    while position < data_length and data[position].isspace():
+                        position += 1
+                    text = data[text_start:position]
+                    yield make_token("TEXT", text.strip(), line_number, text_end)
+                    line_number += text.count("\n")
+                    if position == data_length or data[position - 1] == "\n":
+                        continue
+                else:
+                    value_type_and_value = classify_value(value, rest)
+                    if value_type_and_value:
+                        yield tag_token
+                        yield make_token(*value_type_and_value, line_number, line_end - len(rest) - 1)
+                        # continue directly with the next line
+                        position = line_end + 1
+                        if position <= data_length:
+                            line_number += 1
+                        continue
+
+            position, line_number = yield from self.generate_fallback_tokens(data, position, line_number)
+
+        self.line_number = line_number
+
+    def generate_fallback_tokens(
+        self, data: str, position: int, line_number: int
+    ) -> Generator[LexToken, None, Tuple[int, int]]:
+        lexer = self.fallback_lexer.lexer
+        lexer.lexpos = position
+        lexer.lineno = line_number
+        lexer.begin("INITIAL")
+        while True:
+            token = lexer.token()
+            if token is None:
+                self.inside_text_block = self.fallback_lexer.is_inside_text_block()
+                return len(data), lexer.lineno
+            yield token
+            position = lexer.lexpos
+            if lexer.current_state() == "INITIAL" and (
+                position >= len(data) or data[position] == "\n" or data[position - 1] == "\n"
+            ):
+                return position, lexer.lineno
+
+
+def make_token(token_type: str, value: str, line_number: int, position: int) -> LexToken:
+    token = LexToken()
+    token.type = token_type
+    token.value = value
+    token.lineno = line_number
+    token.lexpos = position
+    return token
+
+
+def classify_value(value: str, rest: str) -> Optional[Tuple[str, str]]:
+    """
+    Returns the token type and value that SPDXLexer produces for the part of a line after the colon that follows the
+    tag, or None if this doesn't result in exactly one token. value is rest without its leading spaces and tabs.
+    """
+    algorithm, colon, checksum = value.partition(":")
+    if colon and algorithm in CHECKSUM_ALGORITHMS:
+        checksum = checksum.strip(" \t")
+        if checksum and not checksum.strip("0123456789abcdef"):
+            return "CHECKSUM", value.rstrip(" \t")
+        return None
+
+    for prefix, value_type in ACTOR_VALUE_TYPES:
+        if value.startswith(prefix):
+            if len(value) == len(prefix):
+                return None
+            return value_type, rest.strip()
+
+    if value[0].isdecimal() and ISO8601_DATE_PATTERN.match(value):
+        if value[20:].strip(" \t"):
+            return None
+        return "ISO8601_DATE", value[:20]
+
+    value = rest.strip()
+    return SPDXLexer.reserved.get(value, "LINE"), value
@@ -12,10 +12,10 @@
 # limitations under the License.
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Union
 
-from license_expression import get_spdx_licensing
 from ply import yacc
+from ply.lex import LexToken
 from ply.yacc import LRParser
 
 from spdx.datetime_conversions import datetime_from_str
@@ -24,6 +24,7 @@ from spdx.model.document import CreationInfo, Document
 from spdx.model.external_document_ref import ExternalDocumentRef
 from spdx.model.extracted_licensing_info import ExtractedLicensingInfo
 from spdx.model.file import File, FileType
+from spdx.model.file_table import FileTable
 from spdx.model.package import (
     ExternalPackageRef,
     ExternalPackageRefCategory,
@@ -38,8 +39,16 @@ from spdx.model.spdx_none import SpdxNone
 from spdx.model.version import Version
 from spdx.parser.actor_parser import ActorParser
 from spdx.parser.error import SPDXParsingError
+from spdx.parser.license_expression_cache import parse_spdx_license_expression
 from spdx.parser.logger import Logger
-from spdx.parser.parsing_functions import construct_or_raise_parsing_error, raise_parsing_error_if_logger_has_messages
+from spdx.parser.parsing_functions import (
+    DOCUMENT_SECTIONS,
+    construct_or_raise_parsing_error,
+    get_skipped_sections,
+    intern_string,
+    raise_parsing_error_if_logger_has_messages,
+    string_interning,
+)
 from spdx.parser.tagvalue.helper_methods import (
     TAG_DATA_MODEL_FIELD,
     grammar_rule,
@@ -47,7 +56,7 @@ from spdx.parser.tagvalue.helper_methods import (
     set_value,
     str_from_text,
 )
-from spdx.parser.tagvalue.lexer import SPDXLexer
+from spdx.parser.tagvalue.lexer import SPDXLexer, SPDXLineLexer
 
 CLASS_MAPPING = dict(
     File="files",
@@ -65,6 +74,23 @@ ELEMENT_EXPECTED_START_TAG = dict(
     Package="PackageName",
     ExtractedLicensingInfo="LicenseID",
 )
+PARSE_TABLE_MODULE = "spdx.parser.tagvalue.parsetab"
+# A streamed document is split into segments of at least MIN_SEGMENT_LENGTH characters right before the lines that
+# start an element; the elements are yielded after each segment, see iterate_elements().
+MIN_SEGMENT_LENGTH = 1 << 14
+ELEMENT_START_PATTERN = re.compile(r"\n[ \t]*(?:" + "|".join(ELEMENT_EXPECTED_START_TAG.values()) + r")[ \t]*:")
+# A segment may only end with one of these tokens, as they complete the preceding tag.
+SEGMENT_END_TOKEN_TYPES = {
+    "TEXT",
+    "LINE",
+    "TOOL_VALUE",
+    "ORGANIZATION_VALUE",
+    "PERSON_VALUE",
+    "ISO8601_DATE",
+    "CHECKSUM",
+    "NO_ASSERTION",
+    "NONE",
+}
 
 
 class Parser:
@@ -73,18 +99,69 @@ class Parser:
     current_element: Dict[str, Any]
     creation_info: Dict[str, Any]
     elements_built: Dict[str, Any]
-    lex: SPDXLexer
+    lex: Union[SPDXLexer, SPDXLineLexer]
     yacc: LRParser
-
-    def __init__(self, **kwargs):
+    skipped_sections: List[str]
+    preceding_package_spdx_id: Optional[str]
+    contains_relationships: Set[Relationship]
+
+    def __init__(
+        self,
+        intern_strings: bool = True,
+        file_table: bool = False,
+        include: Optional[Collection[str]] = None,
+        max_errors: Optional[int] = None,
+        line_lexer: bool = False,
+        **kwargs,
+    ):
+        """
+        include: the sections of the document to build, e.g. {"packages", "relationships"}; the elements of all other
+        sections are still read, but neither constructed nor validated, and the Document lists them in its
+        skipped_sections. All sections are built by default.
+        max_errors: stop parsing once this many errors have been found and raise them; 1 stops at the first error.
+        Unlimited by default.
+        line_lexer: tokenize the input line by line with SPDXLineLexer instead of matching every token with ply's
+        regex-based SPDXLexer. Both produce the same tokens.
+        """
         self.tokens = SPDXLexer.tokens
-        self.logger = Logger()
+        self.regex_lexer = SPDXLexer()
+        self.regex_lexer.build(reflags=re.UNICODE)
+        self.line_lexer = SPDXLineLexer(self.regex_lexer)
+        self.reset(intern_strings, file_table, include, max_errors, line_lexer)
+        # The LALR tables are loaded from the shipped parsetab module. If they don't match the grammar (e.g. after
+        # changing a grammar rule), ply rebuilds them in memory; regenerate the module with Parser(write_tables=True).
+        kwargs = {**dict(tabmodule=PARSE_TABLE_MODULE, write_tables=False, debug=False), **kwargs}
+        self.yacc = yacc.yacc(module=self, **kwargs)
+
+    def reset(
+        self,
+        intern_strings: bool = True,
+        file_table: bool = False,
+        include: Optional[Collection[str]] = None,
+        max_errors: Optional[int] = None,
+        line_lexer: bool = False,
+    ):
+        """
+        Discards the state of the previous parse, so that the parser, together with its lexer and LALR tables, can be
+        reused for the next document. The arguments are the same as for the constructor.
+        """
+        # the lexers would otherwise keep the text of the previous document alive
+        self.regex_lexer.input("")
+        self.line_lexer.input("")
+        self.lex = self.line_lexer if line_lexer else self.regex_lexer
+        self.intern_strings = intern_strings
+        self.file_table = file_table
+        self.skipped_sections = get_skipped_sections(include)
+        self.preceding_package_spdx_id = None
+        # the CONTAINS relationships built so far, kept even after iterate_elements() has yielded them; a set, so
+        # that checking each file's implied relationship against them doesn't scan all of them
+        self.contains_relationships = set()
+        self.logger = Logger(max_errors)
         self.current_element = {"logger": Logger()}
         self.creation_info = {"logger": Logger()}
         self.elements_built = dict()
-        self.lex = SPDXLexer()
-        self.lex.build(reflags=re.UNICODE)
-        self.yacc = yacc.yacc(module=self, **kwargs)
+        if file_table:
+            self.elements_built["files"] = FileTable()
 
     @grammar_rule("start : start attrib ")
     def p_start_start_attrib(self, p):
@@ -166,7 +243,7 @@ class Parser:
 
     @grammar_rule(
         "license_name : LICENSE_NAME line_or_no_assertion\n extracted_text : LICENSE_TEXT text_or_line\n "
-        "lic_comment : LICENSE_COMMENT text_or_line\n license_id : LICENSE_ID LINE\n "
+        "lic_comment : LICENSE_COMMENT text_or_line\n "
         "file_name : FILE_NAME LINE \n file_notice : FILE_NOTICE text_or_line\n "
         "file_copyright_text : FILE_COPYRIGHT_TEXT line_or_no_assertion_or_none\n "
         "file_license_comment : FILE_LICENSE_COMMENT text_or_line\n "
@@ -183,13 +260,11 @@ class Parser:
         "pkg_file_name : PKG_FILE_NAME LINE\n "
         "pkg_license_concluded : PKG_LICENSE_CONCLUDED license_or_no_assertion_or_none\n "
         "package_version : PKG_VERSION LINE\n pkg_license_comment : PKG_LICENSE_COMMENT text_or_line\n "
-        "snippet_spdx_id : SNIPPET_SPDX_ID LINE\n snippet_name : SNIPPET_NAME LINE\n "
+        "snippet_name : SNIPPET_NAME LINE\n "
         "snippet_comment : SNIPPET_COMMENT text_or_line\n "
         "snippet_copyright_text : SNIPPET_COPYRIGHT_TEXT line_or_no_assertion_or_none\n "
         "snippet_license_comment : SNIPPET_LICENSE_COMMENT text_or_line\n "
-        "file_spdx_id : SNIPPET_FILE_SPDXID LINE\n "
         "snippet_license_concluded : SNIPPET_LICENSE_CONCLUDED license_or_no_assertion_or_none\n "
-        "annotation_spdx_id : ANNOTATION_SPDX_ID LINE\n "
         "annotation_comment : ANNOTATION_COMMENT text_or_line"
     )
     def p_generic_value(self, p):
@@ -198,6 +273,17 @@ class Parser:
         if self.check_that_current_element_matches_class_for_value(TAG_DATA_MODEL_FIELD[p[1]][0], p.lineno(1)):
             set_value(p, self.current_element)
 
+    @grammar_rule(
+        "license_id : LICENSE_ID LINE\n snippet_spdx_id : SNIPPET_SPDX_ID LINE\n "
+        "file_spdx_id : SNIPPET_FILE_SPDXID LINE\n annotation_spdx_id : ANNOTATION_SPDX_ID LINE"
+    )
+    def p_id_value(self, p):
+        # identifiers are usually referenced multiple times throughout the document, so we intern them
+        if p[1] in ELEMENT_EXPECTED_START_TAG.values():
+            self.initialize_new_current_element(TAG_DATA_MODEL_FIELD[p[1]][0])
+        if self.check_that_current_element_matches_class_for_value(TAG_DATA_MODEL_FIELD[p[1]][0], p.lineno(1)):
+            set_value(p, self.current_element, method_to_apply=intern_string)
+
     @grammar_rule(
         "unknown_tag : UNKNOWN_TAG text_or_line\n | UNKNOWN_TAG ISO8601_DATE\n | UNKNOWN_TAG PERSON_VALUE \n"
         "| UNKNOWN_TAG"
@@ -226,7 +312,7 @@ class Parser:
 
     @grammar_rule("license_or_no_assertion_or_none : LINE")
     def p_license(self, p):
-        p[0] = get_spdx_licensing().parse(p[1])
+        p[0] = parse_spdx_license_expression(p[1])
 
     @grammar_rule("actor_or_no_assertion : PERSON_VALUE\n | ORGANIZATION_VALUE")
     def p_actor_values(self, p):
@@ -238,9 +324,9 @@ class Parser:
         # We assume that to be the first spdx_id we encounter. As the specification does not explicitly require this,
         # our approach might lead to unwanted behavior when the document's SPDX Id is defined later in the document.
         if "spdx_id" in self.creation_info:
-            self.current_element["spdx_id"] = p[2]
+            self.current_element["spdx_id"] = intern_string(p[2])
         else:
-            self.creation_info["spdx_id"] = p[2]
+            self.creation_info["spdx_id"] = intern_string(p[2])
 
     # parsing methods for creation info / document level
 
@@ -371,7 +457,12 @@ class Parser:
         try:
             external_package_ref = construct_or_raise_parsing_error(
                 ExternalPackageRef,
-                {"category": category, "reference_type": reference_type, "locator": locator, "comment": comment},
+                {
+                    "category": category,
+                    "reference_type": intern_string(reference_type),
+                    "locator": locator,
+                    "comment": comment,
+                },
             )
         except SPDXParsingError as err:
             self.current_element["logger"].append(err.get_messages())
@@ -411,7 +502,7 @@ class Parser:
         excluded_files = None
         if match.group(verif_code_exc_files_grp):
             excluded_files = match.group(verif_code_exc_files_grp).split(",")
-        self.current_element["verification_code"] = PackageVerificationCode(value, excluded_files)
+        self.current_element["verification_code"] = PackageVerificationCode._from_trusted(value, excluded_files)
 
     @grammar_rule("files_analyzed : PKG_FILES_ANALYZED LINE")
     def p_pkg_files_analyzed(self, p):
@@ -504,8 +595,8 @@ class Parser:
             related_spdx_element_id = SpdxNone()
         if related_spdx_element_id == "NOASSERTION":
             related_spdx_element_id = SpdxNoAssertion()
-        self.current_element["related_spdx_element_id"] = related_spdx_element_id
-        self.current_element["spdx_element_id"] = spdx_element_id
+        self.current_element["related_spdx_element_id"] = intern_string(related_spdx_element_id)
+        self.current_element["spdx_element_id"] = intern_string(spdx_element_id)
         if len(p) == 5:
             self.current_element["comment"] = p[4]
 
@@ -514,10 +605,11 @@ class Parser:
 
     def parse(self, text):
         # entry point for the tag-value parser
-        self.yacc.parse(text, lexer=self.lex)
-        # this constructs the last remaining element; all other elements are constructed at the start of
-        # their subsequent element
-        self.construct_current_element()
+        with string_interning(self.intern_strings):
+            self.yacc.parse(text, lexer=self.lex, tokenfunc=self.next_token)
+            # this constructs the last remaining element; all other elements are constructed at the start of
+            # their subsequent element
+            self.construct_current_element()
 
         # To be able to parse creation info values if they appear in between other elements, e.g. packages, we use
         # two different dictionaries to collect the creation info and all other elements. Therefore, we have a separate
@@ -530,9 +622,131 @@ class Parser:
         raise_parsing_error_if_logger_has_messages(self.logger)
         creation_info = construct_or_raise_parsing_error(CreationInfo, self.creation_info)
         self.elements_built["creation_info"] = creation_info
+        self.elements_built["skipped_sections"] = self.skipped_sections
         document = construct_or_raise_parsing_error(Document, self.elements_built)
         return document
 
+    def iterate_elements(self, chunks: Iterable[str]) -> Iterator[Any]:
+        """
+        Parses a document that is given as a sequence of consecutive pieces of its text, e.g. the blocks read from a
+        file, without holding the whole text or document in memory. The text is parsed in segments of roughly
+        MIN_SEGMENT_LENGTH characters that end right before the start tag of an element; after each segment, the
+        elements that are complete, i.e. whose successor has started, are yielded. The CreationInfo follows after the
+        last element.
+        Elements of skipped sections (see include) are not yielded.
+        All errors are collected and raised as one SPDXParsingError after the last element.
+        """
+        self.elements_built = dict()
+        chunks = iter(chunks)
+        # the unparsed text starts at segment_start of the buffer, which begins at position_offset of the document
+        buffer = ""
+        segment_start = 0
+        search_start = 0
+        all_chunks_read = False
+        line_offset = 0
+        position_offset = 0
+        # one string table for all segments, see string_interning()
+        string_table = {}
+        while not self.logger.has_reached_max_errors():
+            match = ELEMENT_START_PATTERN.search(buffer, search_start)
+            if match:
+                segment_end = match.start() + 1
+            elif all_chunks_read:
+                segment_end = len(buffer)
+            else:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    all_chunks_read = True
+                else:
+                    # a match can't contain a line break after its first character, so it starts at or after the
+                    # last line break that has been searched already
+                    search_start = max(search_start, buffer.rfind("\n")) - segment_start
+                    buffer = buffer[segment_start:] + chunk
+                    position_offset += segment_start
+                    segment_start = 0
+                continue
+
+            tokens = self.tokenize(buffer[segment_start:segment_end], line_offset, position_offset + segment_start)
+            if segment_end < len(buffer):
+                if self.lex.is_inside_text_block():
+                    # the segment would end within a text block: continue the search after the end of the block
+                    text_end = buffer.find("</text>", segment_end)
+                    search_start = text_end if text_end != -1 else max(segment_end, buffer.rfind("\n"))
+                    continue
+                if tokens and tokens[-1].type not in SEGMENT_END_TOKEN_TYPES:
+                    # the last tag of the segment has no value, so parsing the segment on its own might give a
+                    # different result: extend it to the next element
+                    search_start = segment_end
+                    continue
+
+            if tokens:
+                with string_interning(self.intern_strings, string_table):
+                    self.parse_tokens(tokens)
+                yield from self.pop_elements_built()
+            if all_chunks_read and segment_end == len(buffer):
+                break
+            line_offset += self.lex.current_line_number() - 1
+            segment_start = segment_end
+            search_start = segment_end + MIN_SEGMENT_LENGTH
+
+        # this constructs the last remaining element, see parse()
+        with string_interning(self.intern_strings, string_table):
+            self.construct_current_element()
+        yield from self.pop_elements_built()
+
+        creation_info_logger = self.creation_info.pop("logger")
+        if creation_info_logger.has_messages():
+            self.logger.extend([f"Error while parsing CreationInfo: {creation_info_logger.get_messages()}"])
+        raise_parsing_error_if_logger_has_messages(self.logger)
+        yield construct_or_raise_parsing_error(CreationInfo, self.creation_info)
+
+    def parse_stream(self, chunks: Iterable[str]) -> Document:
+        """Builds the Document from the consecutive pieces of its text, see iterate_elements()."""
+        elements_by_section = {"files": FileTable()} if self.file_table else {}
+        elements_by_section["skipped_sections"] = self.skipped_sections
+        for element in self.iterate_elements(chunks):
+            if isinstance(element, CreationInfo):
+                elements_by_section["creation_info"] = element
+            else:
+                elements_by_section.setdefault(CLASS_MAPPING[type(element).__name__], []).append(element)
+
+        return construct_or_raise_parsing_error(Document, elements_by_section)
+
+    def tokenize(self, text: str, line_offset: int, position_offset: int) -> List[LexToken]:
+        # the tokens of a segment of a streamed document, with the line numbers and positions in the whole document
+        self.lex.input(text)
+        tokens = []
+        token = self.lex.token()
+        while token is not None:
+            token.lineno += line_offset
+            token.lexpos += position_offset
+            tokens.append(token)
+            token = self.lex.token()
+        return tokens
+
+    def parse_tokens(self, tokens: List[LexToken]):
+        token_iterator = iter(tokens)
+
+        def next_token():
+            # ending the input once the error limit is reached stops the parser
+            if self.logger.has_reached_max_errors():
+                return None
+            return next(token_iterator, None)
+
+        self.yacc.parse(lexer=self.lex, tokenfunc=next_token)
+
+    def pop_elements_built(self) -> List[Any]:
+        elements = []
+        for section in DOCUMENT_SECTIONS:
+            elements.extend(self.elements_built.pop(section, []))
+        return elements
+
+    def next_token(self):
+        # ending the input once the error limit is reached stops the parser
+        if self.logger.has_reached_max_errors():
+            return None
+        return self.lex.token()
+
     def initialize_new_current_element(self, clazz: Any):
         self.construct_current_element()
         self.current_element["class"] = clazz
@@ -554,11 +768,23 @@ class Parser:
             return
 
         clazz = self.current_element.pop("class")
+        section = CLASS_MAPPING[clazz.__name__]
+        if section in self.skipped_sections:
+            # the element is not constructed, but the relationships implied by its position are still needed
+            if clazz == Package:
+                self.preceding_package_spdx_id = self.current_element.get("spdx_id")
+            elif clazz == File and "spdx_id" in self.current_element:
+                self.check_for_preceding_package_and_build_contains_relationship()
+            self.current_element = {"logger": Logger()}
+            return
         try:
             raise_parsing_error_if_logger_has_messages(self.current_element.pop("logger"), clazz.__name__)
-            self.elements_built.setdefault(CLASS_MAPPING[clazz.__name__], []).append(
-                construct_or_raise_parsing_error(clazz, self.current_element)
-            )
+            element = construct_or_raise_parsing_error(clazz, self.current_element)
+            self.elements_built.setdefault(section, []).append(element)
+            if clazz == Package:
+                self.preceding_package_spdx_id = element.spdx_id
+            if clazz == Relationship and element.relationship_type == RelationshipType.CONTAINS:
+                self.contains_relationships.add(element)
             if clazz == File:
                 self.check_for_preceding_package_and_build_contains_relationship()
         except SPDXParsingError as err:
@@ -567,13 +793,14 @@ class Parser:
 
     def check_for_preceding_package_and_build_contains_relationship(self):
         file_spdx_id = self.current_element["spdx_id"]
-        if "packages" not in self.elements_built:
+        if self.preceding_package_spdx_id is None or "relationships" in self.skipped_sections:
             return
         # We assume that all files that are not contained in a package precede any package information. Any file
         # information that follows any package information is assigned to the last parsed package by creating a
         # corresponding contains relationship.
         # (see https://spdx.github.io/spdx-spec/v2.3/composition-of-an-SPDX-document/#5.2.2)
-        package_spdx_id = self.elements_built["packages"][-1].spdx_id
-        relationship = Relationship(package_spdx_id, RelationshipType.CONTAINS, file_spdx_id)
-        if relationship not in self.elements_built.setdefault("relationships", []):
-            self.elements_built["relationships"].append(relationship)
+        package_spdx_id = self.preceding_package_spdx_id
+        relationship = Relationship._from_trusted(package_spdx_id, RelationshipType.CONTAINS, file_spdx_id)
+        if relationship not in self.contains_relationships:
+            self.contains_relationships.add(relationship)
+            self.elements_built.setdefault("relationships", []).append(relationship)
@@ -1,13 +1,85 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from functools import partial
+from typing import Any, Collection, Iterator, List, Optional
+
 from spdx.model.document import Document
 from spdx.parser.tagvalue.parser import Parser
 
+# the number of characters read at once when streaming a file
+STREAM_READ_SIZE = 1 << 16
+
+# Parsers that are not in use. Reusing them avoids building the lexer and loading the LALR tables for every file; as
+# a Parser keeps the state of the document it is parsing, each one is only used by one caller at a time. Parsers are
+# reset before they are put back, and at most MAX_IDLE_PARSERS are kept.
+MAX_IDLE_PARSERS = 4
+_idle_parsers: List[Parser] = []
+
 
-def parse_from_file(file_name: str) -> Document:
-    parser = Parser()
-    with open(file_name) as file:
-        data = file.read()
-    document: Document = parser.parse(data)
+def parse_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+    line_lexer: bool = False,
+    streaming: bool = False,
+) -> Document:
+    """
+    streaming: read the file incrementally instead of loading it as a whole before parsing, so that the peak memory
+    is mostly the parsed document (see parse_elements_from_file()).
+    """
+    parser = _get_idle_parser(intern_strings, file_table, include, max_errors, line_lexer)
+    try:
+        with open(file_name) as file:
+            if streaming:
+                return parser.parse_stream(iter(partial(file.read, STREAM_READ_SIZE), ""))
+            data = file.read()
+        document: Document = parser.parse(data)
+    finally:
+        _release_parser(parser)
     return document
+
+
+def parse_elements_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+    line_lexer: bool = False,
+) -> Iterator[Any]:
+    """
+    Reads the file incrementally and yields its packages, files, snippets, annotations, relationships and extracted
+    licensing infos one at a time while they are read, followed by the CreationInfo (see Parser.iterate_elements()).
+    The whole document is never held in memory, so arbitrarily large documents can be processed element by element.
+    Errors are raised as one SPDXParsingError after the last element.
+    """
+    parser = _get_idle_parser(intern_strings, False, include, max_errors, line_lexer)
+    try:
+        with open(file_name) as file:
+            yield from parser.iterate_elements(iter(partial(file.read, STREAM_READ_SIZE), ""))
+    finally:
+        _release_parser(parser)
+
+
+def _get_idle_parser(
+    intern_strings: bool,
+    file_table: bool,
+    include: Optional[Collection[str]],
+    max_errors: Optional[int],
+    line_lexer: bool,
+) -> Parser:
+    try:
+        parser = _idle_parsers.pop()
+    except IndexError:
+        return Parser(intern_strings, file_table, include, max_errors, line_lexer)
+    parser.reset(intern_strings, file_table, include, max_errors, line_lexer)
+    return parser
+
+
+def _release_parser(parser: Parser):
+    # drops the state of the parsed document, which would otherwise be kept alive by the pool
+    parser.reset()
+    if len(_idle_parsers) < MAX_IDLE_PARSERS:
+        _idle_parsers.append(parser)
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Any, Dict
+from typing import Any, Collection, Dict, Optional
 
 import xmltodict
 
@@ -37,7 +37,14 @@ LIST_LIKE_FIELDS = [
 ]
 
 
-def parse_from_file(file_name: str) -> Document:
+def parse_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    workers: int = 1,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+) -> Document:
     with open(file_name) as file:
         parsed_xml: Dict = xmltodict.parse(file.read(), encoding="utf-8")
 
@@ -46,7 +53,9 @@ def parse_from_file(file_name: str) -> Document:
     if not input_doc_as_dict:
         raise SPDXParsingError(['Did not find the XML top level tag "Document".'])
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+    return JsonLikeDictParser(intern_strings, file_table, workers, include=include, max_errors=max_errors).parse(
+        input_doc_as_dict
+    )
 
 
 def _fix_list_like_fields(data: Any) -> Any:
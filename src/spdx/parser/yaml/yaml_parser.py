@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict
+from typing import Collection, Dict, Optional
 
 import yaml
 
@@ -9,8 +9,17 @@ from spdx.model.document import Document
 from spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
 
 
-def parse_from_file(file_name: str) -> Document:
+def parse_from_file(
+    file_name: str,
+    intern_strings: bool = True,
+    file_table: bool = False,
+    workers: int = 1,
+    include: Optional[Collection[str]] = None,
+    max_errors: Optional[int] = None,
+) -> Document:
     with open(file_name) as file:
         input_doc_as_dict: Dict = yaml.safe_load(file)
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+    return JsonLikeDictParser(intern_strings, file_table, workers, include=include, max_errors=max_errors).parse(
+        input_doc_as_dict
+    )
@@ -5,7 +5,7 @@
 import re
 from typing import Dict, List
 
-from spdx.model.checksum import Checksum, ChecksumAlgorithm
+from spdx.model.checksum import BinaryChecksum, Checksum, ChecksumAlgorithm
 from spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
 # in hexadecimal digits
@@ -55,6 +55,10 @@ def validate_checksum(checksum: Checksum, parent_id: str, spdx_version: str) ->
     ]:
         return [ValidationMessage(f"{checksum.algorithm.name} is not supported in SPDX-2.2", context)]
 
+    if isinstance(checksum, BinaryChecksum):
+        # length and charset have already been checked on creation
+        return validation_messages
+
     if not re.match("^[0-9a-f]{" + algorithm_length[algorithm] + "}$", checksum.value):
         if algorithm == ChecksumAlgorithm.BLAKE3:
             length = "at least 256"
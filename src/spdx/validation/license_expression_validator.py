@@ -32,7 +32,7 @@ def validate_license_expression(
     parent_id: str,
     context: ValidationContext = None,
 ) -> List[ValidationMessage]:
-    if license_expression in [SpdxNoAssertion(), SpdxNone(), None]:
+    if license_expression is None or isinstance(license_expression, (SpdxNoAssertion, SpdxNone)):
         return []
 
     if not context:
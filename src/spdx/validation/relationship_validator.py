@@ -34,7 +34,7 @@ def validate_relationship(
     for message in messages:
         validation_messages.append(ValidationMessage(message, context))
 
-    if relationship.related_spdx_element_id not in [SpdxNone(), SpdxNoAssertion()]:
+    if not isinstance(relationship.related_spdx_element_id, (SpdxNone, SpdxNoAssertion)):
         messages: List[str] = validate_spdx_id(relationship.related_spdx_element_id, document, check_document=True)
         for message in messages:
             validation_messages.append(ValidationMessage(message, context))
@@ -3,11 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
-from typing import List
+from typing import List, Union
 
 from spdx.document_utils import get_contained_spdx_element_ids
 from spdx.model.document import Document
 from spdx.model.file import File
+from spdx.model.file_table import FileTable, get_file_spdx_ids
 
 
 def is_valid_internal_spdx_id(spdx_id: str) -> bool:
@@ -18,8 +19,8 @@ def is_valid_external_doc_ref_id(external_ref_id: str) -> bool:
     return bool(re.match(r"^DocumentRef-[\da-zA-Z.+-]+$", external_ref_id))
 
 
-def is_spdx_id_present_in_files(spdx_id: str, files: List[File]) -> bool:
-    return spdx_id in [file.spdx_id for file in files]
+def is_spdx_id_present_in_files(spdx_id: str, files: Union[List[File], FileTable]) -> bool:
+    return spdx_id in get_file_spdx_ids(files)
 
 
 def is_spdx_id_present_in_document(spdx_id: str, document: Document) -> bool:
@@ -1,20 +1,27 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-import json
 from typing import List
 
+from spdx.json_backend import get_json_backend
 from spdx.jsonschema.document_converter import DocumentConverter
 from spdx.model.document import Document
 from spdx.validation.document_validator import validate_full_spdx_document
 from spdx.validation.validation_message import ValidationMessage
 
 
-def write_document(document: Document, file_name: str, validate: bool = True, converter: DocumentConverter = None):
+def write_document(
+    document: Document,
+    file_name: str,
+    validate: bool = True,
+    converter: DocumentConverter = None,
+    ensure_ascii: bool = True,
+):
     """
     Serializes the provided document to json and writes it to a file with the provided name. Unless validate is set
     to False, validates the document before serialization. Unless a DocumentConverter instance is provided,
-    a new one is created.
+    a new one is created. Non-ASCII characters are written as \\u escapes unless ensure_ascii is set to False, in
+    which case they are written as UTF-8.
     """
     if validate:
         validation_messages: List[ValidationMessage] = validate_full_spdx_document(document)
@@ -23,5 +30,4 @@ def write_document(document: Document, file_name: str, validate: bool = True, co
     if converter is None:
         converter = DocumentConverter()
     document_dict = converter.convert(document)
-    with open(file_name, "w") as out:
-        json.dump(document_dict, out, indent=4)
+    get_json_backend().write_file(document_dict, file_name, indent=4, ensure_ascii=ensure_ascii)
@@ -44,10 +44,10 @@ def write_document(document: Document, text_output: TextIO):
         document.relationships, document.packages, document.files
     )
     file_ids_with_contained_snippets = get_file_ids_with_contained_snippets(document.snippets, document.files)
-    packaged_file_ids = [file.spdx_id for files_list in contained_files_by_package_id.values() for file in files_list]
-    filed_snippet_ids = [
+    packaged_file_ids = {file.spdx_id for files_list in contained_files_by_package_id.values() for file in files_list}
+    filed_snippet_ids = {
         snippet.spdx_id for snippets_list in file_ids_with_contained_snippets.values() for snippet in snippets_list
-    ]
+    }
 
     text_output.write("## Document Information\n")
     write_creation_info(document.creation_info, text_output)
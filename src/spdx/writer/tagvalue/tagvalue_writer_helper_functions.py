@@ -8,12 +8,13 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, TextIO, Tuple, Union
 
 from license_expression import LicenseExpression
 
 from spdx.model.actor import Actor
 from spdx.model.file import File
+from spdx.model.file_table import FileTable, get_file_spdx_ids
 from spdx.model.package import Package
 from spdx.model.relationship import Relationship, RelationshipType
 from spdx.model.snippet import Snippet
@@ -78,7 +79,7 @@ def scan_relationships(
     contained_files_by_package_id = dict()
     relationships_to_write = []
     files_by_spdx_id = {file.spdx_id: file for file in files}
-    packages_spdx_ids = [package.spdx_id for package in packages]
+    packages_spdx_ids = {package.spdx_id for package in packages}
     for relationship in relationships:
         if (
             relationship.relationship_type == RelationshipType.CONTAINS
@@ -106,9 +107,9 @@ def scan_relationships(
     return relationships_to_write, contained_files_by_package_id
 
 
-def get_file_ids_with_contained_snippets(snippets: List[Snippet], files: List[File]) -> Dict:
+def get_file_ids_with_contained_snippets(snippets: List[Snippet], files: Union[List[File], FileTable]) -> Dict:
     file_ids_with_contained_snippets = dict()
-    file_spdx_ids: List[str] = [file.spdx_id for file in files]
+    file_spdx_ids: Set[str] = set(get_file_spdx_ids(files))
     for snippet in snippets:
         if snippet.file_spdx_id in file_spdx_ids:
             file_ids_with_contained_snippets.setdefault(snippet.file_spdx_id, []).append(snippet)
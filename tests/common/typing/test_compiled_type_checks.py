@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from common.typing.compiled_type_checks import compile_type_predicate
+from spdx.model.spdx_no_assertion import SpdxNoAssertion
+from spdx.model.spdx_none import SpdxNone
+
+
+@pytest.mark.parametrize(
+    "field_type, value, expected",
+    [
+        (str, "value", True),
+        (str, None, False),
+        (int, True, True),
+        (float, 1, True),
+        (datetime, datetime(2023, 1, 1), True),
+        (Optional[str], None, True),
+        (Optional[str], 1, False),
+        (Union[str, SpdxNone, SpdxNoAssertion], SpdxNone(), True),
+        (Optional[Union[str, SpdxNoAssertion]], SpdxNone(), False),
+        (List[str], ["a", "b"], True),
+        (List[str], ["a", 1], False),
+        (List[str], ("a",), False),
+        (List[Union[str, SpdxNone]], [SpdxNone(), "a"], True),
+        (Optional[List[int]], None, True),
+        (Tuple[int, int], (1, 2), True),
+        (Tuple[int, int], (1, 2, 3), False),
+        (Tuple[int, int], (1, "2"), False),
+        (Tuple[int, ...], (1, 2, 3), True),
+        (Optional[Tuple[int, int]], [1, 2], False),
+        (Dict[str, List[int]], {"a": [1]}, True),
+        (Dict[str, List[int]], {"a": ["1"]}, False),
+    ],
+)
+def test_compiled_type_predicate(field_type, value, expected):
+    assert compile_type_predicate(field_type)(value) == expected
+
+
+def test_compiled_type_predicates_are_cached():
+    assert compile_type_predicate(Optional[List[str]]) is compile_type_predicate(Optional[List[str]])
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import copy
+import pickle
+from typing import List, Optional
+from unittest import mock
+
+import pytest
+
+from common.typing.constructor_type_errors import ConstructorTypeErrors
+from common.typing.dataclass_with_properties import (
+    TypeCheckingPolicy,
+    dataclass_with_properties,
+    get_type_checking_policy,
+    set_type_checking_policy,
+    type_checking_policy,
+)
+from common.typing.type_checks import check_types_and_set_values
+
+
+@dataclass_with_properties
+class DataModelType:
+    name: str
+    values: List[int]
+    comment: Optional[str] = None
+
+    def __init__(self, name: str, values: List[int], comment: Optional[str] = None):
+        check_types_and_set_values(self, locals())
+
+
+@dataclass_with_properties(hashable=True)
+class HashableDataModelType:
+    name: str
+    values: List[int]
+    comment: Optional[str] = None
+
+    def __init__(self, name: str, values: List[int], comment: Optional[str] = None):
+        check_types_and_set_values(self, locals())
+
+
+@pytest.fixture
+def setters_only_policy():
+    set_type_checking_policy(TypeCheckingPolicy.SETTERS_ONLY)
+    yield
+    set_type_checking_policy(TypeCheckingPolicy.FULL)
+
+
+def test_full_policy_is_default():
+    assert get_type_checking_policy() == TypeCheckingPolicy.FULL
+
+
+def test_getter_is_type_checked_with_full_policy():
+    instance = DataModelType("name", [1, 2])
+    instance._name = 42
+
+    with pytest.raises(TypeError, match="GetterError DataModelType: type of name must be str; got int instead: 42"):
+        _ = instance.name
+
+
+def test_getter_is_plain_read_with_setters_only_policy(setters_only_policy):
+    instance = DataModelType("name", [1, 2])
+    instance._name = 42
+
+    assert instance.name == 42
+    assert instance.values == [1, 2]
+    assert instance.comment is None
+
+
+def test_setter_is_type_checked_with_setters_only_policy(setters_only_policy):
+    instance = DataModelType("name", [1, 2])
+
+    with pytest.raises(TypeError, match='SetterError DataModelType: type of argument "values"\\[1\\] must be int'):
+        instance.values = [1, "2"]
+    with pytest.raises(TypeError):
+        DataModelType(None, [])
+
+
+def test_setter_error_message_names_field_and_value():
+    instance = DataModelType("name", [1, 2])
+
+    with pytest.raises(
+        TypeError,
+        match='SetterError DataModelType: type of argument "comment" must be one of \\(str, NoneType\\); got int '
+        "instead: 42",
+    ):
+        instance.comment = 42
+
+
+def test_setter_accepts_mock():
+    instance = DataModelType("name", [mock.Mock()])
+    instance.name = mock.Mock()
+
+    assert isinstance(instance.name, mock.Mock)
+
+
+def test_policy_applies_to_existing_instances():
+    instance = DataModelType("name", [1, 2], "comment")
+    set_type_checking_policy(TypeCheckingPolicy.SETTERS_ONLY)
+    try:
+        instance._comment = 42
+        assert instance.comment == 42
+    finally:
+        set_type_checking_policy(TypeCheckingPolicy.FULL)
+
+    with pytest.raises(TypeError):
+        _ = instance.comment
+
+
+def test_trusted_constructor_builds_equal_instance():
+    instance = DataModelType._from_trusted("name", [1, 2], comment="comment")
+
+    assert type(instance) is DataModelType
+    assert instance == DataModelType("name", [1, 2], "comment")
+
+
+def test_trusted_constructor_reports_all_type_errors():
+    with pytest.raises(ConstructorTypeErrors) as err:
+        DataModelType._from_trusted(None, [1, "2"])
+
+    assert err.value.get_messages() == [
+        'SetterError DataModelType: type of argument "name" must be str; got NoneType instead: None',
+        "SetterError DataModelType: type of argument \"values\"[1] must be int; got str instead: [1, '2']",
+    ]
+
+
+def test_trusted_constructor_reports_missing_arguments():
+    with pytest.raises(
+        TypeError, match=r"DataModelType.__init__\(\) missing 1 required positional argument: 'values'"
+    ):
+        DataModelType._from_trusted("name")
+
+
+def test_values_are_stored_in_slots():
+    instance = DataModelType("name", [1, 2])
+
+    assert DataModelType.__slots__ == ("_name", "_values", "_comment")
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unknown_field = "value"
+
+
+def test_construction_only_policy():
+    with type_checking_policy(TypeCheckingPolicy.CONSTRUCTION_ONLY):
+        with pytest.raises(ConstructorTypeErrors):
+            DataModelType(None, [])
+        instance = DataModelType("name", [])
+        instance.name = 42
+
+        assert instance.name == 42
+
+
+def test_off_policy():
+    with type_checking_policy(TypeCheckingPolicy.OFF):
+        instance = DataModelType(None, ["value"])
+
+        assert instance.name is None
+        assert instance.values == ["value"]
+
+    assert get_type_checking_policy() == TypeCheckingPolicy.FULL
+    with pytest.raises(TypeError):
+        instance.name = None
+
+
+def test_class_override_takes_precedence():
+    with type_checking_policy(TypeCheckingPolicy.OFF):
+        with type_checking_policy(TypeCheckingPolicy.FULL, DataModelType):
+            assert get_type_checking_policy() == TypeCheckingPolicy.OFF
+            assert get_type_checking_policy(DataModelType) == TypeCheckingPolicy.FULL
+            with pytest.raises(ConstructorTypeErrors):
+                DataModelType(None, [])
+
+        assert get_type_checking_policy(DataModelType) == TypeCheckingPolicy.OFF
+        DataModelType(None, [])
+
+
+def test_class_override_survives_process_wide_change():
+    set_type_checking_policy(TypeCheckingPolicy.OFF, DataModelType)
+    try:
+        set_type_checking_policy(TypeCheckingPolicy.FULL)
+        DataModelType(None, [])
+    finally:
+        set_type_checking_policy(None, DataModelType)
+
+    assert get_type_checking_policy(DataModelType) == TypeCheckingPolicy.FULL
+    with pytest.raises(ConstructorTypeErrors):
+        DataModelType(None, [])
+
+
+def test_equality_compares_stored_values():
+    instance = DataModelType("name", [1, 2], "comment")
+
+    assert instance == DataModelType("name", [1, 2], "comment")
+    assert instance != DataModelType("name", [1, 2])
+    assert instance != ("name", [1, 2], "comment")
+    with type_checking_policy(TypeCheckingPolicy.OFF):
+        assert DataModelType(None, None) == DataModelType(None, None)
+
+
+def test_instances_of_hashable_classes_are_hashable():
+    instance = HashableDataModelType("name", [1, 2], "comment")
+
+    assert instance._identity_key() == ("name", (1, 2), "comment")
+    assert hash(instance) == hash(HashableDataModelType("name", [1, 2], "comment"))
+    assert len({instance, HashableDataModelType("name", [1, 2], "comment"), HashableDataModelType("name", [1])}) == 2
+    assert {instance: "value"}[HashableDataModelType("name", [1, 2], "comment")] == "value"
+    assert instance != DataModelType("name", [1, 2], "comment")
+
+
+def test_instances_are_not_hashable_by_default():
+    with pytest.raises(TypeError, match="unhashable type"):
+        hash(DataModelType("name", [1, 2]))
+
+
+def test_pickle_round_trip():
+    instance = DataModelType("name", [1, 2], "comment")
+
+    restored_instance = pickle.loads(pickle.dumps(instance))
+
+    assert restored_instance == instance
+    assert restored_instance.values is not instance.values
+    assert copy.copy(instance).values is instance.values
+    assert copy.deepcopy(instance).values is not instance.values
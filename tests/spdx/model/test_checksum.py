@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import pickle
 
 import pytest
 
-from spdx.model.checksum import Checksum, ChecksumAlgorithm
+from spdx.model.checksum import BinaryChecksum, Checksum, ChecksumAlgorithm
+from spdx.parser.jsonlikedict.checksum_parser import ChecksumParser
 
 
 def test_correct_initialization():
@@ -21,3 +23,94 @@ def test_wrong_type_in_algorithm():
 def test_wrong_type_in_value():
     with pytest.raises(TypeError):
         Checksum(ChecksumAlgorithm.BLAKE2B_256, 42)
+
+
+def test_binary_checksum_from_hex():
+    value = "71c4025dd9897b364f3ebbb42c484ff43d00791c"
+    checksum = BinaryChecksum.from_hex(ChecksumAlgorithm.SHA1, value)
+
+    assert checksum.algorithm == ChecksumAlgorithm.SHA1
+    assert checksum.value == value
+    assert checksum.digest == bytes.fromhex(value)
+    assert checksum == Checksum(ChecksumAlgorithm.SHA1, value)
+    assert Checksum(ChecksumAlgorithm.SHA1, value) == checksum
+    assert checksum != Checksum(ChecksumAlgorithm.SHA256, value)
+
+
+@pytest.mark.parametrize(
+    "algorithm,value",
+    [
+        (ChecksumAlgorithm.SHA1, "71C4025DD9897B364F3EBBB42C484FF43D00791C"),
+        (ChecksumAlgorithm.SHA1, "71c4025dd9897b364f3ebbb42c484ff43d00791"),
+        (ChecksumAlgorithm.SHA1, "71c4025dd9897b364f3ebbb42c484ff43d0079 c"),
+        (ChecksumAlgorithm.SHA1, "71c4025dd9897b364f3ebbb42c484ff43d00791g"),
+        (ChecksumAlgorithm.MD6, "71c4025dd9897b364f3ebbb42c484ff43d00791c"),
+        (None, "71c4025dd9897b364f3ebbb42c484ff43d00791c"),
+        (ChecksumAlgorithm.SHA1, None),
+    ],
+)
+def test_binary_checksum_rejects_invalid_values(algorithm, value):
+    assert BinaryChecksum.from_hex(algorithm, value) is None
+
+
+def test_set_binary_checksum_value():
+    checksum = BinaryChecksum(ChecksumAlgorithm.MD5, bytes(16))
+
+    checksum.value = "624c1abb3664f4b35547e7c73864ad24"
+    assert type(checksum) is BinaryChecksum
+    assert checksum.digest == bytes.fromhex("624c1abb3664f4b35547e7c73864ad24")
+
+    checksum.value = "624C1ABB3664F4B35547E7C73864AD24"
+    assert type(checksum) is Checksum
+    assert checksum == Checksum(ChecksumAlgorithm.MD5, "624C1ABB3664F4B35547E7C73864AD24")
+
+    with pytest.raises(ValueError):
+        BinaryChecksum(ChecksumAlgorithm.MD5, bytes(20))
+
+
+def test_set_binary_checksum_algorithm():
+    checksum = BinaryChecksum(ChecksumAlgorithm.SHA256, bytes(32))
+
+    checksum.algorithm = ChecksumAlgorithm.SHA3_256
+    assert type(checksum) is BinaryChecksum
+    assert checksum.algorithm == ChecksumAlgorithm.SHA3_256
+
+    checksum.algorithm = ChecksumAlgorithm.SHA1
+    assert type(checksum) is Checksum
+    assert checksum == Checksum(ChecksumAlgorithm.SHA1, "00" * 32)
+
+
+def test_set_wrong_type_in_binary_checksum():
+    checksum = BinaryChecksum(ChecksumAlgorithm.MD5, bytes(16))
+
+    with pytest.raises(TypeError):
+        checksum.value = 42
+    with pytest.raises(TypeError):
+        checksum.algorithm = "MD5"
+    assert checksum == Checksum(ChecksumAlgorithm.MD5, "00" * 16)
+
+
+def test_set_value_of_parsed_checksum():
+    checksum = ChecksumParser.parse_checksum({"algorithm": "SHA1", "checksumValue": "00" * 20})
+
+    checksum.value = "71c4025dd9897b364f3ebbb42c484ff43d00791c"
+    assert checksum.value == "71c4025dd9897b364f3ebbb42c484ff43d00791c"
+    checksum.value = "not a digest"
+    assert checksum == Checksum(ChecksumAlgorithm.SHA1, "not a digest")
+
+
+def test_binary_checksum_hashes_like_checksum():
+    value = "71c4025dd9897b364f3ebbb42c484ff43d00791c"
+    checksums = {Checksum(ChecksumAlgorithm.SHA1, value), BinaryChecksum.from_hex(ChecksumAlgorithm.SHA1, value)}
+
+    assert len(checksums) == 1
+    assert BinaryChecksum.from_hex(ChecksumAlgorithm.SHA1, value) in checksums
+
+
+def test_binary_checksum_pickle_round_trip():
+    checksum = BinaryChecksum.from_hex(ChecksumAlgorithm.SHA1, "d6a770ba38583ed4bb4525bd96e50461655d2758")
+
+    restored_checksum = pickle.loads(pickle.dumps(checksum))
+
+    assert type(restored_checksum) is BinaryChecksum
+    assert restored_checksum == checksum
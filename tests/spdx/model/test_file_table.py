@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+
+from spdx.model.checksum import Checksum, ChecksumAlgorithm
+from spdx.model.file import File, FileType
+from spdx.model.file_table import FileTable, get_file_spdx_ids
+from spdx.model.spdx_no_assertion import SpdxNoAssertion
+from spdx.parser.parse_anything import parse_file
+from tests.spdx.fixtures import document_fixture, file_fixture
+
+SHA1 = "d6a770ba38583ed4bb4525bd96e50461655d2758"
+
+
+def minimal_file(index: int, checksums=None, file_types=None) -> File:
+    checksums = [Checksum(ChecksumAlgorithm.SHA1, SHA1)] if checksums is None else checksums
+    return File(f"./file{index}", f"SPDXRef-File{index}", checksums, file_types or [])
+
+
+def test_round_trip_of_fully_populated_file():
+    file = file_fixture(
+        checksums=[
+            Checksum(ChecksumAlgorithm.SHA1, SHA1),
+            Checksum(ChecksumAlgorithm.MD5, "624c1abb3664f4b35547e7c73864ad24"),
+        ],
+        file_types=[FileType.SOURCE, FileType.TEXT],
+    )
+    table = FileTable([file, file_fixture()])
+
+    assert len(table) == 2
+    assert table[0] == file
+    assert table[-1] == file_fixture()
+    assert table == [file, file_fixture()]
+
+
+def test_round_trip_of_file_with_empty_values():
+    file = file_fixture(
+        license_info_in_file=[],
+        license_comment="",
+        copyright_text="",
+        comment="",
+        notice="",
+        contributors=[],
+        attribution_texts=[],
+    )
+    table = FileTable([file])
+
+    assert table[0] == file
+    assert table[0].comment == ""
+    assert table[0].contributors == []
+
+
+@pytest.mark.parametrize(
+    "checksums",
+    [
+        [],
+        [Checksum(ChecksumAlgorithm.SHA1, SHA1.upper())],
+        [Checksum(ChecksumAlgorithm.SHA1, "not hex")],
+        [Checksum(ChecksumAlgorithm.MD5, "624c1abb3664f4b35547e7c73864ad24"), Checksum(ChecksumAlgorithm.SHA1, SHA1)],
+    ],
+)
+def test_checksums_that_cannot_be_packed_are_preserved(checksums):
+    table = FileTable([minimal_file(0, checksums)])
+
+    assert table[0].checksums == checksums
+
+
+def test_mutable_sequence_operations():
+    table = FileTable(minimal_file(index) for index in range(5))
+
+    del table[1]
+    table.insert(0, minimal_file(9))
+    table[-1] = minimal_file(7, file_types=[FileType.BINARY])
+    table.append(minimal_file(8))
+    del table[1:3]
+
+    assert table.get_spdx_ids() == ["SPDXRef-File9", "SPDXRef-File3", "SPDXRef-File7", "SPDXRef-File8"]
+    assert table[2].file_types == [FileType.BINARY]
+    assert table[1:3] == [minimal_file(3), minimal_file(7, file_types=[FileType.BINARY])]
+    with pytest.raises(IndexError):
+        _ = table[4]
+    with pytest.raises(TypeError):
+        table.append("file")
+
+
+def test_materialized_files_are_detached():
+    table = FileTable([minimal_file(0)])
+
+    table[0].comment = "comment"
+    assert table[0].comment is None
+
+    file = table[0]
+    file.comment = "comment"
+    table[0] = file
+    assert table[0].comment == "comment"
+
+
+def test_bulk_accessors():
+    table = FileTable(
+        [
+            minimal_file(0),
+            minimal_file(1, checksums=[Checksum(ChecksumAlgorithm.MD5, "624c1abb3664f4b35547e7c73864ad24")]),
+            minimal_file(2, checksums=[Checksum(ChecksumAlgorithm.SHA1, SHA1.upper())]),
+        ]
+    )
+
+    assert table.get_names() == ["./file0", "./file1", "./file2"]
+    assert table.get_spdx_ids() == ["SPDXRef-File0", "SPDXRef-File1", "SPDXRef-File2"]
+    assert get_file_spdx_ids(table) == get_file_spdx_ids(list(table))
+    assert table.get_sha1s() == [SHA1, None, SHA1.upper()]
+
+
+def test_shared_values_are_not_copied():
+    table = FileTable(
+        [File("./file0", "SPDXRef-File0", [], copyright_text=SpdxNoAssertion()), minimal_file(1), minimal_file(2)]
+    )
+
+    assert table[0].copyright_text is SpdxNoAssertion()
+    assert table._extras == [None, None, None]
+
+
+def test_document_accepts_file_table():
+    document = document_fixture()
+    files = document.files
+    document.files = FileTable(files)
+
+    assert document.files == files
+    assert document == document_fixture()
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "SPDXJSONExample-v2.3.spdx.json",
+        "SPDXRdfExample-v2.3.spdx.rdf.xml",
+        "SPDXTagExample-v2.3.spdx",
+    ],
+)
+def test_parsers_produce_file_table(file_name):
+    path = os.path.join(os.path.dirname(__file__), "../data/formats", file_name)
+    document = parse_file(path, file_table=True)
+
+    assert isinstance(document.files, FileTable)
+    assert document == parse_file(path)
@@ -34,3 +34,15 @@ def test_wrong_type_in_related_spdx_element_id():
 def test_wrong_type_in_comment():
     with pytest.raises(TypeError):
         Relationship("id", RelationshipType.OTHER, "other_id", 42)
+
+
+def test_relationships_can_be_used_in_sets():
+    relationships = {
+        Relationship("id", RelationshipType.CONTAINS, "other_id"),
+        Relationship("id", RelationshipType.CONTAINS, "other_id"),
+        Relationship("id", RelationshipType.CONTAINS, "other_id", "comment"),
+        Relationship("id", RelationshipType.CONTAINS, SpdxNoAssertion()),
+    }
+
+    assert len(relationships) == 3
+    assert Relationship("id", RelationshipType.CONTAINS, SpdxNoAssertion()) in relationships
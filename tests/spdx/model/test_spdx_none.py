@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import copy
+import pickle
+
+from spdx.model.spdx_none import SpdxNone
+
+
+def test_is_singleton():
+    value = SpdxNone()
+
+    assert SpdxNone() is value
+    assert copy.deepcopy(value) is value
+    assert pickle.loads(pickle.dumps(value)) is value
+
+
+def test_equality_and_hash():
+    assert SpdxNone() == SpdxNone()
+    assert len({SpdxNone(), SpdxNone()}) == 1
+    assert str(SpdxNone()) == "NONE"
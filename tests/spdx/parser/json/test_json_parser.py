@@ -1,13 +1,19 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-
+import json
 import os
+from itertools import islice
 
 import pytest
 
-from spdx.model.document import Document
+from spdx.model.document import CreationInfo, Document
+from spdx.model.file import File
+from spdx.model.package import Package
+from spdx.model.relationship import Relationship
+from spdx.parser.error import SPDXParsingError
 from spdx.parser.json import json_parser
+from spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
 
 
 def test_parse_json_file_not_found():
@@ -42,3 +48,85 @@ def test_parse_json_with_2_2_example():
     assert len(doc.snippets) == 1
     assert len(doc.relationships) == 11
     assert len(doc.extracted_licensing_info) == 5
+
+
+@pytest.mark.parametrize("file_name", ["SPDXJSONExample-v2.2.spdx.json", "SPDXJSONExample-v2.3.spdx.json"])
+def test_parse_json_streaming(file_name):
+    file_path = os.path.join(os.path.dirname(__file__), "../../data/formats", file_name)
+
+    assert json_parser.parse_from_file(file_path, streaming=True) == json_parser.parse_from_file(file_path)
+
+
+def test_parse_json_streaming_reports_same_errors(tmp_path):
+    with open(os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXJSONExample-v2.3.spdx.json")) as file:
+        input_doc_dict = json.load(file)
+    input_doc_dict["packages"][0]["supplier"] = "invalid supplier"
+    input_doc_dict["relationships"][0]["relationshipType"] = "INVALID"
+    del input_doc_dict["creationInfo"]["created"]
+    file_path = str(tmp_path / "invalid.spdx.json")
+    with open(file_path, "w") as file:
+        json.dump(input_doc_dict, file)
+
+    with pytest.raises(SPDXParsingError) as err:
+        json_parser.parse_from_file(file_path)
+    with pytest.raises(SPDXParsingError) as streaming_err:
+        json_parser.parse_from_file(file_path, streaming=True)
+
+    assert streaming_err.value.get_messages() == err.value.get_messages()
+
+
+def test_parse_json_in_parallel():
+    with open(os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXJSONExample-v2.3.spdx.json")) as file:
+        input_doc_dict = json.load(file)
+
+    document = JsonLikeDictParser(workers=2, chunk_size=2).parse(input_doc_dict)
+
+    assert document == JsonLikeDictParser().parse(input_doc_dict)
+
+
+def test_parse_json_in_parallel_reports_same_errors():
+    with open(os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXJSONExample-v2.3.spdx.json")) as file:
+        input_doc_dict = json.load(file)
+    input_doc_dict["packages"][0]["supplier"] = "invalid supplier"
+    input_doc_dict["packages"][3]["downloadLocation"] = 5
+    input_doc_dict["files"][4]["checksums"] = None
+    input_doc_dict["relationships"][0]["relationshipType"] = "INVALID"
+    input_doc_dict["relationships"][-1]["spdxElementId"] = 5
+
+    with pytest.raises(SPDXParsingError) as err:
+        JsonLikeDictParser().parse(input_doc_dict)
+    with pytest.raises(SPDXParsingError) as parallel_err:
+        JsonLikeDictParser(workers=2, chunk_size=2).parse(input_doc_dict)
+
+    assert len(err.value.get_messages()) >= 5
+    assert parallel_err.value.get_messages() == err.value.get_messages()
+
+
+def test_parse_elements_from_file():
+    file_path = os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXJSONExample-v2.3.spdx.json")
+
+    elements = json_parser.parse_elements_from_file(file_path)
+
+    assert [type(element) for element in islice(elements, 6)] == [Package] * 4 + [File] * 2
+    remaining_element_types = [type(element) for element in elements]
+    assert remaining_element_types.count(CreationInfo) == 1
+    assert remaining_element_types.count(Relationship) == 13
+
+
+def test_parse_elements_from_file_keeps_only_relationship_keys(monkeypatch):
+    file_path = os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXJSONExample-v2.3.spdx.json")
+    kept_relationship_keys = []
+    parse_remaining_fields = JsonLikeDictParser._parse_remaining_fields
+
+    def record_relationship_keys(self, document_fields, element_references, relationship_keys):
+        kept_relationship_keys.extend(relationship_keys)
+        return parse_remaining_fields(self, document_fields, element_references, relationship_keys)
+
+    monkeypatch.setattr(JsonLikeDictParser, "_parse_remaining_fields", record_relationship_keys)
+    relationships = [
+        element for element in json_parser.parse_elements_from_file(file_path) if isinstance(element, Relationship)
+    ]
+
+    assert kept_relationship_keys
+    assert not any(isinstance(key, Relationship) for key in kept_relationship_keys)
+    assert relationships == json_parser.parse_from_file(file_path).relationships
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+import json
+
+import pytest
+
+from spdx.parser.json.json_stream_reader import JsonStreamReader
+
+JSON_DOCUMENT = {
+    "name": "document",
+    "packages": [{"SPDXID": f"SPDXRef-Package{i}", "comment": "x" * i} for i in range(20)],
+    "number": 12345678901234567890,
+    "files": None,
+    "snippets": [],
+    "nested": {"list": [1.5, True, None]},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+def test_iterate_top_level_entries(chunk_size):
+    reader = JsonStreamReader(io.StringIO(json.dumps(JSON_DOCUMENT, indent=2)), chunk_size)
+
+    entries = list(reader.iterate_top_level_entries(["packages", "files", "snippets"]))
+
+    assert entries == [
+        ("name", "document"),
+        *[("packages", package) for package in JSON_DOCUMENT["packages"]],
+        ("number", 12345678901234567890),
+        ("nested", {"list": [1.5, True, None]}),
+    ]
+
+
+def test_iterate_top_level_entries_without_streamed_arrays():
+    reader = JsonStreamReader(io.StringIO(json.dumps(JSON_DOCUMENT)), 3)
+
+    assert dict(reader.iterate_top_level_entries()) == JSON_DOCUMENT
+
+
+@pytest.mark.parametrize(
+    "json_str", ["", "[]", '{"name": "document"', '{"name" "document"}', '{"packages": [1,]}', "{1: 2}", "{} {}"]
+)
+def test_iterate_invalid_json(json_str):
+    reader = JsonStreamReader(io.StringIO(json_str), 2)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(reader.iterate_top_level_entries(["packages"]))
+
+
+@pytest.mark.parametrize("number_str,expected", [("1.5", 1.5), ("1e5", 1e5), ("-1E+2", -1e2)])
+@pytest.mark.parametrize("prefix_length", range(8))
+def test_number_split_between_chunks(number_str, expected, prefix_length):
+    json_str = '{"x": "' + "a" * prefix_length + '", "number": ' + number_str + "}"
+
+    for chunk_size in range(1, len(json_str) + 1):
+        reader = JsonStreamReader(io.StringIO(json_str), chunk_size)
+
+        assert list(reader.iterate_top_level_entries()) == [("x", "a" * prefix_length), ("number", expected)]
+
+
+def test_number_split_between_default_chunks():
+    # the second chunk starts with the "." of 1.5
+    json_str = '{"x": "' + "a" * 65517 + '", "v": 1.5}'
+
+    assert dict(JsonStreamReader(io.StringIO(json_str)).iterate_top_level_entries()) == {"x": "a" * 65517, "v": 1.5}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_invalid_json_error_position_refers_to_file(chunk_size):
+    json_str = '{\n  "name": "document",\n  "packages": [\n    {"SPDXID": "SPDXRef-Package"} {}\n  ]\n}'
+    reader = JsonStreamReader(io.StringIO(json_str), chunk_size)
+
+    with pytest.raises(json.JSONDecodeError) as err:
+        list(reader.iterate_top_level_entries(["packages"]))
+
+    assert err.value.pos == json_str.index(" {}") + 1
+    assert (err.value.lineno, err.value.colno) == (4, 35)
+    assert str(err.value) == "Expecting one of ',', ']': line 4 column 35 (char 74)"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1 << 16])
+def test_invalid_value_error_position_refers_to_file(chunk_size):
+    json_str = '{"name": "document",\n "comment": "unterminated}'
+    reader = JsonStreamReader(io.StringIO(json_str), chunk_size)
+
+    with pytest.raises(json.JSONDecodeError) as err:
+        list(reader.iterate_top_level_entries())
+
+    assert (err.value.pos, err.value.lineno, err.value.colno) == (33, 2, 13)
@@ -5,7 +5,7 @@ from unittest import TestCase
 
 import pytest
 
-from spdx.model.checksum import ChecksumAlgorithm
+from spdx.model.checksum import BinaryChecksum, ChecksumAlgorithm
 from spdx.parser.error import SPDXParsingError
 from spdx.parser.jsonlikedict.checksum_parser import ChecksumParser
 
@@ -18,6 +18,17 @@ def test_parse_checksum():
 
     assert checksum.value == "d6a770ba38583ed4bb4525bd96e50461655d2759"
     assert checksum.algorithm == ChecksumAlgorithm.SHA1
+    assert isinstance(checksum, BinaryChecksum)
+
+
+def test_parse_checksum_with_invalid_value():
+    checksum_parser = ChecksumParser()
+    checksum_dict = {"algorithm": "SHA1", "checksumValue": "D6A770BA38583ED4BB4525BD96E50461655D2759"}
+
+    checksum = checksum_parser.parse_checksum(checksum_dict)
+
+    assert checksum.value == "D6A770BA38583ED4BB4525BD96E50461655D2759"
+    assert not isinstance(checksum, BinaryChecksum)
 
 
 def test_parse_invalid_checksum():
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from concurrent.futures import ProcessPoolExecutor
 from unittest import TestCase
 
 import pytest
@@ -12,6 +13,8 @@ from spdx.parser.jsonlikedict.dict_parsing_functions import (
     json_str_to_enum_name,
     parse_field_or_no_assertion,
     parse_field_or_no_assertion_or_none,
+    parse_list_of_elements,
+    parse_list_of_elements_in_parallel,
 )
 
 
@@ -45,3 +48,26 @@ def test_parse_field_or_no_assertion_or_none(input_str, expected_type):
     resulting_value = parse_field_or_no_assertion_or_none(input_str, lambda x: x)
 
     assert type(resulting_value) == expected_type
+
+
+def parse_even_number(number: int) -> int:
+    if number % 2:
+        raise SPDXParsingError([f"{number} is odd"])
+    return number
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_parse_list_of_elements_in_parallel(chunk_size):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parsed_elements = parse_list_of_elements_in_parallel(
+            list(range(0, 20, 2)), parse_even_number, executor=executor, chunk_size=chunk_size
+        )
+        with pytest.raises(SPDXParsingError) as err:
+            parse_list_of_elements_in_parallel(
+                list(range(20)), parse_even_number, executor=executor, chunk_size=chunk_size
+            )
+
+    assert parsed_elements == list(range(0, 20, 2))
+    with pytest.raises(SPDXParsingError) as sequential_err:
+        parse_list_of_elements(list(range(20)), parse_even_number)
+    assert err.value.get_messages() == sequential_err.value.get_messages()
@@ -9,7 +9,7 @@ from spdx.constants import DOCUMENT_SPDX_ID
 from spdx.model.relationship import Relationship, RelationshipType
 from spdx.model.spdx_no_assertion import SpdxNoAssertion
 from spdx.parser.error import SPDXParsingError
-from spdx.parser.jsonlikedict.relationship_parser import RelationshipParser
+from spdx.parser.jsonlikedict.relationship_parser import RelationshipParser, get_relationship_key
 
 
 def test_parse_relationship():
@@ -223,3 +223,41 @@ def test_parse_has_files_without_duplicating_relationships(has_files, existing_r
 
     assert len(relationships) == len(contains_relationships)
     TestCase().assertCountEqual(relationships, contains_relationships)
+
+
+def test_parse_all_relationships_compares_keys_only(monkeypatch):
+    number_of_files = 1000
+    # every second file is already covered by an explicit (inverted) relationship
+    input_doc_dict = {
+        "SPDXID": DOCUMENT_SPDX_ID,
+        "packages": [{"SPDXID": "SPDXRef-Package", "hasFiles": [f"SPDXRef-File{i}" for i in range(number_of_files)]}],
+        "relationships": [
+            {
+                "spdxElementId": f"SPDXRef-File{i}",
+                "relationshipType": "CONTAINED_BY",
+                "relatedSpdxElement": "SPDXRef-Package",
+            }
+            for i in range(0, number_of_files, 2)
+        ],
+    }
+    comparisons = []
+    key_lookups = []
+    relationship_eq = Relationship.__eq__
+    monkeypatch.setattr(
+        Relationship, "__eq__", lambda self, other: comparisons.append(None) or relationship_eq(self, other)
+    )
+    monkeypatch.setattr(
+        "spdx.parser.jsonlikedict.relationship_parser.get_relationship_key",
+        lambda relationship: key_lookups.append(None) or get_relationship_key(relationship),
+    )
+
+    relationships = RelationshipParser().parse_all_relationships(input_doc_dict)
+
+    # one key for each explicit and each implied relationship, instead of comparing every implied relationship to
+    # all explicit ones
+    assert comparisons == []
+    assert len(key_lookups) == number_of_files + number_of_files // 2
+    assert len(relationships) == number_of_files
+    assert relationships[-1] == Relationship(
+        "SPDXRef-Package", RelationshipType.CONTAINS, f"SPDXRef-File{number_of_files - 1}"
+    )
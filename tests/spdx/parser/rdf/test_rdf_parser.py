@@ -4,10 +4,17 @@
 import os
 
 import pytest
+from rdflib import RDF, BNode, Graph, URIRef
 
 from spdx.model.document import Document
+from spdx.model.relationship import Relationship
 from spdx.parser.rdf import rdf_parser
+from spdx.rdfschema.namespace import SPDX_NAMESPACE
 from spdx.validation.document_validator import validate_full_spdx_document
+from spdx.writer.rdf.creation_info_writer import add_creation_info_to_graph
+from spdx.writer.rdf.file_writer import add_file_to_graph
+from spdx.writer.rdf.package_writer import add_package_to_graph
+from tests.spdx.fixtures import creation_info_fixture, file_fixture, package_fixture
 
 
 def test_rdf_parser_file_not_found():
@@ -46,3 +53,38 @@ def test_rdf_parser_with_2_2_example():
     assert len(doc.packages) == 4
     assert len(doc.relationships) == 11
     assert len(doc.extracted_licensing_info) == 5
+
+
+def test_rdf_parser_deduplicates_implicit_relationships_in_linear_time(monkeypatch):
+    number_of_files = 1000
+    doc_namespace = "https://some.namespace"
+    graph = Graph()
+    add_creation_info_to_graph(creation_info_fixture(external_document_refs=[]), graph)
+    add_package_to_graph(package_fixture(spdx_id="SPDXRef-Package"), graph, doc_namespace, {})
+    package_node = URIRef(f"{doc_namespace}#SPDXRef-Package")
+    for index in range(number_of_files):
+        file = file_fixture(spdx_id=f"SPDXRef-File-{index}", license_concluded=None, license_info_in_file=[])
+        add_file_to_graph(file, graph, doc_namespace, {})
+        file_node = URIRef(f"{doc_namespace}#SPDXRef-File-{index}")
+        graph.add((package_node, SPDX_NAMESPACE.hasFile, file_node))
+        if index % 2:
+            # an explicit relationship that duplicates the implicit one
+            relationship_node = BNode()
+            graph.add((relationship_node, RDF.type, SPDX_NAMESPACE.Relationship))
+            graph.add((relationship_node, SPDX_NAMESPACE.relationshipType, SPDX_NAMESPACE.relationshipType_contains))
+            graph.add((relationship_node, SPDX_NAMESPACE.relatedSpdxElement, file_node))
+            graph.add((package_node, SPDX_NAMESPACE.relationship, relationship_node))
+    comparisons = []
+    relationship_eq = Relationship.__eq__
+    monkeypatch.setattr(
+        Relationship, "__eq__", lambda self, other: comparisons.append(None) or relationship_eq(self, other)
+    )
+
+    doc = rdf_parser.translate_graph_to_document(graph)
+
+    assert len(doc.files) == number_of_files
+    assert sorted(relationship.related_spdx_element_id for relationship in doc.relationships) == sorted(
+        f"SPDXRef-File-{index}" for index in range(number_of_files)
+    )
+    # comparing each implicit relationship to all relationships parsed before would need about 500000 comparisons
+    assert len(comparisons) <= number_of_files
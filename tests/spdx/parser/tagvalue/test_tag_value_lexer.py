@@ -2,10 +2,12 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import re
+
 import pytest
 
 from spdx.constants import DOCUMENT_SPDX_ID
-from spdx.parser.tagvalue.lexer import SPDXLexer
+from spdx.parser.tagvalue.lexer import SPDXLexer, SPDXLineLexer
 
 
 @pytest.fixture
@@ -319,3 +321,64 @@ def test_tokenization_of_relationship(lexer):
     token_assert_helper(lexer.token(), "LINE", "This is a comment.", 2)
     token_assert_helper(lexer.token(), "RELATIONSHIP", "Relationship", 3)
     token_assert_helper(lexer.token(), "LINE", "DocumentRef-extern:SPDXRef-Package DESCRIBES NONE", 3)
+
+
+def test_tokenization_of_multiline_text_blocks(lexer):
+    document_str = "\n".join(
+        [
+            "LicenseID: LicenseRef-1",
+            "ExtractedText: <text>first line",
+            "second line with <text> and < inside",
+            "third line</text>",
+            "LicenseComment: <text></text>",
+            "LicenseName: License 1",
+        ]
+    )
+    lexer.input(document_str)
+    token_assert_helper(lexer.token(), "LICENSE_ID", "LicenseID", 1)
+    token_assert_helper(lexer.token(), "LINE", "LicenseRef-1", 1)
+    token_assert_helper(lexer.token(), "LICENSE_TEXT", "ExtractedText", 2)
+    token_assert_helper(
+        lexer.token(), "TEXT", "<text>first line\nsecond line with <text> and < inside\nthird line</text>", 2
+    )
+    token_assert_helper(lexer.token(), "LICENSE_COMMENT", "LicenseComment", 5)
+    token_assert_helper(lexer.token(), "TEXT", "<text></text>", 5)
+    token_assert_helper(lexer.token(), "LICENSE_NAME", "LicenseName", 6)
+    token_assert_helper(lexer.token(), "LINE", "License 1", 6)
+
+
+def test_tokenization_of_unclosed_text_block(lexer):
+    lexer.input("LicenseComment: <text>never closed\nLicenseName: License 1")
+    token_assert_helper(lexer.token(), "LICENSE_COMMENT", "LicenseComment", 1)
+    assert lexer.token() is None
+
+
+def get_token_stream(lexer, data):
+    lexer.input(data)
+    tokens = []
+    token = lexer.token()
+    while token is not None:
+        tokens.append((token.type, token.value, token.lineno, token.lexpos))
+        token = lexer.token()
+    return tokens
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "\n".join(["", "  # comment", "SPDXVersion: SPDX-2.3", "", "\t Created:  2010-02-03T00:00:00Z  ", ""]),
+        "PackageChecksum: SHA3-256:  00ff  \nFileChecksum: MD5:\nFileChecksum: SHA1: ABC d",
+        "Creator: Tool: \nCreator:\nTool: tool\nCreator: Person: Jane Doe (jane@example.com)\r\n"
+        "Creator: Organization:",
+        "LicenseComment: <text>first\n\nthird</text> \n\nLicenseName: <text>x</text> FileName: y\nUnknownTag: z",
+        "LicenseID: LicenseRef-1\nLicenseRef-1: x\nFileName : NOASSERTION\nFileType: PackageName\nÄ: b\n§",
+        "Created: 2010-02-03T00:00:00Z junk\nSnippetByteRange: 1:2\nExtractedText: <text>never closed",
+    ],
+)
+def test_line_lexer_produces_same_tokens(data):
+    regex_lexer = SPDXLexer()
+    regex_lexer.build(reflags=re.UNICODE)
+    fallback_lexer = SPDXLexer()
+    fallback_lexer.build(reflags=re.UNICODE)
+
+    assert get_token_stream(SPDXLineLexer(fallback_lexer), data) == get_token_stream(regex_lexer, data)
@@ -5,14 +5,18 @@
 import os
 
 import pytest
+from ply.yacc import ParserReflect
 
 from spdx.constants import DOCUMENT_SPDX_ID
 from spdx.model.document import Document
 from spdx.model.relationship import Relationship, RelationshipType
 from spdx.parser.error import SPDXParsingError
+from spdx.parser.tagvalue import parsetab, tagvalue_parser
 from spdx.parser.tagvalue.parser import Parser
 from tests.spdx.parser.tagvalue.test_creation_info_parser import DOCUMENT_STR
 
+FILE_CHECKSUM = "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2758"
+
 
 def test_parse_unknown_tag():
     parser = Parser()
@@ -91,3 +95,198 @@ def test_document_with_mixed_values():
         "Element Package is not the current element in scope, probably the expected "
         "tag to start the element (PackageName) is missing. Line: 4"
     ]
+
+
+def test_shipped_parse_tables_match_grammar():
+    parser = Parser()
+    parser_info = ParserReflect({name: getattr(parser, name) for name in dir(parser)})
+    parser_info.get_all()
+
+    assert parser_info.signature() == parsetab._lr_signature
+
+
+def test_reuse_parser_after_reset():
+    parser = Parser()
+    fn = os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXTagExample-v2.3.spdx")
+    with open(fn) as f:
+        data = f.read()
+
+    with pytest.raises(SPDXParsingError):
+        parser.parse(data + "\nUnknownTag: <text>unfinished")
+    parser.reset()
+    first_doc = parser.parse(data)
+    parser.reset(include={"packages"})
+    second_doc = parser.parse(data)
+
+    assert len(first_doc.files) == 5
+    assert len(second_doc.packages) == 4
+    assert second_doc.files == []
+    parser.reset()
+    with pytest.raises(SPDXParsingError, match="Unknown tag provided in line 3"):
+        parser.parse("\n\nUnknownTag: value")
+
+
+def test_parse_from_file_reuses_parsers():
+    fn = os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXTagExample-v2.3.spdx")
+
+    first_doc = tagvalue_parser.parse_from_file(fn)
+    idle_parsers = list(tagvalue_parser._idle_parsers)
+    second_doc = tagvalue_parser.parse_from_file(fn)
+
+    assert first_doc == second_doc
+    assert tagvalue_parser._idle_parsers == idle_parsers
+
+
+def test_pooled_parsers_do_not_keep_previous_documents(tmp_path):
+    first_file = tmp_path / "first.spdx"
+    first_file.write_text("\n".join([DOCUMENT_STR, "FileName: First", "SPDXID: SPDXRef-First", FILE_CHECKSUM]))
+    second_file = tmp_path / "second.spdx"
+    second_file.write_text("\n".join([DOCUMENT_STR, "FileName: Second", "SPDXID: SPDXRef-Second", FILE_CHECKSUM]))
+
+    first_doc = tagvalue_parser.parse_from_file(str(first_file))
+    second_doc = tagvalue_parser.parse_from_file(str(second_file))
+
+    assert [file.spdx_id for file in first_doc.files] == ["SPDXRef-First"]
+    assert [file.spdx_id for file in second_doc.files] == ["SPDXRef-Second"]
+    for first_list, second_list in zip(
+        [first_doc.files, first_doc.packages, first_doc.relationships, first_doc.annotations],
+        [second_doc.files, second_doc.packages, second_doc.relationships, second_doc.annotations],
+    ):
+        assert first_list is not second_list
+    for parser in tagvalue_parser._idle_parsers:
+        assert parser.elements_built == {}
+        assert parser.contains_relationships == set()
+
+
+def test_parser_pool_is_bounded(monkeypatch):
+    monkeypatch.setattr(tagvalue_parser, "_idle_parsers", [])
+    parsers = [tagvalue_parser._get_idle_parser(True, False, None, None, False) for _ in range(6)]
+
+    for parser in parsers:
+        tagvalue_parser._release_parser(parser)
+
+    assert len(tagvalue_parser._idle_parsers) == tagvalue_parser.MAX_IDLE_PARSERS
+
+
+def parse_document_or_get_error(data, line_lexer):
+    try:
+        return Parser(line_lexer=line_lexer).parse(data)
+    except Exception as err:
+        return type(err), str(err)
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXTagExample-v2.3.spdx"),
+        os.path.join(os.path.dirname(__file__), "../../writer/tagvalue/expected_results/expected_tag_value.spdx"),
+    ],
+)
+def test_line_lexer_builds_same_document(file_name):
+    with open(file_name) as file:
+        data = file.read()
+
+    assert parse_document_or_get_error(data, line_lexer=True) == parse_document_or_get_error(data, line_lexer=False)
+
+
+def test_line_lexer_reports_same_errors():
+    data = "\n".join(
+        [DOCUMENT_STR, "PackageName:", "SPDXID SPDXRef-Package", "FileType: <text>SOURCE</text>", "Creator:"]
+    )
+
+    with pytest.raises(SPDXParsingError) as regex_lexer_error:
+        Parser().parse(data)
+    with pytest.raises(SPDXParsingError) as line_lexer_error:
+        Parser(line_lexer=True).parse(data)
+
+    assert line_lexer_error.value.get_messages() == regex_lexer_error.value.get_messages()
+
+
+def split_into_chunks(data, chunk_size):
+    return [data[index : index + chunk_size] for index in range(0, len(data), chunk_size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000000])
+@pytest.mark.parametrize("line_lexer", [False, True])
+def test_parse_stream_builds_same_document(monkeypatch, chunk_size, line_lexer):
+    monkeypatch.setattr("spdx.parser.tagvalue.parser.MIN_SEGMENT_LENGTH", 0)
+    fn = os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXTagExample-v2.3.spdx")
+    with open(fn) as f:
+        data = f.read()
+
+    doc = Parser(line_lexer=line_lexer).parse_stream(split_into_chunks(data, chunk_size))
+
+    assert doc == Parser().parse(data)
+
+
+def test_iterate_elements_yields_creation_info_last(monkeypatch):
+    monkeypatch.setattr("spdx.parser.tagvalue.parser.MIN_SEGMENT_LENGTH", 0)
+    data = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Test",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: NOASSERTION",
+            "FileName: File",
+            "SPDXID: SPDXRef-File",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2758",
+        ]
+    )
+    parser = Parser()
+    elements = parser.iterate_elements(split_into_chunks(data, 10))
+
+    package = next(elements)
+    assert package.spdx_id == "SPDXRef-Package"
+    assert [type(element).__name__ for element in elements] == ["File", "Relationship", "CreationInfo"]
+
+
+def test_parse_stream_reports_same_errors(monkeypatch):
+    monkeypatch.setattr("spdx.parser.tagvalue.parser.MIN_SEGMENT_LENGTH", 0)
+    data = "\n".join(
+        [DOCUMENT_STR, "PackageName:", "SPDXID SPDXRef-Package", "FileName: <text>File\n", "</text>", "Creator:"]
+    )
+
+    with pytest.raises(SPDXParsingError) as error:
+        Parser().parse(data)
+    with pytest.raises(SPDXParsingError) as stream_error:
+        Parser().parse_stream(split_into_chunks(data, 3))
+
+    assert stream_error.value.get_messages() == error.value.get_messages()
+
+
+def test_parse_from_file_streaming():
+    fn = os.path.join(os.path.dirname(__file__), "../../data/formats/SPDXTagExample-v2.3.spdx")
+
+    doc = tagvalue_parser.parse_from_file(fn, streaming=True)
+    elements = list(tagvalue_parser.parse_elements_from_file(fn, include={"packages"}))
+
+    assert doc == tagvalue_parser.parse_from_file(fn)
+    assert [element.spdx_id for element in elements[:-1]] == [package.spdx_id for package in doc.packages]
+
+
+def test_building_contains_relationships_in_linear_time(monkeypatch):
+    number_of_files = 1000
+    lines = [DOCUMENT_STR, "PackageName: Package", "SPDXID: SPDXRef-Package", "PackageDownloadLocation: NONE"]
+    for index in range(number_of_files):
+        if index % 2:
+            # an explicit relationship that duplicates the one implied by the position of the file
+            lines.append(f"Relationship: SPDXRef-Package CONTAINS SPDXRef-File-{index}")
+        lines += [
+            f"FileName: File{index}",
+            f"SPDXID: SPDXRef-File-{index}",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2758",
+        ]
+    comparisons = []
+    relationship_eq = Relationship.__eq__
+    monkeypatch.setattr(
+        Relationship, "__eq__", lambda self, other: comparisons.append(None) or relationship_eq(self, other)
+    )
+
+    doc = Parser().parse("\n".join(lines))
+
+    assert len(doc.files) == number_of_files
+    assert sorted(relationship.related_spdx_element_id for relationship in doc.relationships) == sorted(
+        f"SPDXRef-File-{index}" for index in range(number_of_files)
+    )
+    # comparing each implied relationship to all relationships built before would need about 500000 comparisons
+    assert len(comparisons) <= number_of_files
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+
+import pytest
+
+from spdx.parser.json import json_parser
+from spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx.parser.parse_anything import parse_file
+from spdx.parser.parsing_functions import get_skipped_sections
+from spdx.writer.write_anything import write_file
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../data/formats")
+
+
+def example_file_path(file_name, tmp_path):
+    if file_name.endswith((".yaml", ".xml")) and not file_name.endswith(".rdf.xml"):
+        # there are no YAML and XML examples, so they are created from the JSON example
+        file_path = str(tmp_path / file_name)
+        write_file(parse_file(os.path.join(DATA_DIR, "SPDXJSONExample-v2.3.spdx.json")), file_path, validate=False)
+        return file_path
+    return os.path.join(DATA_DIR, file_name)
+
+
+def test_get_skipped_sections():
+    assert get_skipped_sections(None) == []
+    assert get_skipped_sections({"relationships", "creation_info", "packages"}) == [
+        "files",
+        "snippets",
+        "annotations",
+        "extracted_licensing_info",
+    ]
+    with pytest.raises(ValueError, match="package"):
+        get_skipped_sections(["package"])
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "SPDXJSONExample-v2.3.spdx.json",
+        "SPDXRdfExample-v2.3.spdx.rdf.xml",
+        "SPDXTagExample-v2.3.spdx",
+        "SPDXExample-v2.3.spdx.yaml",
+        "SPDXExample-v2.3.spdx.xml",
+    ],
+)
+def test_parse_only_included_sections(file_name, tmp_path):
+    file_path = example_file_path(file_name, tmp_path)
+    document = parse_file(file_path)
+
+    projected_document = parse_file(file_path, include={"packages", "relationships"})
+
+    assert projected_document.skipped_sections == ["files", "snippets", "annotations", "extracted_licensing_info"]
+    assert projected_document.creation_info == document.creation_info
+    assert projected_document.packages == document.packages
+    assert projected_document.relationships == document.relationships
+    assert not projected_document.files and not projected_document.snippets and not projected_document.annotations
+    assert not projected_document.extracted_licensing_info
+    assert document.skipped_sections == []
+
+
+def test_skipped_sections_are_not_validated():
+    with open(os.path.join(DATA_DIR, "SPDXJSONExample-v2.3.spdx.json")) as file:
+        input_doc_dict = json.load(file)
+    input_doc_dict["files"][0]["checksums"] = None
+    input_doc_dict["snippets"][0]["ranges"] = "invalid"
+
+    document = JsonLikeDictParser(include=["packages"]).parse(input_doc_dict)
+
+    assert len(document.packages) == 4
+    assert document.skipped_sections == [
+        "files",
+        "snippets",
+        "annotations",
+        "relationships",
+        "extracted_licensing_info",
+    ]
+
+
+def test_parse_json_streaming_with_included_sections():
+    file_path = os.path.join(DATA_DIR, "SPDXJSONExample-v2.3.spdx.json")
+
+    document = json_parser.parse_from_file(file_path, streaming=True, include={"files", "annotations"})
+
+    assert document == json_parser.parse_from_file(file_path, include={"files", "annotations"})
+    assert len(document.files) == 5 and len(document.annotations) == 5
+
+
+def test_tag_value_relationships_implied_by_skipped_elements():
+    file_path = os.path.join(DATA_DIR, "SPDXTagExample-v2.3.spdx")
+
+    document = parse_file(file_path, include={"relationships"})
+
+    assert document.relationships == parse_file(file_path).relationships
+    assert not document.packages and not document.files
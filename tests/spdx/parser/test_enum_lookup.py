@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from spdx.casing_tools import camel_case_to_snake_case
+from spdx.model.checksum import ChecksumAlgorithm
+from spdx.model.relationship import RelationshipType
+from spdx.parser.enum_lookup import ENUM_VALUE_LOOKUP, LOOKUP_ENUM_CLASSES, RDF_ENUM_VALUE_LOOKUP
+from spdx.parser.jsonlikedict.dict_parsing_functions import json_str_to_enum, json_str_to_enum_name
+from spdx.parser.rdf.checksum_parser import convert_rdf_to_algorithm
+from spdx.parser.rdf.graph_parsing_functions import parse_enum_value
+
+
+@pytest.mark.parametrize("enum_class", LOOKUP_ENUM_CLASSES)
+def test_enum_value_lookup_matches_string_conversion(enum_class):
+    for json_str, member in ENUM_VALUE_LOOKUP[enum_class].items():
+        assert enum_class[json_str_to_enum_name(json_str)] == member
+
+
+@pytest.mark.parametrize(
+    "enum_class", [enum_class for enum_class in LOOKUP_ENUM_CLASSES if enum_class is not ChecksumAlgorithm]
+)
+def test_rdf_enum_value_lookup_matches_string_conversion(enum_class):
+    assert len(RDF_ENUM_VALUE_LOOKUP[enum_class]) == len(enum_class)
+    for rdf_str, member in RDF_ENUM_VALUE_LOOKUP[enum_class].items():
+        assert enum_class[camel_case_to_snake_case(rdf_str).upper()] == member
+
+
+@pytest.mark.parametrize(
+    "rdf_str,expected",
+    [
+        ("sha256", ChecksumAlgorithm.SHA256),
+        ("blake2b256", ChecksumAlgorithm.BLAKE2B_256),
+        ("BLAKE2B384", ChecksumAlgorithm.BLAKE2B_384),
+    ],
+)
+def test_convert_rdf_to_algorithm(rdf_str, expected):
+    assert convert_rdf_to_algorithm(rdf_str) == expected
+
+
+@pytest.mark.parametrize(
+    "json_str,expected",
+    [
+        ("DESCRIBES", RelationshipType.DESCRIBES),
+        ("describes", RelationshipType.DESCRIBES),
+        ("DEPENDENCY-OF", RelationshipType.DEPENDENCY_OF),
+        ("BLAKE2b-256", ChecksumAlgorithm.BLAKE2B_256),
+    ],
+)
+def test_json_str_to_enum(json_str, expected):
+    assert json_str_to_enum(json_str, type(expected)) == expected
+
+
+def test_json_str_to_enum_raises_key_error():
+    with pytest.raises(KeyError):
+        json_str_to_enum("NOT_A_RELATIONSHIP", RelationshipType)
+
+
+def test_parse_enum_value_with_lookup_and_fallback():
+    prefix = "http://spdx.org/rdf/terms#relationshipType_"
+
+    assert parse_enum_value(prefix + "dependencyOf", RelationshipType, prefix) == RelationshipType.DEPENDENCY_OF
+    assert parse_enum_value(prefix + "DependencyOf", RelationshipType, prefix) == RelationshipType.DEPENDENCY_OF
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+import re
+
+import pytest
+
+from spdx.parser.error import SPDXParsingError
+from spdx.parser.json import json_parser
+from spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx.parser.logger import Logger
+from spdx.parser.parse_anything import parse_file
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../data/formats")
+
+# patterns that match the relationship types of the examples
+RELATIONSHIP_TYPE_PATTERNS = {
+    "SPDXJSONExample-v2.3.spdx.json": r'("relationshipType" : ")\w+',
+    "SPDXRdfExample-v2.3.spdx.rdf.xml": r"(relationshipType_)\w+",
+    "SPDXTagExample-v2.3.spdx": r"(?m)(^Relationship: \S+ )\w+",
+}
+
+
+def write_example_with_invalid_relationship_types(file_name, tmp_path) -> str:
+    with open(os.path.join(DATA_DIR, file_name)) as file:
+        content = file.read()
+    file_path = str(tmp_path / file_name)
+    with open(file_path, "w") as file:
+        file.write(re.sub(RELATIONSHIP_TYPE_PATTERNS[file_name], r"\1invalid", content))
+    return file_path
+
+
+def get_parsing_errors(parse_function, *args, **kwargs):
+    with pytest.raises(SPDXParsingError) as err:
+        parse_function(*args, **kwargs)
+    return err.value.get_messages()
+
+
+def test_logger_discards_messages_beyond_max_errors():
+    logger = Logger(max_errors=3)
+
+    logger.append("first")
+    assert not logger.has_reached_max_errors()
+    logger.extend(["second", "third", "fourth"])
+    logger.append("fifth")
+
+    assert logger.get_messages() == ["first", "second", "third"]
+    assert logger.has_reached_max_errors()
+    assert not Logger().has_reached_max_errors()
+
+
+@pytest.mark.parametrize("max_errors", [0, -1])
+@pytest.mark.parametrize("file_name", RELATIONSHIP_TYPE_PATTERNS.keys())
+def test_parse_file_rejects_max_errors_below_one(file_name, max_errors):
+    with pytest.raises(ValueError, match=f"max_errors must be at least 1, not {max_errors}"):
+        parse_file(os.path.join(DATA_DIR, file_name), max_errors=max_errors)
+
+
+@pytest.mark.parametrize("file_name", RELATIONSHIP_TYPE_PATTERNS.keys())
+def test_parse_file_stops_at_max_errors(file_name, tmp_path):
+    file_path = write_example_with_invalid_relationship_types(file_name, tmp_path)
+    all_messages = get_parsing_errors(parse_file, file_path)
+    assert len(all_messages) > 2
+
+    assert get_parsing_errors(parse_file, file_path, max_errors=2) == all_messages[:2]
+    assert get_parsing_errors(parse_file, file_path, fail_fast=True) == all_messages[:1]
+
+
+def test_streaming_json_parser_stops_at_max_errors(tmp_path):
+    file_path = write_example_with_invalid_relationship_types("SPDXJSONExample-v2.3.spdx.json", tmp_path)
+    all_messages = get_parsing_errors(parse_file, file_path)
+
+    messages = get_parsing_errors(json_parser.parse_from_file, file_path, streaming=True, max_errors=2)
+
+    assert messages == all_messages[:2]
+
+
+def test_parallel_parsing_stops_at_max_errors():
+    input_doc_dict = {
+        "files": [
+            {
+                "SPDXID": f"SPDXRef-File{index}",
+                "fileName": f"./file{index}",
+                "checksums": [{"algorithm": f"INVALID{index}", "checksumValue": "0"}],
+            }
+            for index in range(10)
+        ],
+    }
+    all_messages = get_parsing_errors(JsonLikeDictParser().parse, input_doc_dict)
+    assert len(all_messages) == 11
+
+    messages = get_parsing_errors(JsonLikeDictParser(workers=2, chunk_size=3, max_errors=4).parse, input_doc_dict)
+
+    assert messages == all_messages[:4]
+
+
+def test_max_errors_is_not_reached_by_valid_documents():
+    with open(os.path.join(DATA_DIR, "SPDXJSONExample-v2.3.spdx.json")) as file:
+        input_doc_dict = json.load(file)
+
+    document = JsonLikeDictParser(max_errors=1).parse(input_doc_dict)
+
+    assert len(document.relationships) == 13
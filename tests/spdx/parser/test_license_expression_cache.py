@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+from license_expression import ExpressionError, Licensing, get_spdx_licensing
+
+from spdx.parser.license_expression_cache import (
+    clear_license_expression_caches,
+    get_license_expression_cache_info,
+    parse_license_expression,
+    parse_spdx_license_expression,
+)
+from spdx.parser.parse_anything import parse_file
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_license_expression_caches()
+    yield
+    clear_license_expression_caches()
+
+
+def test_repeated_expressions_are_shared():
+    license_expression = parse_license_expression("MIT AND apache-2.0")
+
+    assert license_expression == Licensing().parse("MIT AND apache-2.0")
+    assert parse_license_expression("MIT AND apache-2.0") is license_expression
+    cache_info = get_license_expression_cache_info()["license_expressions"]
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 1, 1)
+
+
+def test_spdx_expressions_use_spdx_symbols():
+    license_expression = parse_spdx_license_expression("mit AND apache-2.0")
+
+    assert license_expression == get_spdx_licensing().parse("mit AND apache-2.0")
+    assert str(license_expression) == "MIT AND Apache-2.0"
+    assert parse_spdx_license_expression("mit AND apache-2.0") is license_expression
+    assert get_license_expression_cache_info()["spdx_license_expressions"].hits == 1
+    assert get_license_expression_cache_info()["license_expressions"].misses == 0
+
+
+@pytest.mark.parametrize("expression", ["MIT AND (", 5, ["MIT"]])
+def test_invalid_expressions_raise_expression_error(expression):
+    with pytest.raises(ExpressionError):
+        parse_license_expression(expression)
+    with pytest.raises(ExpressionError):
+        parse_spdx_license_expression(expression)
+
+
+@pytest.mark.parametrize(
+    "file_name, cache_name",
+    [
+        ("SPDXJSONExample-v2.3.spdx.json", "license_expressions"),
+        ("SPDXRdfExample-v2.3.spdx.rdf.xml", "spdx_license_expressions"),
+        ("SPDXTagExample-v2.3.spdx", "spdx_license_expressions"),
+    ],
+)
+def test_parsers_use_cache(file_name, cache_name):
+    path = os.path.join(os.path.dirname(__file__), "../data/formats", file_name)
+
+    parse_file(path)
+    misses = get_license_expression_cache_info()[cache_name].misses
+    parse_file(path)
+
+    cache_info = get_license_expression_cache_info()[cache_name]
+    assert misses > 0
+    assert cache_info.misses == misses
+    assert cache_info.hits >= misses
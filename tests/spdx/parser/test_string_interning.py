@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+
+from spdx.parser.json import json_parser
+from spdx.parser.parse_anything import parse_file
+from spdx.parser.parsing_functions import intern_string, string_interning
+from spdx.parser.tagvalue import tagvalue_parser
+
+
+def test_intern_string():
+    value = "".join(["SPDXRef-", "File"])
+    equal_value = "".join(["SPDXRef-", "File"])
+    assert value is not equal_value
+
+    assert intern_string(value) is value
+    with string_interning():
+        assert intern_string(value) is value
+        assert intern_string(equal_value) is value
+        assert intern_string(None) is None
+    assert intern_string(equal_value) is equal_value
+
+
+def test_nested_string_interning_uses_outer_table():
+    value = "".join(["SPDXRef-", "File"])
+    equal_value = "".join(["SPDXRef-", "File"])
+
+    with string_interning():
+        intern_string(value)
+        with string_interning():
+            assert intern_string(equal_value) is value
+
+    with string_interning(enabled=False):
+        with string_interning():
+            intern_string(value)
+            assert intern_string(equal_value) is equal_value
+
+
+def test_string_interning_with_given_table():
+    value = "".join(["SPDXRef-", "File"])
+    equal_value = "".join(["SPDXRef-", "File"])
+    table = {}
+
+    with string_interning(table=table):
+        intern_string(value)
+    with string_interning(table=table):
+        assert intern_string(equal_value) is value
+    with string_interning(enabled=False, table=table):
+        assert intern_string(equal_value) is equal_value
+
+
+def assert_spdx_ids_are_interned(document):
+    spdx_ids = {element.spdx_id: element.spdx_id for element in document.packages + document.files}
+    referencing_ids = [relationship.spdx_element_id for relationship in document.relationships]
+    referencing_ids += [relationship.related_spdx_element_id for relationship in document.relationships]
+    referencing_ids += [snippet.file_spdx_id for snippet in document.snippets]
+    referenced_element_ids = [spdx_id for spdx_id in referencing_ids if spdx_id in spdx_ids]
+
+    assert referenced_element_ids
+    for spdx_id in referenced_element_ids:
+        assert spdx_id is spdx_ids[spdx_id]
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["SPDXJSONExample-v2.3.spdx.json", "SPDXTagExample-v2.3.spdx", "SPDXRdfExample-v2.3.spdx.rdf.xml"],
+)
+def test_parsed_spdx_ids_are_interned(file_name):
+    document = parse_file(os.path.join(os.path.dirname(__file__), "../data/formats", file_name))
+
+    assert_spdx_ids_are_interned(document)
+
+
+@pytest.mark.parametrize(
+    "parse_from_file,file_name",
+    [
+        (json_parser.parse_from_file, "SPDXJSONExample-v2.3.spdx.json"),
+        (tagvalue_parser.parse_from_file, "SPDXTagExample-v2.3.spdx"),
+    ],
+)
+def test_streamed_spdx_ids_are_interned(monkeypatch, parse_from_file, file_name):
+    # parse the tag-value example in as many segments as possible
+    monkeypatch.setattr("spdx.parser.tagvalue.parser.MIN_SEGMENT_LENGTH", 0)
+    document = parse_from_file(os.path.join(os.path.dirname(__file__), "../data/formats", file_name), streaming=True)
+
+    assert_spdx_ids_are_interned(document)
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["SPDXJSONExample-v2.3.spdx.json", "SPDXTagExample-v2.3.spdx", "SPDXRdfExample-v2.3.spdx.rdf.xml"],
+)
+def test_actors_are_not_shared_between_documents(file_name):
+    path = os.path.join(os.path.dirname(__file__), "../data/formats", file_name)
+    document = parse_file(path)
+    other_document = parse_file(path)
+
+    document.creation_info.creators[0].name = "Changed creator"
+
+    assert other_document.creation_info.creators[0].name != "Changed creator"
+    assert other_document == parse_file(path)
@@ -6,8 +6,9 @@ from unittest import TestCase
 import pytest
 
 from spdx.model.actor import ActorType
-from spdx.parser.actor_parser import ActorParser
+from spdx.parser.actor_parser import ActorParser, _parse_actor_values
 from spdx.parser.error import SPDXParsingError
+from spdx.parser.parsing_functions import string_interning
 
 
 @pytest.mark.parametrize(
@@ -52,3 +53,50 @@ def test_parse_invalid_actor(actor_string, expected_message):
         actor_parser.parse_actor(actor_string)
 
     TestCase().assertCountEqual(err.value.get_messages(), expected_message)
+
+
+def test_identical_actors_are_interned():
+    with string_interning():
+        actor = ActorParser.parse_actor("Organization: Example organization (organization@example.com)")
+
+        assert ActorParser.parse_actor("Organization:Example organization (organization@example.com)") is actor
+        assert ActorParser.parse_actor("Organization: Example organization") is not actor
+
+        actor.name = "Changed organization"
+        interned_actor = ActorParser.parse_actor("Organization: Example organization (organization@example.com)")
+
+        assert interned_actor is not actor
+        assert interned_actor.name == "Example organization"
+
+
+def test_actors_are_only_interned_within_a_parse():
+    with string_interning():
+        actor = ActorParser.parse_actor("Tool: Example tool")
+    with string_interning():
+        assert ActorParser.parse_actor("Tool: Example tool") is not actor
+    with string_interning(enabled=False):
+        assert ActorParser.parse_actor("Tool: Example tool") is not ActorParser.parse_actor("Tool: Example tool")
+    assert ActorParser.parse_actor("Tool: Example tool") is not ActorParser.parse_actor("Tool: Example tool")
+
+
+def test_actor_values_are_cached_per_string():
+    _parse_actor_values.cache_clear()
+
+    first_actor = ActorParser.parse_actor("Tool: Example tool")
+    second_actor = ActorParser.parse_actor("Tool: Example tool")
+
+    assert second_actor == first_actor
+    assert _parse_actor_values.cache_info().hits == 1
+
+    with pytest.raises(SPDXParsingError):
+        ActorParser.parse_actor("Person: ")
+    with pytest.raises(SPDXParsingError):
+        ActorParser.parse_actor("Person: ")
+    assert _parse_actor_values.cache_info().currsize == 1
+
+
+def test_parse_actor_of_wrong_type():
+    with pytest.raises(SPDXParsingError) as err:
+        ActorParser.parse_actor(5)
+
+    TestCase().assertCountEqual(err.value.get_messages(), ["Type for actor must be str not int"])
@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -30,3 +30,32 @@ def test_datetime_from_str():
 def test_datetime_from_str_error(invalid_date_str, error_type, expected_message):
     with pytest.raises(error_type, match=expected_message):
         datetime_from_str(invalid_date_str)
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        ("2010-03-04T05:45:11Z", datetime(2010, 3, 4, 5, 45, 11)),
+        ("2010-3-4T5:45:11Z", datetime(2010, 3, 4, 5, 45, 11)),
+        ("0999-12-31T23:59:59Z", datetime(999, 12, 31, 23, 59, 59)),
+    ],
+)
+def test_datetime_from_str_fast_and_fallback_path(date_str, expected):
+    assert datetime_from_str(date_str) == expected
+
+
+@pytest.mark.parametrize(
+    "invalid_date_str",
+    ["2010-02-30T05:45:11Z", "2010-02-03T05:45:1xZ", "2010-02-03 05:45:11Z", "2010-02-03T05:45:11+"],
+)
+def test_datetime_from_str_error_for_almost_valid_strings(invalid_date_str):
+    with pytest.raises(ValueError):
+        datetime_from_str(invalid_date_str)
+
+
+def test_datetime_to_iso_string_of_aware_datetimes():
+    first_date = datetime(2022, 12, 13, 12, 0, 0, tzinfo=timezone.utc)
+    second_date = datetime(2022, 12, 13, 13, 0, 0, tzinfo=timezone(timedelta(hours=1)))
+
+    assert datetime_to_iso_string(first_date) == "2022-12-13T12:00:00+00:00Z"
+    assert datetime_to_iso_string(second_date) == "2022-12-13T13:00:00+01:00Z"
@@ -5,7 +5,13 @@ from unittest import TestCase
 
 import pytest
 
-from spdx.document_utils import get_contained_spdx_element_ids, get_contained_spdx_elements, get_element_from_spdx_id
+from common.typing.dataclass_with_properties import TypeCheckingPolicy, type_checking_policy
+from spdx.document_utils import (
+    check_document_types,
+    get_contained_spdx_element_ids,
+    get_contained_spdx_elements,
+    get_element_from_spdx_id,
+)
 from tests.spdx.fixtures import document_fixture, file_fixture, package_fixture, snippet_fixture
 
 
@@ -34,3 +40,19 @@ def test_get_contained_spdx_elements(variables):
     assert contained_elements[package.spdx_id] == package
     assert contained_elements[file.spdx_id] == file
     assert contained_elements[snippet.spdx_id] == snippet
+
+
+def test_check_document_types(variables):
+    document, _, _, _ = variables
+    assert check_document_types(document) == []
+
+    with type_checking_policy(TypeCheckingPolicy.OFF):
+        document.files[0].spdx_id = 42
+        document.packages[0].checksums[0].value = None
+        document.creation_info.creators.append("creator")
+
+    assert check_document_types(document) == [
+        "type of document.creation_info.creators[1] must be spdx.model.actor.Actor; got str instead",
+        "type of document.packages[0].checksums[0].value must be str; got NoneType instead",
+        "type of document.files[0].spdx_id must be str; got int instead",
+    ]
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+
+import pytest
+
+from spdx import json_backend
+from spdx.json_backend import (
+    BinaryJsonBackend,
+    JsonBackend,
+    OrjsonBackend,
+    SimdjsonBackend,
+    UjsonBackend,
+    get_available_json_backends,
+    get_json_backend,
+    set_json_backend,
+)
+from spdx.parser.json import json_parser
+from spdx.writer.json import json_writer
+
+DOCUMENT = {
+    "name": "document ü/ä \x7f 😀",
+    "packages": [{"SPDXID": "SPDXRef-Package", "files": [], "checksums": [{"value": "abc"}], "size": 1.5}],
+    "comment": None,
+    "valid": True,
+}
+
+
+def available_backends():
+    return [
+        pytest.param(backend(), marks=pytest.mark.skipif(not backend.is_available(), reason=f"{backend.name} missing"))
+        for backend in [JsonBackend, OrjsonBackend, UjsonBackend, SimdjsonBackend]
+    ]
+
+
+@pytest.fixture
+def restore_backend():
+    backend = get_json_backend()
+    yield
+    json_backend._json_backend = backend
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_loads_str_and_bytes(backend):
+    serialized = json.dumps(DOCUMENT)
+
+    assert backend.loads(serialized) == DOCUMENT
+    assert backend.loads(serialized.encode("utf-8")) == DOCUMENT
+
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("indent", [None, 0, 2, 4])
+def test_dumps_honors_indent(backend, indent):
+    serialized = backend.dumps(DOCUMENT, indent=indent)
+
+    assert isinstance(serialized, str)
+    assert json.loads(serialized) == DOCUMENT
+    assert serialized == JsonBackend().dumps(DOCUMENT, indent=indent)
+    assert '"document \\u00fc/\\u00e4 \\u007f \\ud83d\\ude00"' in serialized
+
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("indent", [None, 4])
+def test_dumps_without_ascii_escapes(backend, indent):
+    serialized = backend.dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+
+    assert json.loads(serialized) == DOCUMENT
+    assert serialized == JsonBackend().dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+    assert '"document ü/ä \x7f 😀"' in serialized
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_values_beyond_the_limits_of_fast_backends(backend):
+    big_number = 2**70
+
+    assert backend.loads(json.dumps({"size": big_number})) == {"size": big_number}
+    assert json.loads(backend.dumps({"size": big_number}, indent=4)) == {"size": big_number}
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_invalid_json_raises_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads('{"name": ')
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_read_and_write_file(backend, tmp_path):
+    file_name = str(tmp_path / "document.json")
+
+    backend.write_file(DOCUMENT, file_name, indent=4)
+
+    assert backend.read_file(file_name) == DOCUMENT
+    with open(file_name, "rb") as file:
+        assert file.read() == json.dumps(DOCUMENT, indent=4).encode("ascii")
+
+    backend.write_file(DOCUMENT, file_name, indent=4, ensure_ascii=False)
+
+    with open(file_name, "rb") as file:
+        assert file.read() == json.dumps(DOCUMENT, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+def test_binary_json_backend_is_abstract():
+    with pytest.raises(TypeError):
+        BinaryJsonBackend()
+
+
+def test_fastest_available_backend_is_default():
+    assert get_json_backend().name == get_available_json_backends()[0]
+    assert get_available_json_backends()[-1] == "json"
+
+
+def test_set_json_backend(restore_backend):
+    set_json_backend("json")
+    assert type(get_json_backend()) is JsonBackend
+
+    with pytest.raises(ValueError):
+        set_json_backend("yaml")
+
+
+def test_set_missing_json_backend(restore_backend, monkeypatch):
+    monkeypatch.setattr(json_backend, "ujson", None)
+
+    with pytest.raises(ImportError, match="pip install ujson"):
+        set_json_backend("ujson")
+
+
+@pytest.mark.parametrize("backend_name", get_available_json_backends())
+def test_round_trip_with_every_backend(backend_name, restore_backend, tmp_path):
+    set_json_backend(backend_name)
+    file_name = os.path.join(os.path.dirname(__file__), "data/formats/SPDXJSONExample-v2.3.spdx.json")
+    document = json_parser.parse_from_file(file_name)
+    output_file_name = str(tmp_path / "document.spdx.json")
+
+    json_writer.write_document(document, output_file_name, validate=False)
+
+    assert json_parser.parse_from_file(output_file_name) == document
+
+
+def test_every_backend_writes_the_same_bytes(restore_backend, tmp_path):
+    file_name = os.path.join(os.path.dirname(__file__), "data/formats/SPDXJSONExample-v2.3.spdx.json")
+    document = json_parser.parse_from_file(file_name)
+    written_files = {}
+
+    for backend_name in get_available_json_backends():
+        set_json_backend(backend_name)
+        output_file_name = str(tmp_path / f"{backend_name}.spdx.json")
+        json_writer.write_document(document, output_file_name, validate=False)
+        with open(output_file_name, "rb") as file:
+            written_files[backend_name] = file.read()
+
+    assert len(set(written_files.values())) == 1
+
+
+def test_write_document_without_ascii_escapes(tmp_path):
+    file_name = os.path.join(os.path.dirname(__file__), "data/formats/SPDXJSONExample-v2.3.spdx.json")
+    document = json_parser.parse_from_file(file_name)
+    document.creation_info.name = "dokument ü"
+    output_file_name = str(tmp_path / "document.spdx.json")
+
+    json_writer.write_document(document, output_file_name, validate=False)
+    with open(output_file_name, "rb") as file:
+        assert b'"dokument \\u00fc"' in file.read()
+
+    json_writer.write_document(document, output_file_name, validate=False, ensure_ascii=False)
+    with open(output_file_name, "rb") as file:
+        assert '"dokument ü"'.encode("utf-8") in file.read()
+    assert json_parser.parse_from_file(output_file_name) == document
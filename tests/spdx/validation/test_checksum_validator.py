@@ -6,7 +6,7 @@ from typing import List
 
 import pytest
 
-from spdx.model.checksum import Checksum, ChecksumAlgorithm
+from spdx.model.checksum import BinaryChecksum, Checksum, ChecksumAlgorithm
 from spdx.validation.checksum_validator import validate_checksum
 from spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 from tests.spdx.fixtures import checksum_fixture
@@ -230,3 +230,18 @@ def test_v2_3only_checksums(checksum):
     expected = ValidationMessage(f"{checksum.algorithm.name} is not supported in SPDX-2.2", context)
 
     assert validation_messages == [expected]
+
+
+def test_binary_checksum():
+    parent_id = "parent_id"
+    checksum = BinaryChecksum.from_hex(
+        ChecksumAlgorithm.SHA3_256, "1e772489c042f49aeaae32b00fc5ef170a25afa741cffaafadde597d4d1727ce"
+    )
+
+    assert validate_checksum(checksum, parent_id, "SPDX-2.3") == []
+    assert validate_checksum(checksum, parent_id, "SPDX-2.2") == [
+        ValidationMessage(
+            "SHA3_256 is not supported in SPDX-2.2",
+            ValidationContext(parent_id=parent_id, element_type=SpdxElementType.CHECKSUM, full_element=checksum),
+        )
+    ]